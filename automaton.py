@@ -0,0 +1,115 @@
+"""
+Aho-Corasick automaton finding many patterns in one left to right scan.
+
+The patterns are compiled into a trie whose failure links are folded into a
+complete transition table, so scanning a text costs one dict lookup per
+character, whatever the number of patterns, and overlapping matches (the
+"one" inside "twone") are all seen. Every state keeps the patterns that end
+there, including the ones reached through its failure links.
+
+Patterns are (pattern, value) pairs. When two matches start at the same
+index, the pattern given first wins. Compiling is much slower than
+scanning, so get_automaton keeps the automatons of recent pattern tuples.
+"""
+
+import functools
+from collections import deque
+
+
+class Automaton:
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        goto = [{}]
+        outputs = [[]]
+        for order, (pattern, _) in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("patterns can not be empty")
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto[state][char] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = goto[state][char]
+            outputs[state].append(order)
+        self.outputs = outputs
+        self.transitions = self.get_transitions(goto)
+        # at one end index, the longest pattern starts first, the shortest last
+        self.longest = [self.get_match(orders, max) for orders in outputs]
+        self.shortest = [self.get_match(orders, min) for orders in outputs]
+
+    def get_transitions(self, goto):
+        """
+        Breadth-first over the trie, so the failure state of a state, which
+        is shallower, is done before it. A state moves like its failure
+        state on the characters it has no trie edge for.
+        """
+        transitions = [dict(goto[0])] + [None] * (len(goto) - 1)
+        fail = [0] * len(goto)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                if state:
+                    fail[child] = transitions[fail[state]].get(char, 0)
+                transitions[child] = {**transitions[fail[child]], **goto[child]}
+                self.outputs[child].extend(self.outputs[fail[child]])
+                queue.append(child)
+        return transitions
+
+    def get_match(self, orders, choose):
+        """
+        Returns the (length, order, value) of the pattern ending at a state
+        that choose picks by length, the first given one among equal lengths.
+        """
+        if not orders:
+            return None
+        length = choose(len(self.patterns[order][0]) for order in orders)
+        order = min(order for order in orders if len(self.patterns[order][0]) == length)
+        return length, order, self.patterns[order][1]
+
+    def iter_matches(self, text):
+        """
+        Yields (start index, pattern, value) of every match, overlapping ones
+        included, by end index.
+        """
+        transitions = self.transitions
+        state = 0
+        for end, char in enumerate(text, 1):
+            state = transitions[state].get(char, 0)
+            for order in self.outputs[state]:
+                pattern, value = self.patterns[order]
+                yield end - len(pattern), pattern, value
+
+    def find_first_last(self, text):
+        """
+        Returns the values of the first and the last match of the text, as
+        ordered by start index, (None, None) when nothing matches.
+        """
+        transitions = self.transitions
+        longest = self.longest
+        shortest = self.shortest
+        state = 0
+        first = last = first_key = last_key = None
+        for end, char in enumerate(text, 1):
+            state = transitions[state].get(char, 0)
+            match = longest[state]
+            if match is None:
+                continue
+            length, order, value = match
+            key = (end - length, order)
+            if first_key is None or key < first_key:
+                first_key, first = key, value
+            length, order, value = shortest[state]
+            key = (end - length, -order)
+            if last_key is None or key > last_key:
+                last_key, last = key, value
+        return first, last
+
+
+@functools.lru_cache(maxsize=16)
+def get_automaton(patterns):
+    """
+    Returns the compiled Automaton of a tuple of (pattern, value) pairs.
+    """
+    return Automaton(patterns)
@@ -0,0 +1,111 @@
+"""
+Runs one day over many input files and streams the answers as JSON lines.
+
+Workers import the day's modules once when they start and then solve file
+after file, so interpreter startup and imports are paid once per worker
+instead of once per input.
+
+Usage (from the repository root):
+    python batch.py 14 inputs/day14/                # every file in a directory
+    python batch.py day07 "inputs/**/*.txt" --workers 8 --output answers.jsonl
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from cache import CACHE_DIRECTORY, ResultCache
+from days import DAY_MAP, get_days
+from runner import run_day
+
+
+def init_batch_worker(day_name):
+    # warm the worker up before the first file arrives
+    for part in DAY_MAP[day_name].parts:
+        part.get_module(day_name)
+
+
+def get_input_files(path):
+    """
+    Returns the files of a directory or matching a glob pattern, sorted.
+    """
+    if os.path.isdir(path):
+        paths = [os.path.join(path, name) for name in os.listdir(path)]
+    else:
+        paths = glob.glob(path, recursive=True)
+    return sorted(os.path.abspath(path) for path in paths if os.path.isfile(path))
+
+
+def solve_file(day_name, file_path, cache=None):
+    result = run_day(day_name, file_path, cache)
+    return {
+        "file": file_path,
+        "day": day_name,
+        "answers": [answer for answer, _ in result["parts"]],
+        "parse": result["parse"],
+        "seconds": [seconds for _, seconds in result["parts"]],
+        "error": result["error"],
+    }
+
+
+class Batch:
+    def __init__(self, day, file_paths, workers=None, cache=None, chunk_size=8):
+        self.day = day
+        self.file_paths = file_paths
+        self.workers = workers
+        self.cache = cache
+        self.chunk_size = chunk_size
+
+    def run(self):
+        """
+        Yields one result per file in file order, as soon as it is solved.
+        """
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_batch_worker,
+            initargs=(self.day.name,),
+        ) as executor:
+            yield from executor.map(
+                solve_file,
+                [self.day.name] * len(self.file_paths),
+                self.file_paths,
+                [self.cache] * len(self.file_paths),
+                chunksize=self.chunk_size,
+            )
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("day", help="day to run, e.g. 7 or day07")
+    parser.add_argument("path", help="directory or glob pattern of input files")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=8)
+    parser.add_argument("--output", help="JSON lines file, stdout by default")
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse and store answers on disk"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    day = get_days([arguments.day])[0]
+    cache = ResultCache(CACHE_DIRECTORY) if arguments.cache else None
+    batch = Batch(
+        day,
+        get_input_files(arguments.path),
+        arguments.workers,
+        cache,
+        arguments.chunk_size,
+    )
+    output = open(arguments.output, "w") if arguments.output else sys.stdout
+    try:
+        for result in batch.run():
+            output.write(json.dumps(result, default=str) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
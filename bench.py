@@ -0,0 +1,245 @@
+"""
+Benchmark regression suite for the registered days.
+
+Times the setup method and every solving method of each day's App on the
+checked-in inputs, stores median, spread and peak memory in a JSON baseline
+and fails when a method got slower than the allowed tolerance, when a part
+raises or when there is no baseline to compare against.
+
+Usage (from the repository root):
+    python bench.py --save            # write the baseline
+    python bench.py                   # compare against the baseline
+    python bench.py 22                # slow parts only run when named
+    python bench.py 12 16 --repeat 9 --tolerance 0.1
+    python bench.py --input day14/generated_2000.txt
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from days import ROOT, get_days
+
+BASELINE_PATH = os.path.join(ROOT, "bench_baseline.json")
+TEST_INPUT_FILE = "test_input.txt"
+
+
+class Measurement:
+    def __init__(self, name, durations, peak_memory):
+        self.name = name
+        self.durations = durations
+        self.peak_memory = peak_memory
+
+    def to_dict(self):
+        return {
+            "median": statistics.median(self.durations),
+            "stdev": statistics.stdev(self.durations) if len(self.durations) > 1 else 0,
+            "min": min(self.durations),
+            "max": max(self.durations),
+            "runs": len(self.durations),
+            "peak_memory": self.peak_memory,
+        }
+
+
+class Benchmark:
+    def __init__(self, days, input_files=None, repeat=5, slow=False):
+        self.days = days
+        self.input_files = input_files
+        self.repeat = repeat
+        self.slow = slow
+
+    def get_input_files(self, day):
+        """
+        Returns input file names inside the day directory to benchmark.
+        """
+        if self.input_files:
+            return [
+                os.path.relpath(os.path.join(ROOT, path), os.path.join(ROOT, day.name))
+                for path in self.input_files
+                if os.path.normpath(path).split(os.sep)[0] == day.name
+            ]
+        input_files = [day.input_file]
+        if os.path.exists(day.get_input_path(TEST_INPUT_FILE)):
+            input_files.append(TEST_INPUT_FILE)
+        return input_files
+
+    def run_once(self, part, day_name, file_path):
+        """
+        Builds, sets up and solves a part on a fresh App. Returns setup and
+        solve durations.
+        """
+        app = part.build(part.get_module(day_name), file_path)
+        start = time.perf_counter()
+        getattr(app, part.setup)()
+        setup_duration = time.perf_counter() - start
+        start = time.perf_counter()
+        part.solve(app)
+        return setup_duration, time.perf_counter() - start
+
+    def trace_once(self, part, day_name, file_path):
+        """
+        Same as run_once but returns the peak traced memory of setup and solve.
+        Kept apart from timed runs since tracing slows allocations down.
+        """
+        app = part.build(part.get_module(day_name), file_path)
+        tracemalloc.start()
+        try:
+            getattr(app, part.setup)()
+            setup_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+            part.solve(app)
+            solve_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return setup_peak, solve_peak
+
+    def measure_part(self, part, day_name, file_path):
+        setup_durations = []
+        solve_durations = []
+        for _ in range(self.repeat):
+            setup_duration, solve_duration = self.run_once(part, day_name, file_path)
+            setup_durations.append(setup_duration)
+            solve_durations.append(solve_duration)
+        setup_peak, solve_peak = self.trace_once(part, day_name, file_path)
+        return (
+            Measurement(f"{part.module}.App.{part.setup}", setup_durations, setup_peak),
+            Measurement(part.name, solve_durations, solve_peak),
+        )
+
+    def run(self):
+        results = {}
+        for day in self.days:
+            for input_file in self.get_input_files(day):
+                file_path = day.get_input_path(input_file)
+                for number, part in enumerate(day.parts, 1):
+                    if part.slow and not self.slow:
+                        continue
+                    # parts may call the same method on differently built apps
+                    prefix = f"{day.name}/{input_file}:part{number}:"
+                    try:
+                        with open(os.devnull, "w") as devnull:
+                            with contextlib.redirect_stdout(devnull):
+                                measurements = self.measure_part(
+                                    part, day.name, file_path
+                                )
+                    except Exception as e:
+                        results[prefix + part.name] = {
+                            "error": f"{type(e).__name__}: {e}"
+                        }
+                        continue
+                    for measurement in measurements:
+                        results[prefix + measurement.name] = measurement.to_dict()
+                    print(f"{prefix}{part.name}", file=sys.stderr)
+        return results
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def get_regressions(results, baseline, tolerance, min_delta):
+    """
+    Returns (key, description) for every part that raised and every method
+    whose median got slower than tolerance allows. Differences below
+    min_delta seconds are treated as noise.
+    """
+    regressions = []
+    for key, result in results.items():
+        if "error" in result:
+            regressions.append((key, result["error"]))
+            continue
+        previous = baseline.get(key)
+        if not previous or "median" not in previous:
+            continue
+        limit = previous["median"] * (1 + tolerance)
+        if result["median"] > limit and (
+            result["median"] - previous["median"] > min_delta
+        ):
+            regressions.append(
+                (key, f"{previous['median']:.4f} s -> {result['median']:.4f} s")
+            )
+    return regressions
+
+
+def print_results(results, baseline):
+    for key, result in sorted(results.items()):
+        if "error" in result:
+            print(f"{key}  {result['error']}")
+            continue
+        line = (
+            f"{key}  median {result['median']:.4f} s"
+            f"  stdev {result['stdev']:.4f} s"
+            f"  peak {result['peak_memory'] / 1024:.0f} KiB"
+        )
+        previous = baseline.get(key, {})
+        if "median" in previous and previous["median"]:
+            change = result["median"] / previous["median"] - 1
+            line += f"  ({change:+.1%})"
+        print(line)
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("days", nargs="*", help="days to benchmark, e.g. 7 or day07")
+    parser.add_argument(
+        "--input",
+        action="append",
+        help="input path relative to the root, e.g. day14/test_input.txt",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--min-delta", type=float, default=0.005, help="seconds ignored as noise"
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--save", action="store_true", help="update the baseline with these results"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    benchmark = Benchmark(
+        get_days(arguments.days),
+        arguments.input,
+        arguments.repeat,
+        slow=bool(arguments.days),
+    )
+    results = benchmark.run()
+    baseline = {}
+    if os.path.exists(arguments.baseline):
+        baseline = load_baseline(arguments.baseline)
+    print_results(results, baseline)
+    errors = [key for key, result in results.items() if "error" in result]
+    if arguments.save:
+        # a crashed part keeps its previous baseline
+        measured = {key: result for key, result in results.items() if key not in errors}
+        save_baseline(arguments.baseline, {**baseline, **measured})
+        for key in errors:
+            print(f"REGRESSION {key}: {results[key]['error']}")
+        sys.exit(1 if errors else 0)
+    if not baseline:
+        print(
+            f"NO BASELINE at {arguments.baseline}, nothing to compare against."
+            " Run python bench.py --save first.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    regressions = get_regressions(
+        results, baseline, arguments.tolerance, arguments.min_delta
+    )
+    for key, description in regressions:
+        print(f"REGRESSION {key}: {description}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,173 @@
+"""
+Content-addressed on-disk cache of solver answers.
+
+An entry is keyed on the source of the solving module (and of the shared root
+modules it uses), the registry entry of the part and the bytes of the input
+file, so editing a solver or its input simply misses the old entries. Every
+entry keeps the answer and the time it took to compute. Entries are evicted
+least recently used first once the cache grows over its size limit.
+
+Usage (from the repository root):
+    python runner.py --cache          # read and fill the cache
+    python cache.py                   # show cache entries and size
+    python cache.py --clear
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+
+from days import ROOT
+
+CACHE_DIRECTORY = os.path.join(ROOT, ".cache", "results")
+MAX_SIZE = 16 * 1024 * 1024
+REGISTRY_PATH = os.path.join(ROOT, "days.py")
+
+
+def get_file_hash(file_path):
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def is_repository_file(path):
+    return path is not None and os.path.abspath(path).startswith(ROOT + os.sep)
+
+
+def get_source_files(module):
+    """
+    Returns the module file and every repository module it uses, directly
+    (e.g. grid.py) or through the modules it uses (e.g. sidecar.py through
+    checkpoint.py), so editing any of them misses the cached answers.
+    """
+    files = set()
+    modules = [module]
+    while modules:
+        current = modules.pop()
+        path = current.__file__
+        if path in files:
+            continue
+        files.add(path)
+        for value in vars(current).values():
+            source = inspect.getmodule(value)
+            if is_repository_file(getattr(source, "__file__", None)):
+                modules.append(source)
+    return sorted(files)
+
+
+class ResultCache:
+    def __init__(self, directory=CACHE_DIRECTORY, max_size=MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.source_hashes = {}
+        self.input_hashes = {}
+
+    def get_source_hash(self, module):
+        if module.__name__ not in self.source_hashes:
+            digest = hashlib.sha256()
+            for path in [REGISTRY_PATH] + get_source_files(module):
+                digest.update(get_file_hash(path).encode())
+            self.source_hashes[module.__name__] = digest.hexdigest()
+        return self.source_hashes[module.__name__]
+
+    def get_input_hash(self, file_path):
+        if file_path not in self.input_hashes:
+            self.input_hashes[file_path] = get_file_hash(file_path)
+        return self.input_hashes[file_path]
+
+    def get_key(self, day_name, number, part, file_path):
+        module = part.get_module(day_name)
+        digest = hashlib.sha256()
+        for item in (
+            day_name,
+            str(number),
+            part.name,
+            self.get_source_hash(module),
+            self.get_input_hash(file_path),
+        ):
+            digest.update(item.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """
+        Returns the cached (answer, seconds) of a key or None on a miss.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # the modification time is the last use, which drives eviction
+        os.utime(path)
+        return entry["answer"], entry["seconds"]
+
+    def put(self, key, answer, seconds):
+        try:
+            content = json.dumps({"answer": answer, "seconds": seconds})
+        except TypeError:
+            # answers that do not survive a JSON round trip are not cached
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(key)
+        # write and rename, so parallel workers never read half an entry
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            f.write(content)
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def get_entries(self):
+        """
+        Returns (last use, size, path) of every entry, least recently used first.
+        """
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.get_entries()
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def clear(self):
+        for _, _, path in self.get_entries():
+            os.remove(path)
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--directory", default=CACHE_DIRECTORY)
+    parser.add_argument("--clear", action="store_true", help="remove every entry")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    cache = ResultCache(arguments.directory)
+    if arguments.clear:
+        cache.clear()
+    entries = cache.get_entries()
+    size = sum(entry[1] for entry in entries)
+    print(f"{len(entries)} entries, {size / 1024:.1f} KiB in {cache.directory}")
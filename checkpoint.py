@@ -0,0 +1,99 @@
+"""
+Checkpoints of long-running solvers, so that a stopped run can resume.
+
+A solver that loops for a long time (day22 part 2 drops the whole stack
+once per load-bearing brick) hands its progress to Checkpoint.update on
+every iteration, as a function returning the state to resume from: the
+next index, the running total and whatever the loop has changed so far.
+The function is only called, and the state pickled, once every interval
+seconds. A later run on the same input loads the last saved state and goes
+on from there, so it gives the same answer as a run that was never
+stopped. The checkpoint is removed once the solver has its answer.
+
+Checkpoints live next to the input, as <input>.<name>.checkpoint, and are
+only used when the day's own version of its state and the sha256 digest of
+the input match. They are off by default. Set AOC_CHECKPOINTS=1, or pass
+--checkpoints to runner.py, to save and resume them. AOC_CHECKPOINT_INTERVAL
+sets the seconds between saves, 60 by default.
+"""
+
+import os
+import pickle
+import time
+
+from sidecar import get_input_digest
+
+ENVIRONMENT_VARIABLE = "AOC_CHECKPOINTS"
+INTERVAL_VARIABLE = "AOC_CHECKPOINT_INTERVAL"
+SUFFIX = ".checkpoint"
+INTERVAL = 60.0
+
+
+def is_enabled():
+    return os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+def get_interval():
+    return float(os.environ.get(INTERVAL_VARIABLE) or INTERVAL)
+
+
+def get_checkpoint_path(file_path, name):
+    return f"{file_path}.{name}{SUFFIX}"
+
+
+class Checkpoint:
+    """
+    Saved progress of one solver on one input. When checkpoints are not
+    enabled every method does nothing and load returns None, so solvers use
+    it the same way either way.
+    """
+
+    def __init__(self, file_path, name, version, interval=None):
+        self.path = get_checkpoint_path(file_path, name)
+        self.file_path = file_path
+        self.version = version
+        self.enabled = is_enabled()
+        self.interval = get_interval() if interval is None else interval
+        self.digest = get_input_digest(file_path) if self.enabled else None
+        self.saved_at = time.monotonic()
+
+    def load(self):
+        """
+        Returns the last saved state, None when there is none or it was
+        saved by another version or for another input.
+        """
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                version, digest, state = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+        if (version, digest) != (self.version, self.digest):
+            return None
+        return state
+
+    def save(self, state):
+        if not self.enabled:
+            return
+        # write and rename, a run stopped while saving keeps the last state
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as f:
+            pickle.dump((self.version, self.digest, state), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self.path)
+        self.saved_at = time.monotonic()
+
+    def update(self, get_state):
+        """
+        Saves get_state() if the last save is at least interval seconds old.
+        """
+        if self.enabled and time.monotonic() - self.saved_at >= self.interval:
+            self.save(get_state())
+
+    def clear(self):
+        if not self.enabled:
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,120 @@
+"""
+Struct-of-arrays tables for the days with many small records.
+
+A Table keeps every field of its records in its own typed array (int32
+coordinates, int64 bids, ...) instead of one Python object with an attribute
+dict per record. Bulk operations read the columns directly. Indexing a table
+returns a row view, a small object holding only the table and the row index,
+whose attributes read and write the columns, so code written for the old
+per-record classes keeps working on top of the table.
+
+Row views compare equal when they point at the same row of the same table,
+so they can be put in sets and looked up with list.index. Reordering a table
+(sort, reorder) moves the rows under the existing views.
+"""
+
+from array import array
+
+
+def column_property(name):
+    """
+    Attribute of a row view reading and writing one column of its table.
+    """
+
+    def get(self):
+        return self.table.data[name][self.index]
+
+    def set(self, value):
+        self.table.data[name][self.index] = value
+
+    return property(get, set)
+
+
+class Row:
+    """
+    Base of the row views. Subclasses declare __slots__ = ("table", "index"),
+    so that they can also inherit from a record class with slots of its own.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Row)
+            and self.table is other.table
+            and self.index == other.index
+        )
+
+    def __hash__(self):
+        return hash((id(self.table), self.index))
+
+
+class Table:
+    """
+    Subclasses set columns to (name, typecode) pairs and row_class to the
+    view class, which is called as row_class(table, index).
+    """
+
+    columns = ()
+    row_class = None
+
+    def __init__(self, rows=()):
+        self.data = {name: array(typecode) for name, typecode in self.columns}
+        self.extend(rows)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} rows)"
+
+    def __len__(self):
+        return len(self.data[self.columns[0][0]])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row_class(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("table index out of range")
+        return self.row_class(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.row_class(self, index)
+
+    def column(self, name):
+        return self.data[name]
+
+    def append(self, values):
+        """
+        Adds a row given as one value per column, in column order.
+        """
+        for (name, _), value in zip(self.columns, values, strict=True):
+            self.data[name].append(value)
+
+    def extend(self, rows):
+        for values in rows:
+            self.append(values)
+
+    def get_row(self, index):
+        return tuple(self.data[name][index] for name, _ in self.columns)
+
+    def reorder(self, order):
+        """
+        Rearranges the rows so that row i is the old row order[i].
+        """
+        for name, typecode in self.columns:
+            column = self.data[name]
+            self.data[name] = array(typecode, [column[i] for i in order])
+
+    def sort(self, key):
+        """
+        Stable sort of the rows, key is called with a row index.
+        """
+        self.reorder(sorted(range(len(self)), key=key))
+
+    def get_nbytes(self):
+        return sum(column.itemsize * len(column) for column in self.data.values())
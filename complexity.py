@@ -0,0 +1,138 @@
+"""
+Empirical complexity report for the registered days.
+
+Generates inputs of growing sizes, measures setup and every solving method on
+them and fits the log-log slope of runtime and peak memory against the size.
+A slope close to 1 means linear behaviour, 2 quadratic, 3 cubic.
+
+Usage (from the repository root):
+    python complexity.py                          # every day, default sizes
+    python complexity.py 11 24 --sizes 100 200 400 800
+"""
+
+import argparse
+import contextlib
+import math
+import os
+import statistics
+import tempfile
+
+from bench import Benchmark
+from days import get_days
+from generators import GENERATORS, write_input
+
+DEFAULT_SIZES = [25, 50, 100, 200]
+SIZES = {
+    "day01": [1000, 4000, 16000, 64000],
+    "day02": [1000, 4000, 16000, 64000],
+    "day04": [1000, 4000, 16000, 64000],
+    "day07": [1000, 4000, 16000, 64000],
+    "day08": [500, 1000, 2000, 4000],
+    "day09": [1000, 4000, 16000, 64000],
+    "day12": [250, 500, 1000, 2000],
+    "day15": [1000, 4000, 16000, 64000],
+    "day18": [1000, 4000, 16000, 64000],
+    "day24": [100, 200, 400, 800],
+}
+# day20 part 2 and day22 part 2 can run for hours on generated inputs
+SKIPPED_PARTS = {"day20": {2}, "day22": {2}}
+
+
+def get_slope(sizes, values):
+    """
+    Least squares slope of log(value) against log(size).
+    """
+    points = [(size, value) for size, value in zip(sizes, values) if value > 0]
+    if len(points) < 2:
+        return None
+    x = [math.log(size) for size, _ in points]
+    y = [math.log(value) for _, value in points]
+    return statistics.linear_regression(x, y).slope
+
+
+class ComplexityReport:
+    def __init__(self, days, sizes=None, repeat=3, seed=0):
+        self.days = [day for day in days if day.name in GENERATORS]
+        self.sizes = sizes
+        self.repeat = repeat
+        self.seed = seed
+        self.benchmark = Benchmark(days=[], repeat=repeat)
+
+    def get_sizes(self, day):
+        return self.sizes or SIZES.get(day.name, DEFAULT_SIZES)
+
+    def measure_day(self, day, directory):
+        """
+        Returns {method name: [(size, median, peak memory), ...]}.
+        A method stops being measured at the first size it fails on.
+        """
+        measurements = {}
+        failed = set()
+        skipped = SKIPPED_PARTS.get(day.name, set())
+        for size in self.get_sizes(day):
+            file_path = os.path.join(directory, f"{day.name}_{size}.txt")
+            write_input(day.name, size, file_path, self.seed)
+            for number, part in enumerate(day.parts, 1):
+                name = f"part{number}:{part.name}"
+                if number in skipped or name in failed:
+                    continue
+                try:
+                    with open(os.devnull, "w") as devnull:
+                        with contextlib.redirect_stdout(devnull):
+                            setup, solve = self.benchmark.measure_part(
+                                part, day.name, file_path
+                            )
+                except Exception as e:
+                    failed.add(name)
+                    print(f"{day.name} {name} failed at size {size}: {e!r}")
+                    continue
+                for key, measurement in (
+                    (f"part{number}:{setup.name}", setup),
+                    (name, solve),
+                ):
+                    measurements.setdefault(key, []).append(
+                        (
+                            size,
+                            statistics.median(measurement.durations),
+                            measurement.peak_memory,
+                        )
+                    )
+        return measurements
+
+    def run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for day in self.days:
+                measurements = self.measure_day(day, directory)
+                for name, points in measurements.items():
+                    self.print_row(day.name, name, points)
+
+    def print_row(self, day_name, name, points):
+        sizes = [point[0] for point in points]
+        time_slope = get_slope(sizes, [point[1] for point in points])
+        memory_slope = get_slope(sizes, [point[2] for point in points])
+        timings = "  ".join(f"{size}: {median:.4f}s" for size, median, _ in points)
+        print(
+            f"{day_name} {name}  time ~ n^{self.format_slope(time_slope)}"
+            f"  memory ~ n^{self.format_slope(memory_slope)}  [{timings}]"
+        )
+
+    @staticmethod
+    def format_slope(slope):
+        return "?" if slope is None else f"{slope:.2f}"
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("days", nargs="*", help="days to measure, e.g. 7 or day07")
+    parser.add_argument("--sizes", type=int, nargs="+", help="input sizes to generate")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    report = ComplexityReport(
+        get_days(arguments.days), arguments.sizes, arguments.repeat, arguments.seed
+    )
+    report.run()
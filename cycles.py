@@ -0,0 +1,135 @@
+"""
+Cycle detection for simulations that end up repeating themselves.
+
+A simulation is given as an iterable of (fingerprint, value) pairs, one per
+step, where the fingerprint is a compact summary of the state before the
+step (a digest of the rock positions, a bitmask of module states, ...) and
+the value is whatever the caller needs from that step. Brent's algorithm
+finds the cycle length comparing fingerprints only, the recorded values then
+answer any step number, however far, without simulating again.
+"""
+
+import functools
+import hashlib
+
+
+def get_digest(data):
+    """
+    16 byte fingerprint of a bytes-like state, e.g. Grid.cells.
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def add_values(a, b):
+    if isinstance(a, tuple):
+        return tuple(x + y for x, y in zip(a, b))
+    return a + b
+
+
+def scale_value(value, factor):
+    if isinstance(value, tuple):
+        return tuple(x * factor for x in value)
+    return value * factor
+
+
+class Cycle:
+    """
+    Values of the first start + length steps, the following steps repeat the
+    last length of them forever. A length of 0 means no state repeated before
+    the simulation ended, so only the recorded steps are known.
+    """
+
+    def __init__(self, start, length, values):
+        self.start = start
+        self.length = length
+        self.values = values[: start + length]
+
+    def __repr__(self):
+        return f"Cycle(start={self.start}, length={self.length})"
+
+    def get_index(self, step):
+        if step < self.start:
+            return step
+        if not self.length:
+            raise ValueError(f"step {step} is past the end of the simulation")
+        return self.start + (step - self.start) % self.length
+
+    def get(self, step):
+        return self.values[self.get_index(step)]
+
+    def get_total(self, count):
+        """
+        Sum of the values of the first count steps. Tuples are summed
+        component wise.
+        """
+        if count <= self.start + self.length:
+            return self.sum(self.values[:count])
+        if not self.length:
+            raise ValueError(f"{count} steps are past the end of the simulation")
+        full_cycles, remainder = divmod(count - self.start, self.length)
+        cycle_total = self.sum(self.values[self.start :])
+        total = scale_value(cycle_total, full_cycles)
+        for value in self.values[: self.start + remainder]:
+            total = add_values(total, value)
+        return total
+
+    @staticmethod
+    def sum(values):
+        return functools.reduce(add_values, values)
+
+
+class CycleFinder:
+    """
+    Brent's algorithm fed one (fingerprint, value) pair at a time, for
+    simulations that are driven by their caller and may be checkpointed
+    between steps (the finder pickles with its recorded steps).
+    """
+
+    def __init__(self):
+        self.fingerprints = []
+        self.values = []
+        self.power = 1
+        self.length = 1
+        self.tortoise = 0
+        self.found = False
+
+    def add(self, fingerprint, value):
+        """
+        Records the next step. Returns True once the cycle is found.
+        """
+        self.fingerprints.append(fingerprint)
+        self.values.append(value)
+        hare = len(self.fingerprints) - 1
+        if hare == 0:
+            return False
+        if self.fingerprints[self.tortoise] == fingerprint:
+            self.found = True
+            return True
+        if self.power == self.length:
+            self.tortoise = hare
+            self.power *= 2
+            self.length = 0
+        self.length += 1
+        return False
+
+    def get_cycle(self):
+        if not self.found:
+            return Cycle(len(self.values), 0, self.values)
+        # the states are recorded, so the start is found without simulating again
+        fingerprints, length = self.fingerprints, self.length
+        start = 0
+        while fingerprints[start] != fingerprints[start + length]:
+            start += 1
+        return Cycle(start, length, self.values)
+
+
+def find_cycle(steps):
+    """
+    Brent's algorithm over (fingerprint, value) pairs. Returns a Cycle,
+    stopping as soon as the cycle is found or when steps end.
+    """
+    finder = CycleFinder()
+    for fingerprint, value in steps:
+        if finder.add(fingerprint, value):
+            break
+    return finder.get_cycle()
@@ -0,0 +1,233 @@
+"""
+Long-running local solver server with warm state.
+
+The server imports every registered day once and keeps, per day and input
+content, the set up Apps and the answers already given. Memos kept on an App
+therefore stay warm between requests, like the day04 card counts, while the
+day12 arrangement memo is cleared for every record. stats reports the memo
+counters. Parts that mutate their App (day20) get a copy of the set up App,
+so the parsed and compiled state is still reused.
+
+Requests and responses are JSON lines, several per connection:
+    {"day": "12", "input": "day12/input.txt", "parts": [1, 2]}
+    {"command": "stats"}
+    {"command": "shutdown"}
+
+Usage (from the repository root):
+    python daemon.py serve                      # Unix socket in .cache/
+    python daemon.py serve --port 8023          # localhost TCP instead
+    python daemon.py query 12 day12/input.txt
+"""
+
+import argparse
+import contextlib
+import copy
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+
+from cache import get_file_hash
+from days import DAYS, ROOT, get_days
+from memo import get_memos
+from runner import setup_app
+
+SOCKET_PATH = os.path.join(ROOT, ".cache", "daemon.sock")
+MAX_INPUTS = 32
+
+
+class Solver:
+    def __init__(self, max_inputs=MAX_INPUTS):
+        self.max_inputs = max_inputs
+        # (day name, input hash) -> {"apps": {...}, "answers": {...}}
+        self.states = OrderedDict()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.warm_answers = 0
+
+    def warm_up(self):
+        for day in DAYS:
+            for part in day.parts:
+                part.get_module(day.name)
+
+    def get_state(self, day_name, file_path):
+        """
+        Returns the warm state of an input, evicting the least recently used
+        input once more than max_inputs are kept.
+        """
+        key = (day_name, get_file_hash(file_path))
+        state = self.states.pop(key, None)
+        if state is None:
+            state = {"apps": {}, "answers": {}}
+        self.states[key] = state
+        while len(self.states) > self.max_inputs:
+            self.states.popitem(last=False)
+        return state
+
+    def get_app(self, state, part, day_name, file_path):
+        key = part.app_key
+        app = state["apps"].get(key)
+        if app is None:
+            app = setup_app(part, day_name, file_path)
+            state["apps"][key] = app
+        # the kept App must stay as set up for the next request
+        return copy.deepcopy(app) if part.fresh else app
+
+    def solve(self, day_name, file_path, numbers=None):
+        day = get_days([day_name])[0]
+        response = {"day": day.name, "input": file_path, "parts": []}
+        with self.lock:
+            self.requests += 1
+            state = self.get_state(day.name, file_path)
+            with open(os.devnull, "w") as devnull:
+                with contextlib.redirect_stdout(devnull):
+                    for number, part in enumerate(day.parts, 1):
+                        if numbers and number not in numbers:
+                            continue
+                        warm = number in state["answers"]
+                        start = time.perf_counter()
+                        if warm:
+                            self.warm_answers += 1
+                        else:
+                            app = self.get_app(state, part, day.name, file_path)
+                            state["answers"][number] = part.solve(app)
+                        response["parts"].append(
+                            {
+                                "part": number,
+                                "answer": state["answers"][number],
+                                "seconds": time.perf_counter() - start,
+                                "warm": warm,
+                            }
+                        )
+        return response
+
+    def get_stats(self):
+        return {
+            "requests": self.requests,
+            "warm_answers": self.warm_answers,
+            "inputs": [f"{day}:{digest[:12]}" for day, digest in self.states],
+            "memos": self.get_memo_stats(),
+        }
+
+    def get_memo_stats(self):
+        """
+        Returns {input: {method: memo counters}} of the kept Apps.
+        """
+        stats = {}
+        for (day, digest), state in self.states.items():
+            memos = {}
+            for app in state["apps"].values():
+                for name, memo in get_memos(app).items():
+                    memos[name] = memo.get_stats()
+            if memos:
+                stats[f"{day}:{digest[:12]}"] = memos
+        return stats
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.get_response(line)
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+            if response.get("shutdown"):
+                # shutdown() waits for serve_forever, which runs in another thread
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+    def get_response(self, line):
+        try:
+            request = json.loads(line)
+            command = request.get("command", "solve")
+            if command == "stats":
+                return self.server.solver.get_stats()
+            if command == "shutdown":
+                return {"shutdown": True}
+            file_path = os.path.join(ROOT, request["input"])
+            return self.server.solver.solve(
+                request["day"], file_path, request.get("parts")
+            )
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def create_server(socket_path=SOCKET_PATH, port=None, max_inputs=MAX_INPUTS):
+    if port is not None:
+        server = TCPServer(("127.0.0.1", port), RequestHandler)
+    else:
+        os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixServer(socket_path, RequestHandler)
+    server.solver = Solver(max_inputs)
+    server.solver.warm_up()
+    return server
+
+
+def connect(socket_path=SOCKET_PATH, port=None):
+    if port is not None:
+        return socket.create_connection(("127.0.0.1", port))
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(socket_path)
+    return connection
+
+
+def request(payload, socket_path=SOCKET_PATH, port=None):
+    """
+    Sends one request to a running server and returns its response.
+    """
+    with connect(socket_path, port) as connection:
+        connection.sendall(json.dumps(payload).encode() + b"\n")
+        with connection.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    parser.add_argument("--port", type=int, help="use localhost TCP on this port")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve")
+    serve.add_argument("--max-inputs", type=int, default=MAX_INPUTS)
+    query = commands.add_parser("query")
+    query.add_argument("day", help="day to solve, e.g. 7 or day07")
+    query.add_argument("input", help="input path relative to the root")
+    query.add_argument("--parts", type=int, nargs="+")
+    commands.add_parser("stats")
+    commands.add_parser("shutdown")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    if arguments.command == "serve":
+        server = create_server(arguments.socket, arguments.port, arguments.max_inputs)
+        print(f"listening on {arguments.port or arguments.socket}")
+        try:
+            with server:
+                server.serve_forever()
+        finally:
+            if arguments.port is None and os.path.exists(arguments.socket):
+                os.remove(arguments.socket)
+    elif arguments.command == "query":
+        payload = {"day": arguments.day, "input": arguments.input}
+        if arguments.parts:
+            payload["parts"] = arguments.parts
+        print(json.dumps(request(payload, arguments.socket, arguments.port)))
+    else:
+        payload = {"command": arguments.command}
+        print(json.dumps(request(payload, arguments.socket, arguments.port)))
@@ -1,3 +1,6 @@
+from loader import read_lines
+
+
 class App:
     def __init__(self, file_path):
         self.file_path = file_path
@@ -5,18 +8,15 @@ class App:
 
     def get_lines(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads and returns cleaned lines from file at self.path.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.data.append(line)
+        self.data = self.get_lines()
 
     def get_first_numeric(self, line):
         """
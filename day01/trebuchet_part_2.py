@@ -1,68 +1,50 @@
+from automaton import get_automaton
+from loader import read_lines
+
+WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+def get_digit_map(words=WORDS):
+    """
+    Returns {numeric string: value} of the digits and of the given words
+    for 1 to 9, e.g. ("un", "deux", ...) for french calibration files.
+    """
+    digit_map = {str(num): num for num in range(1, 10)}
+    for num, word in enumerate(words, 1):
+        digit_map[word] = num
+    return digit_map
+
+
 class App:
-    def __init__(self, file_path):
+    def __init__(self, file_path, words=WORDS):
         self.file_path = file_path
         self.data = []
-        self.digit_map = {
-            "1": 1,
-            "2": 2,
-            "3": 3,
-            "4": 4,
-            "5": 5,
-            "6": 6,
-            "7": 7,
-            "8": 8,
-            "9": 9,
-            "one": 1,
-            "two": 2,
-            "three": 3,
-            "four": 4,
-            "five": 5,
-            "six": 6,
-            "seven": 7,
-            "eight": 8,
-            "nine": 9,
-        }
+        self.digit_map = get_digit_map(words)
+        self.automaton = get_automaton(tuple(self.digit_map.items()))
 
     def get_lines(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads and returns cleaned lines from file at self.path.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.data.append(line)
+        self.data = self.get_lines()
 
     def get_first_numeric(self, line):
         """
         Given a string, finds and returns the first numeric string.
         """
-        num = None
-        first_index = len(line)
-        for key, value in self.digit_map.items():
-            index = line.find(key)
-            if -1 < index < first_index:
-                num = value
-                first_index = index
-        return num
+        return self.automaton.find_first_last(line)[0]
 
     def get_last_numeric(self, line):
         """
         Given a string, finds and returns the last numeric string.
         """
-        num = None
-        last_index = -1
-        for key, value in self.digit_map.items():
-            index = line.rfind(key)
-            if last_index < index:
-                num = value
-                last_index = index
-        return num
+        return self.automaton.find_first_last(line)[1]
 
     def get_first_digits(self):
         first_digits = []
@@ -77,9 +59,13 @@ class App:
         return last_digits
 
     def calculate_calibration_values_sum(self):
-        first_digits = self.get_first_digits()
-        last_digits = self.get_last_digits()
-        return sum(first_digits) * 10 + sum(last_digits)
+        # first and last numeric of a line come from the same scan
+        find_first_last = self.automaton.find_first_last
+        total = 0
+        for line in self.data:
+            first, last = find_first_last(line)
+            total += first * 10 + last
+        return total
 
 
 if __name__ == "__main__":
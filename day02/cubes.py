@@ -1,3 +1,6 @@
+from loader import iter_lines, read_lines
+
+
 class CubeDataParser:
     def __init__(self, data):
         self.data = data
@@ -21,14 +24,16 @@ class CubeDataParser:
             sets.append(set)
         return sets
 
-    def parse(self):
-        parsed_data = {}
+    def iter_records(self):
+        """
+        Yields (game id, sets) line by line, data can be any iterable of lines.
+        """
         for line in self.data:
             game, records = line.split(":")
-            game_id = self.get_game_id(game)
-            sets = self.get_sets(records)
-            parsed_data[game_id] = sets
-        return parsed_data
+            yield self.get_game_id(game), self.get_sets(records)
+
+    def parse(self):
+        return dict(self.iter_records())
 
 
 class App:
@@ -41,21 +46,28 @@ class App:
 
     def get_lines(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads and returns cleaned lines from file at self.path.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.data.append(line)
+        self.data = self.get_lines()
         parser = self.parser_class(self.data)
         self.parsed_data = parser.parse()
 
+    def iter_games(self):
+        """
+        Yields (game id, sets), streamed from the file when data is not set up.
+        """
+        if self.parsed_data is not None:
+            yield from self.parsed_data.items()
+            return
+        parser = self.parser_class(iter_lines(self.file_path))
+        yield from parser.iter_records()
+
     def is_valid_set(self, set):
         return (
             set.get("red", 0) <= self.limits["red"]
@@ -71,14 +83,13 @@ class App:
 
     def get_valid_id_list(self):
         valid_id_list = []
-        for id, sets in self.parsed_data.items():
+        for id, sets in self.iter_games():
             if self.is_valid_sets(sets):
                 valid_id_list.append(id)
         return valid_id_list
 
     def calculate_id_sum(self):
-        valid_id_list = self.get_valid_id_list()
-        return sum(valid_id_list)
+        return sum(id for id, sets in self.iter_games() if self.is_valid_sets(sets))
 
     def get_fewest_numbers(self, sets):
         fewest_numbers = {"red": 0, "blue": 0, "green": 0}
@@ -97,14 +108,13 @@ class App:
 
     def get_power_list(self):
         power_list = []
-        for sets in self.parsed_data.values():
+        for _, sets in self.iter_games():
             power = self.get_power(sets)
             power_list.append(power)
         return power_list
 
     def calculate_power_sum(self):
-        power_list = self.get_power_list()
-        return sum(power_list)
+        return sum(self.get_power(sets) for _, sets in self.iter_games())
 
 
 if __name__ == "__main__":
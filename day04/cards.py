@@ -1,17 +1,28 @@
+from loader import InputFile, iter_lines
+from memo import memoize
+
+CARD_MEMO_SIZE = 1024
+
+
 class CardParser:
     def __init__(self, data):
         self.data = data
 
-    def parse(self):
-        parsed_data = {}
+    def iter_records(self):
+        """
+        Yields (card id, (winning numbers, player numbers)) line by line, data
+        can be any iterable of lines.
+        """
         for line in self.data:
-            card, numbers = line.split(":")
-            winning_numbers, player_numbers = numbers.split("|")
-            parsed_data[int(card.split()[1])] = (
+            card, numbers = line.split(b":")
+            winning_numbers, player_numbers = numbers.split(b"|")
+            yield int(card.split()[1]), (
                 winning_numbers.split(),
                 player_numbers.split(),
             )
-        return parsed_data
+
+    def parse(self):
+        return dict(self.iter_records())
 
 
 class App:
@@ -19,25 +30,27 @@ class App:
         self.file_path = file_path
         self.data = []
         self.parser_class = parser_class
-        self.card_winning_cache = {}
-        self.card_sum_cache = {}
+        self.cards = None
 
-    def get_lines(self):
+    def setup_data(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads input and setup data.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        with InputFile(self.file_path) as input_file:
+            # numbers are only compared, so they stay bytes
+            parser = self.parser_class(input_file.iter_lines())
+            self.cards = parser.parse()
 
-    def setup_data(self):
+    def iter_cards(self):
         """
-        Reads input and setup data.
+        Yields the cards, streamed from the file when data is not set up.
         """
-        for line in self.get_lines():
-            self.data.append(line)
-        parser = self.parser_class(self.data)
-        self.cards = parser.parse()
+        if self.cards is not None:
+            yield from self.cards.values()
+            return
+        parser = self.parser_class(iter_lines(self.file_path, decode=False))
+        for _, card in parser.iter_records():
+            yield card
 
     def get_winning_numbers(self, card):
         return [number for number in card[0] if number in card[1]]
@@ -50,35 +63,37 @@ class App:
 
     def get_points(self):
         points = []
-        for card in self.cards.values():
+        for card in self.iter_cards():
             points.append(self.get_card_point(card))
         return points
 
     def calculate_total_points(self):
-        points = self.get_points()
-        return sum(points)
+        return sum(self.get_card_point(card) for card in self.iter_cards())
 
     def get_winning_number_qty(self, card):
         return len(self.get_winning_numbers(card))
 
+    # one entry per card, the input has about 200 cards
+    @memoize(max_size=CARD_MEMO_SIZE)
+    def get_card_winning_qty(self, id):
+        return self.get_winning_number_qty(self.cards[id])
+
+    @memoize(max_size=CARD_MEMO_SIZE)
     def get_card_qty_sum(self, id):
         if id not in self.cards:
             return 0
-        if id in self.card_sum_cache:
-            return self.card_sum_cache[id]
         sum = 1
-        card_numbers = self.cards[id]
-        if id not in self.card_winning_cache:
-            self.card_winning_cache[id] = self.get_winning_number_qty(card_numbers)
-        qty = self.card_winning_cache[id]
+        qty = self.get_card_winning_qty(id)
         for i in range(qty):
             sum += self.get_card_qty_sum(id + i + 1)
-        self.card_sum_cache[id] = sum
         return sum
 
     def calculate_card_qty(self):
         sum = 0
-        for id in self.cards.keys():
+        # from the last card, the copies a card wins are of cards already
+        # counted, so only the most recent memo entries are needed and
+        # evicting older ones costs nothing
+        for id in reversed(self.cards):
             sum += self.get_card_qty_sum(id)
         return sum
 
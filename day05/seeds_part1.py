@@ -1,3 +1,7 @@
+from loader import read_lines
+from scanner import scan_ints
+
+
 class AlmanacParser:
     def __init__(self, lines):
         self.lines = lines
@@ -7,13 +11,13 @@ class AlmanacParser:
         current_key = None
         for line in self.lines:
             if line.startswith("seeds"):
-                parsed_data["seeds"] = [int(val) for val in line.split(":")[1].split()]
+                parsed_data["seeds"] = scan_ints(line)
                 continue
             if "map" in line:
                 current_key = line.split()[0]
                 parsed_data[current_key] = []
             if line and line[0].isnumeric():
-                parsed_data[current_key].append([int(val) for val in line.split()])
+                parsed_data[current_key].append(scan_ints(line))
 
         return parsed_data
 
@@ -26,18 +30,15 @@ class App:
 
     def get_lines(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads and returns cleaned lines from file at self.path.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.lines.append(line)
+        self.lines = self.get_lines()
         parser = self.parser_class(self.lines)
         self.data = parser.parse()
 
@@ -1,3 +1,8 @@
+from intervals import IntervalSet, coalesce, shift
+from loader import read_lines
+from scanner import scan_ints, scan_records
+
+
 class AlmanacParser:
     def __init__(self, lines):
         self.lines = lines
@@ -7,16 +12,13 @@ class AlmanacParser:
         current_key = None
         for line in self.lines:
             if line.startswith("seeds"):
-                values = [int(val) for val in line.split(":")[1].split()]
-                parsed_data["seeds"] = [
-                    values[i : i + 2] for i in range(0, len(values), 2)
-                ]
+                parsed_data["seeds"] = list(scan_records(line, 2))
                 continue
             if "map" in line:
                 current_key = line.split()[0]
                 parsed_data[current_key] = []
             if line and line[0].isnumeric():
-                parsed_data[current_key].append([int(val) for val in line.split()])
+                parsed_data[current_key].append(scan_ints(line))
 
         return parsed_data
 
@@ -29,78 +31,41 @@ class App:
 
     def get_lines(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads and returns cleaned lines from file at self.path.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.lines.append(line)
+        self.lines = self.get_lines()
         parser = self.parser_class(self.lines)
         self.data = parser.parse()
 
-    def get_in_out_ranges(self, line, source_range):
-        in_ranges = []
-        out_ranges = []
-        destination, source, range_value = line
-        line_range = [source, source + range_value - 1]
-        # check if ranges completely discrete
-        if source_range[1] < line_range[0] or source_range[0] > line_range[1]:
-            out_ranges.append(source_range)
-        # check if line_range completely includes source_range
-        if source_range[0] >= line_range[0] and source_range[1] <= line_range[1]:
-            in_ranges.append(source_range)
-        # check left intersect condition
-        if (
-            source_range[0] < line_range[0] <= source_range[1]
-            and line_range[1] > source_range[1]
-        ):
-            in_ranges.append([line_range[0], source_range[1]])
-            out_ranges.append([source_range[0], line_range[0] - 1])
-        # check right intersect condition
-        if (
-            line_range[0] < source_range[0] <= line_range[1]
-            and source_range[1] > line_range[1]
-        ):
-            in_ranges.append([source_range[0], line_range[1]])
-            out_ranges.append([line_range[1] + 1, source_range[1]])
-        # check if source_range completely includes line_range
-        if source_range[0] < line_range[0] and source_range[1] > line_range[1]:
-            in_ranges.append(line_range)
-            out_ranges.append([source_range[0], line_range[0] - 1])
-            out_ranges.append([line_range[1] + 1, source_range[1]])
-        return in_ranges, out_ranges
-
     def calculate_destination_value(self, source_value, line):
         destination, source, range_value = line
         return (source_value - source) + destination
 
     def get_destination_ranges(self, in_ranges, line):
-        destination_ranges = []
-        for in_range in in_ranges:
-            first = self.calculate_destination_value(in_range[0], line)
-            second = self.calculate_destination_value(in_range[1], line)
-            destination_ranges.append([first, second])
-        return destination_ranges
+        destination, source, range_value = line
+        return [shift(in_range, destination - source) for in_range in in_ranges]
 
     def get_destination_value(self, map, source_ranges):
+        """
+        Maps every range through one map stage. Ranges are merged after each
+        stage, so their number does not grow from stage to stage.
+        """
+        out_ranges = IntervalSet(source_ranges)
         destination_ranges = []
-        for source_range in source_ranges:
-            out_ranges_container = [source_range]
-            for line in self.data[map]:
-                mid_out_range_container = []
-                for out_range in out_ranges_container:
-                    in_ranges, out_ranges = self.get_in_out_ranges(line, out_range)
-                    mid_out_range_container += out_ranges
-                    destination_ranges += self.get_destination_ranges(in_ranges, line)
-                out_ranges_container = mid_out_range_container
-            destination_ranges += out_ranges_container
-        return destination_ranges
+        for line in self.data[map]:
+            destination, source, range_value = line
+            line_range = (source, source + range_value - 1)
+            in_ranges = out_ranges.intersect(line_range)
+            if in_ranges:
+                destination_ranges += self.get_destination_ranges(in_ranges, line)
+                out_ranges.subtract(line_range)
+        return coalesce(destination_ranges + out_ranges.intervals)
 
     def get_seed_soil_ranges(self, seed_ranges):
         return self.get_destination_value("seed-to-soil", seed_ranges)
@@ -134,16 +99,12 @@ class App:
         return location_ranges
 
     def get_location_ranges(self):
-        location_ranges = []
-        for seed_value in self.data["seeds"]:
-            seed_ranges = [[seed_value[0], seed_value[0] + seed_value[1] - 1]]
-            location_ranges += self.get_seed_location_ranges(seed_ranges)
-        return location_ranges
+        seed_ranges = [(start, start + qty - 1) for start, qty in self.data["seeds"]]
+        return self.get_seed_location_ranges(seed_ranges)
 
     def find_lowest_location(self):
-        location_ranges = self.get_location_ranges()
-        location_ranges = [item for item in location_ranges if item != [0, -1]]
-        return min([min(location_range) for location_range in location_ranges])
+        # location ranges are coalesced, so sorted by start
+        return self.get_location_ranges()[0][0]
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import math
 
+from utils import debug
+
 
 class App:
     def __init__(self, data):
@@ -28,7 +30,7 @@ class App:
         winning_number_counts = []
         for data in self.data:
             winning_number_counts.append(self.get_winning_number_count(data))
-        print(winning_number_counts)
+        debug(winning_number_counts)
         return math.prod(winning_number_counts)
 
 
@@ -1,4 +1,13 @@
+from array import array
+
+from columns import Row, Table
+from loader import InputFile
+
+CARDS = "23456789TJQKA"
+
+
 class Hand:
+    __slots__ = ("cards",)
     type_coefficient = 1000000  # TODO
     types = {
         "five_of_a_kind": 7,
@@ -69,6 +78,7 @@ class Hand:
 
 
 class JokerHand(Hand):
+    __slots__ = ()
     card_values = {
         "A": 12,
         "K": 11,
@@ -108,52 +118,133 @@ class JokerHand(Hand):
         return self.lineups[card_lineup]
 
 
+def pack_cards(cards):
+    """
+    Five cards in 4 bits each, first card in the highest bits.
+    """
+    code = 0
+    for card in cards:
+        code = code << 4 | CARDS.index(card)
+    return code
+
+
+def unpack_cards(code):
+    return "".join(CARDS[code >> shift & 15] for shift in range(16, -1, -4))
+
+
+class HandRow(Row):
+    """
+    (hand, bid) row of a HandTable, also indexable like the tuples it
+    replaces.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __repr__(self):
+        return f"{self.cards} {self.bid}"
+
+    def __getitem__(self, i):
+        return (self.hand, self.bid)[i]
+
+    @property
+    def cards(self):
+        return unpack_cards(self.table.data["cards"][self.index])
+
+    @property
+    def hand(self):
+        return self.table.hand_class(self.cards)
+
+    @property
+    def bid(self):
+        return self.table.data["bid"][self.index]
+
+    def get_total_value(self):
+        return self.table.data["value"][self.index]
+
+
+class HandTable(Table):
+    """
+    Packed cards, total value and bid of every hand.
+    """
+
+    columns = (("cards", "i"), ("value", "q"), ("bid", "q"))
+    row_class = HandRow
+
+    def __init__(self, hand_class, rows=()):
+        self.hand_class = hand_class
+        super().__init__(rows)
+
+    def add(self, cards, bid):
+        value = self.hand_class(cards).get_total_value()
+        self.append((pack_cards(cards), value, bid))
+
+    def with_hand_class(self, hand_class):
+        """
+        Returns the same hands and bids valued as hand_class hands, without
+        parsing them again.
+        """
+        table = HandTable(hand_class)
+        table.data["cards"] = array("i", self.data["cards"])
+        table.data["bid"] = array("q", self.data["bid"])
+        table.data["value"] = array(
+            "q",
+            [
+                hand_class(unpack_cards(code)).get_total_value()
+                for code in self.data["cards"]
+            ],
+        )
+        return table
+
+    def get_ranking(self):
+        """
+        Returns the row indexes from the weakest to the strongest hand.
+        """
+        return sorted(range(len(self)), key=self.data["value"].__getitem__)
+
+    def get_total_winnings(self):
+        bids = self.data["bid"]
+        return sum(rank * bids[i] for rank, i in enumerate(self.get_ranking(), 1))
+
+
 class App:
     def __init__(self, file_path, hand_class):
         self.file_path = file_path
         self.data = []
-        self.hands = []
         self.hand_class = hand_class
-
-    def get_lines(self):
-        """
-        Reads and yields cleaned lines from file at self.path.
-        """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        self.hands = HandTable(hand_class)
 
     def parse_data(self):
         for data in self.data:
             hand, bid = data.split()
-            self.hands.append((self.hand_class(hand), int(bid)))
+            self.hands.add(hand.decode(), int(bid))
 
     def setup_data(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.data.append(line)
-        self.parse_data()
+        with InputFile(self.file_path) as input_file:
+            self.data = input_file.iter_lines()
+            self.parse_data()
 
     def get_sorted_hands(self):
-        return sorted(self.hands, key=lambda hand: hand[0].get_total_value())
+        return [self.hands[i] for i in self.hands.get_ranking()]
 
-    def calculate_total_winnings(self):
-        sorted_hands = self.get_sorted_hands()
-        total_winnings = 0
-        for i, hand in enumerate(sorted_hands):
-            total_winnings += (i + 1) * hand[1]
-        return total_winnings
+    def calculate_total_winnings(self, jokers=False):
+        """
+        With jokers, the parsed hands are valued as JokerHands whatever
+        hand_class is, so one parse gives both answers.
+        """
+        hands = self.hands
+        if jokers and hands.hand_class is not JokerHand:
+            hands = hands.with_hand_class(JokerHand)
+        return hands.get_total_winnings()
 
 
 if __name__ == "__main__":
     input_file_path = "day07/input.txt"
-    # part 1
     app = App(input_file_path, Hand)
     app.setup_data()
+    # part 1
     print(app.calculate_total_winnings())
     # part 2
-    app = App(input_file_path, JokerHand)
-    app.setup_data()
-    print(app.calculate_total_winnings())
+    print(app.calculate_total_winnings(jokers=True))
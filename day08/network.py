@@ -1,6 +1,13 @@
 import re
 import itertools
 import math
+from array import array
+
+import sidecar
+from loader import read_lines
+
+# version of the compiled network in the sidecar, bump it when it changes
+SIDECAR_VERSION = 1
 
 
 class NetworkParser:
@@ -25,39 +32,87 @@ class App:
 
     def get_lines(self):
         """
-        Reads and yields cleaned lines from file at self.path.
+        Reads and returns cleaned lines from file at self.path.
         """
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
         """
         Reads input and setup data.
         """
-        for line in self.get_lines():
-            self.lines.append(line)
+        if sidecar.is_enabled() and self.load_sidecar():
+            return
+        self.lines = self.get_lines()
         parser = self.parser_class(self.lines)
         parsed_data = parser.parse()
         self.instructions = parsed_data["instructions"]
         self.map = parsed_data["map"]
+        self.compile_network()
+        if sidecar.is_enabled():
+            self.save_sidecar()
 
-    def calculate_steps(self, start, end):
-        directions = itertools.cycle(self.instructions)
+    def compile_network(self):
+        """
+        Gives every node an integer id and stores the network as one
+        successor list per instruction, so walks never hash node names.
+        """
+        self.node_names = list(self.map)
+        self.node_ids = {name: i for i, name in enumerate(self.node_names)}
+        self.successors = (
+            [self.node_ids[self.map[name][0]] for name in self.node_names],
+            [self.node_ids[self.map[name][1]] for name in self.node_names],
+        )
+        self.turns = [0 if direction == "L" else 1 for direction in self.instructions]
+        self.end_nodes = bytearray(name.endswith("Z") for name in self.node_names)
+
+    def save_sidecar(self):
+        sections = {
+            "instructions": self.instructions.encode(),
+            "names": sidecar.encode_names(self.node_names),
+            "left": array("i", self.successors[0]),
+            "right": array("i", self.successors[1]),
+            "turns": bytes(self.turns),
+            "end_nodes": self.end_nodes,
+        }
+        sidecar.save(self.file_path, "network", SIDECAR_VERSION, sections)
+
+    def load_sidecar(self):
+        """
+        Loads the network compiled by an earlier setup.
+        """
+        compiled = sidecar.load(self.file_path, "network", SIDECAR_VERSION)
+        if compiled is None:
+            return False
+        with compiled:
+            self.instructions = bytes(compiled["instructions"]).decode()
+            self.node_names = sidecar.decode_names(compiled["names"])
+            self.successors = (compiled.get_array("left"), compiled.get_array("right"))
+            self.turns = compiled.get_array("turns")
+            self.end_nodes = bytearray(compiled["end_nodes"])
+        self.node_ids = {name: i for i, name in enumerate(self.node_names)}
+        left, right = self.successors
+        self.map = {
+            name: (self.node_names[left[i]], self.node_names[right[i]])
+            for i, name in enumerate(self.node_names)
+        }
+        return True
+
+    def walk(self, node, is_end):
+        """
+        Returns the number of steps from node id until is_end(node id).
+        """
+        turns = itertools.cycle(self.turns)
+        successors = self.successors
         total_steps = 0
-        current_node = start
-        for direction in directions:
-            if current_node == end:
-                break
-            next_node = (
-                self.map[current_node][0]
-                if direction == "L"
-                else self.map[current_node][1]
-            )
+        while not is_end(node):
+            node = successors[next(turns)][node]
             total_steps += 1
-            current_node = next_node
         return total_steps
 
+    def calculate_steps(self, start, end):
+        end = self.node_ids[end]
+        return self.walk(self.node_ids[start], end.__eq__)
+
     def get_starting_nodes(self):
         return [node for node in self.map.keys() if node.endswith("A")]
 
@@ -84,20 +139,7 @@ class App:
         return total_steps
 
     def get_node_cycle(self, node):
-        directions = itertools.cycle(self.instructions)
-        total_steps = 0
-        current_node = node
-        for direction in directions:
-            if current_node.endswith("Z"):
-                break
-            next_node = (
-                self.map[current_node][0]
-                if direction == "L"
-                else self.map[current_node][1]
-            )
-            total_steps += 1
-            current_node = next_node
-        return total_steps
+        return self.walk(self.node_ids[node], self.end_nodes.__getitem__)
 
     def calculate_simultaneous_steps(self):
         starting_nodes = self.get_starting_nodes()
@@ -1,17 +1,31 @@
+from loader import iter_lines
+from scanner import scan_ints
+
+
 class App:
     def __init__(self, file_path):
         self.file_path = file_path
         self.data = []
         self.direction = "forward"
 
-    def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
-
     def setup_data(self):
-        for line in self.get_lines():
-            self.data.append([int(item) for item in line.split()])
+        self.data = list(self.iter_sequences())
+
+    def iter_sequences(self):
+        """
+        Yields the sequences, streamed from the file when data is not set up.
+        """
+        if self.data:
+            yield from self.data
+            return
+        for line in iter_lines(self.file_path, decode=False):
+            yield scan_ints(line)
+
+    def get_prediction(self, sequence):
+        if self.direction == "forward":
+            return self.get_forward_prediction(sequence)
+        elif self.direction == "backward":
+            return self.get_backward_prediction(sequence)
 
     def get_differences(self, sequence):
         differences = []
@@ -33,15 +47,12 @@ class App:
 
     def get_predictions(self):
         predictions = []
-        for sequence in self.data:
-            if self.direction == "forward":
-                predictions.append(self.get_forward_prediction(sequence))
-            elif self.direction == "backward":
-                predictions.append(self.get_backward_prediction(sequence))
+        for sequence in self.iter_sequences():
+            predictions.append(self.get_prediction(sequence))
         return predictions
 
     def get_sum_of_predictions(self):
-        return sum(self.get_predictions())
+        return sum(self.get_prediction(sequence) for sequence in self.iter_sequences())
 
 
 if __name__ == "__main__":
@@ -1,21 +1,6 @@
-class MatrixParser:
-    def __init__(self, lines):
-        self.lines = lines
-        self.matrix = self.setup_matrix()
-
-    def setup_matrix(self):
-        matrix = []
-        for line in self.lines:
-            matrix_line = []
-            for char in line:
-                matrix_line.append(char)
-            matrix.append(matrix_line)
-        return matrix
-
-    @staticmethod
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
+from graph import reachable
+from grid import GridParser
+from loader import read_lines
 
 
 class App:
@@ -35,43 +20,38 @@ class App:
         self.inside_tile_set = set()
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def get_start_point(self):
-        for j, row in enumerate(self.data):
-            for i, char in enumerate(row):
-                if char == "S":
-                    return (j, i)
+        return self.data.position(self.data.find("S"))
 
     def get_char(self, location):
-        return self.data[location[0]][location[1]]
+        return self.data[location[0], location[1]]
 
     def get_start_point_shape(self):
         movement_directions = []
         # check right
-        if self.start_point[1] < len(self.data[0]) - 1:
+        if self.start_point[1] < self.data.width - 1:
             if (0, -1) in self.movement_map[
-                self.data[self.start_point[0]][self.start_point[1] + 1]
+                self.data[self.start_point[0], self.start_point[1] + 1]
             ]:
                 movement_directions.append((0, 1))
         # check left
         if self.start_point[1] > 0:
             if (0, 1) in self.movement_map[
-                self.data[self.start_point[0]][self.start_point[1] - 1]
+                self.data[self.start_point[0], self.start_point[1] - 1]
             ]:
                 movement_directions.append((0, -1))
         # check down
-        if self.start_point[0] < len(self.data) - 1:
+        if self.start_point[0] < self.data.height - 1:
             if (-1, 0) in self.movement_map[
-                self.data[self.start_point[0] + 1][self.start_point[1]]
+                self.data[self.start_point[0] + 1, self.start_point[1]]
             ]:
                 movement_directions.append((1, 0))
         # check up
         if self.start_point[0] > 0:
             if (1, 0) in self.movement_map[
-                self.data[self.start_point[0] - 1][self.start_point[1]]
+                self.data[self.start_point[0] - 1, self.start_point[1]]
             ]:
                 movement_directions.append((-1, 0))
         for char, values in self.movement_map.items():
@@ -79,14 +59,14 @@ class App:
                 return char
 
     def setup_data(self):
-        for line in self.get_lines():
-            self.lines.append(line)
+        self.lines = self.get_lines()
         parser = self.parser_class(self.lines)
-        self.data = parser.matrix
+        self.data = parser.parse()
         self.start_point = self.get_start_point()
         self.start_point_shape = self.get_start_point_shape()
         self.start_loop()
         self.route_set = set(self.route)
+        self.route_indexes = {self.data.index(*tile) for tile in self.route}
         self.set_enclosed_tiles()
 
     def get_inverted_direction(self, direction):
@@ -109,12 +89,11 @@ class App:
     #     this solution leads to a maximum recursion depth error
     #     """
     #     self.route.append(next)
-    #     if self.data[next[0]][next[1]] == "S":
+    #     if self.data[next[0], next[1]] == "S":
     #         return
-    #     char = self.data[next[0]][next[1]]
+    #     char = self.data[next[0], next[1]]
     #     next_direction = self.get_next_direction(direction, char)
     #     next_position = self.get_next_position(next, next_direction)
-    #     # breakpoint()
     #     self.make_a_loop(next_direction, next_position)
 
     # def start_loop(self):
@@ -129,9 +108,9 @@ class App:
         next = self.get_next_position(current, direction)
         while True:
             self.route.append(next)
-            if self.data[next[0]][next[1]] == "S":
+            if self.data[next[0], next[1]] == "S":
                 return
-            char = self.data[next[0]][next[1]]
+            char = self.data[next[0], next[1]]
             next_direction = self.get_next_direction(direction, char)
             next_position = self.get_next_position(next, next_direction)
             direction = next_direction
@@ -142,11 +121,11 @@ class App:
 
     # --------------Part2-----------------------
     def get_starting_tiles(self):
-        for j, row in enumerate(self.data):
-            for i, char in enumerate(row):
-                if (j, i) in self.route_set:
-                    assert char == "F"
-                    return (j + 1, i + 1), (j, i)
+        for index in range(len(self.data.cells)):
+            j, i = self.data.position(index)
+            if (j, i) in self.route_set:
+                assert self.data[j, i] == "F"
+                return (j + 1, i + 1), (j, i)
 
     def get_inside_neighbors(self, current_tile, previous_tile):
         """
@@ -181,52 +160,45 @@ class App:
         if next_tile[1] == tile[1]:
             return self.route.reverse()
 
-    def add_tile_to_insides(self, tile):
-        self.inside_tile_set.add(tile)
-        neighbors = []
-        # check right
-        if tile[1] < len(self.data[0]) - 1:
-            neighbors.append(((tile[0]), tile[1] + 1))
-        # check left
-        if tile[1] > 0:
-            neighbors.append(((tile[0]), tile[1] - 1))
-        # check down
-        if tile[0] < len(self.data) - 1:
-            neighbors.append(((tile[0] + 1), tile[1]))
-        # check up
-        if tile[0] > 0:
-            neighbors.append(((tile[0] - 1), tile[1]))
-        for neighbor in neighbors:
-            if neighbor not in self.route_set and neighbor not in self.inside_tile_set:
-                self.add_tile_to_insides(neighbor)
+    def get_open_neighbors(self, index):
+        for neighbor in self.data.neighbors(index):
+            if neighbor not in self.route_indexes:
+                yield neighbor
+
+    def add_tiles_to_insides(self, tiles):
+        """
+        Flood fills the tiles off the route that can be reached from tiles.
+        """
+        sources = [self.data.index(*tile) for tile in tiles]
+        for index in reachable(sources, self.get_open_neighbors):
+            self.inside_tile_set.add(self.data.position(index))
 
     def set_starting_point_shape(self):
         char = self.get_start_point_shape()
-        self.data[self.start_point[0]][self.start_point[1]] = char
+        self.data[self.start_point[0], self.start_point[1]] = char
 
     def set_enclosed_tiles(self):
         # find a route node close to matrix edges and decide which side is inside
         # loop through the route and check inside neighbors
         # if a neighbor tile is not a route tile, than it is an inside tile
-        # check neighbors of this inside tile if there is are adjacent inside tiles and do this step recursively
+        # flood fill from all those inside tiles at once
         inside_neighbor, route_tile = self.get_starting_tiles()
         self.set_starting_point_shape()
         self.set_route_direction(route_tile)
         current_index = self.route.index(route_tile)
         current_neighbors = [inside_neighbor]
+        inside_tiles = set()
         for _ in range(len(self.route)):
             for neighbor in current_neighbors:
-                if (
-                    neighbor not in self.route_set
-                    and neighbor not in self.inside_tile_set
-                ):
-                    self.add_tile_to_insides(neighbor)
+                if neighbor not in self.route_set:
+                    inside_tiles.add(neighbor)
             next_index = (current_index + 1) % len(self.route)
             current_neighbors = self.get_inside_neighbors(
                 current_tile=self.route[next_index],
                 previous_tile=self.route[current_index],
             )
             current_index = next_index
+        self.add_tiles_to_insides(inside_tiles)
 
     def get_enclosed_tiles_qty(self):
         return len(self.inside_tile_set)
@@ -234,7 +206,7 @@ class App:
 
 if __name__ == "__main__":
     input_file_path = "day10/input.txt"
-    app = App(input_file_path, MatrixParser)
+    app = App(input_file_path, GridParser)
     app.setup_data()
     # part 1
     print(app.calculate_furthest_distance())
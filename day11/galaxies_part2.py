@@ -1,21 +1,5 @@
-class MatrixParser:
-    def __init__(self, lines):
-        self.lines = lines
-        self.matrix = self.setup_matrix()
-
-    def setup_matrix(self):
-        matrix = []
-        for line in self.lines:
-            matrix_line = []
-            for char in line:
-                matrix_line.append(char)
-            matrix.append(matrix_line)
-        return matrix
-
-    @staticmethod
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
+from grid import GridParser
+from loader import read_lines
 
 
 class App:
@@ -26,20 +10,16 @@ class App:
         self.expansion_ratio = expansion_ratio
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
+        lines = self.get_lines()
         parser = self.parser_class(lines)
-        self.universe = parser.setup_matrix()
+        self.universe = parser.parse()
         self.set_galaxies()
         self.expansion_matrix = self.set_expansion_matrix()
         self.apply_expansion()
-        # MatrixParser.print_matrix(self.expansion_matrix)
+        # print_matrix(self.expansion_matrix)
 
     def set_expansion_matrix(self):
         return [[[1, 1] for item in row] for row in self.universe]
@@ -47,15 +27,14 @@ class App:
     def get_empty_rows(self):
         empty_rows = []
         for i, row in enumerate(self.universe):
-            if all([item == "." for item in row]):
+            if not row.tobytes().strip(b"."):
                 empty_rows.append(i)
         return empty_rows
 
     def get_empty_cols(self):
         empty_cols = []
-        for i in range(len(self.universe)):
-            col = [row[i] for row in self.universe]
-            if all(item == "." for item in col):
+        for i in range(self.universe.width):
+            if not self.universe.col(i).tobytes().strip(b"."):
                 empty_cols.append(i)
         return empty_cols
 
@@ -70,10 +49,8 @@ class App:
                 row[col][1] *= self.expansion_ratio
 
     def set_galaxies(self):
-        for j, row in enumerate(self.universe):
-            for i, item in enumerate(row):
-                if item == "#":
-                    self.galaxies.append((j, i))
+        for index in self.universe.find_all("#"):
+            self.galaxies.append(self.universe.position(index))
 
     def get_horizontal_distance(self, galaxy1, galaxy2):
         horizontal_distance = 0
@@ -115,6 +92,6 @@ class App:
 if __name__ == "__main__":
     expansion_ratio = 1000000
     input_file_path = "day11/input.txt"
-    app = App(input_file_path, MatrixParser, expansion_ratio)
+    app = App(input_file_path, GridParser, expansion_ratio)
     app.setup_data()
     print(app.get_total_distance())
@@ -1,5 +1,16 @@
-from functools import cache
-import tracemalloc
+from loader import InputFile, iter_lines
+from memo import clear_memos, memoize
+
+ARRANGEMENT_MEMO_SIZE = 2048
+
+
+def get_suffix_lengths(record):
+    """
+    Memo key of a sub-record. Sub-records are suffixes of the record being
+    counted, so their lengths tell them apart.
+    """
+    springs, sizes = record
+    return len(springs), len(sizes)
 
 
 class SpringParser:
@@ -7,11 +18,17 @@ class SpringParser:
         self.lines = lines
         self.records = []
 
-    def parse(self):
+    def iter_records(self):
+        """
+        Yields (springs, sizes) line by line, lines can be any iterable.
+        """
         for line in self.lines:
             springs, sizes = line.split()
-            sizes = (*[int(num) for num in sizes.split(",")],)
-            self.records.append((springs, sizes))
+            sizes = (*[int(num) for num in sizes.split(b",")],)
+            yield springs.decode(), sizes
+
+    def parse(self):
+        self.records.extend(self.iter_records())
         return self.records
 
 
@@ -20,19 +37,24 @@ class App:
         self.file_path = file_path
         self.lines = []
         self.parser_class = parser_class
-
-    def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        self.records = None
 
     def setup_data(self):
-        for line in self.get_lines():
-            self.lines.append(line)
-        parser = self.parser_class(self.lines)
-        self.records = parser.parse()
+        with InputFile(self.file_path) as input_file:
+            parser = self.parser_class(input_file.iter_lines())
+            self.records = parser.parse()
         self.set_folded_records()
 
+    def iter_records(self):
+        """
+        Yields the records, streamed from the file when data is not set up.
+        """
+        if self.records is not None:
+            yield from self.records
+            return
+        parser = self.parser_class(iter_lines(self.file_path, decode=False))
+        yield from parser.iter_records()
+
     def set_folded_records(self):
         self.folded_records = []
         for record in self.records:
@@ -61,8 +83,15 @@ class App:
                 return False
         return True
 
-    @cache
     def get_arrangement_quantity(self, record):
+        # the memo is keyed on suffix lengths, so it only holds one record
+        clear_memos(self)
+        return self.get_sub_arrangement_quantity(record)
+
+    # at most one entry per springs and sizes suffix pair of the record, the
+    # folded records of the input need up to about 500
+    @memoize(max_size=ARRANGEMENT_MEMO_SIZE, key=get_suffix_lengths)
+    def get_sub_arrangement_quantity(self, record):
         total = 0
         springs, sizes = record
         sizes_len = self.get_sizes_length(sizes)
@@ -75,7 +104,7 @@ class App:
             if self.is_proper(springs, sizes[0], i):
                 if len(sizes) > 1:
                     sub_record = (springs[sizes[0] + i + 1 :], (sizes[1:]))
-                    total += self.get_arrangement_quantity(sub_record)
+                    total += self.get_sub_arrangement_quantity(sub_record)
                 else:
                     if self.has_no_remaining_spring(springs, sizes[0], i):
                         total += 1
@@ -83,7 +112,7 @@ class App:
 
     def get_total_arrangement_quantity(self):
         total = 0
-        for record in self.records:
+        for record in self.iter_records():
             total += self.get_arrangement_quantity(record)
         return total
 
@@ -95,7 +124,6 @@ class App:
 
 
 if __name__ == "__main__":
-    # tracemalloc.start()
     # input_file_path = "day12/test_input.txt"
     input_file_path = "day12/input.txt"
     app = App(input_file_path, SpringParser)
@@ -104,9 +132,3 @@ if __name__ == "__main__":
     print(app.get_total_arrangement_quantity())
     # Part 2
     print(app.get_total_folded_arrangement_quantity())
-
-    # snapshot = tracemalloc.take_snapshot()
-    # top_stats = snapshot.statistics("lineno")
-    # print("[ Top 10 ]")
-    # for stat in top_stats[:10]:
-    #     print(stat)
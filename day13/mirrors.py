@@ -1,3 +1,7 @@
+from grid import Grid
+from loader import read_lines
+
+
 class PatternParser:
     def __init__(self, lines):
         self.lines = lines
@@ -7,18 +11,13 @@ class PatternParser:
         pattern = []
         for line in self.lines:
             if line:
-                pattern.append([*line])
+                pattern.append(line)
             else:
-                self.patterns.append(pattern)
+                self.patterns.append(Grid.from_lines(pattern))
                 pattern = []
-        self.patterns.append(pattern)
+        self.patterns.append(Grid.from_lines(pattern))
         return self.patterns
 
-    @staticmethod
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
-
 
 class App:
     def __init__(self, file_path, parser_class):
@@ -29,13 +28,10 @@ class App:
         self.smugged_mirrors = []
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        for line in self.get_lines():
-            self.lines.append(line)
+        self.lines = self.get_lines()
         parser = self.parser_class(self.lines)
         self.patterns = parser.parse()
         self.set_mirrors()
@@ -46,12 +42,12 @@ class App:
             return True
         distance_to_edge = min(i, len(pattern) - i - 2)
         for j in range(distance_to_edge):
-            if pattern[i - 1 - j] != pattern[i + 2 + j]:
+            if pattern.row(i - 1 - j) != pattern.row(i + 2 + j):
                 return False
         return True
 
     def rotate_pattern_clockwise(self, pattern):
-        return [list(reversed(col)) for col in zip(*pattern)]
+        return pattern.copy().rotate_clockwise()
 
     def get_smudge_score(self, pattern):
         score = self.get_horizontal_qty(pattern) * 100 or self.get_vertical_qty(pattern)
@@ -59,7 +55,7 @@ class App:
 
     def set_horizontal_mirror(self, pattern, is_vertical=False):
         for i in range(len(pattern) - 1):
-            if pattern[i] == pattern[i + 1]:
+            if pattern.row(i) == pattern.row(i + 1):
                 if self.is_mirror(pattern, i):
                     self.mirrors.append(("v" if is_vertical else "h", i))
                     return True
@@ -94,10 +90,12 @@ class App:
             return True
         distance_to_edge = min(i, len(pattern) - i - 2)
         for j in range(distance_to_edge):
-            if pattern[i - 1 - j] != pattern[i + 2 + j]:
+            if pattern.row(i - 1 - j) != pattern.row(i + 2 + j):
                 if smudge:
                     return False
-                elif self.differs_by_one_item(pattern[i - 1 - j], pattern[i + 2 + j]):
+                elif self.differs_by_one_item(
+                    pattern.row(i - 1 - j), pattern.row(i + 2 + j)
+                ):
                     smudge = True
                 else:
                     return False
@@ -108,11 +106,11 @@ class App:
         for i in range(len(pattern) - 1):
             if i == skip_index:
                 continue
-            if pattern[i] == pattern[i + 1]:
+            if pattern.row(i) == pattern.row(i + 1):
                 if self.is_smugged_mirror(pattern, i):
                     self.smugged_mirrors.append(("v" if is_vertical else "h", i))
                     return True
-            elif self.differs_by_one_item(pattern[i], pattern[i + 1]):
+            elif self.differs_by_one_item(pattern.row(i), pattern.row(i + 1)):
                 if self.is_smugged_mirror(pattern, i, has_smudge=True):
                     self.smugged_mirrors.append(("v" if is_vertical else "h", i))
                     return True
@@ -1,24 +1,10 @@
-import copy
+from checkpoint import Checkpoint
+from cycles import CycleFinder, get_digest
+from grid import GridParser
+from loader import read_lines
 
-
-class MatrixParser:
-    def __init__(self, lines):
-        self.lines = lines
-        self.matrix = self.setup_matrix()
-
-    def setup_matrix(self):
-        matrix = []
-        for line in self.lines:
-            matrix_line = []
-            for char in line:
-                matrix_line.append(char)
-            matrix.append(matrix_line)
-        return matrix
-
-    @staticmethod
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
+# version of the get_cycle checkpoint state
+CHECKPOINT_VERSION = 1
 
 
 class App:
@@ -26,51 +12,51 @@ class App:
         self.file_path = file_path
         self.lines = []
         self.parser_class = parser_class
+        self.cycle = None
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        for line in self.get_lines():
-            self.lines.append(line)
+        self.lines = self.get_lines()
         parser = self.parser_class(self.lines)
-        self.platform = parser.matrix
-
-    def get_next_position(self, initial_position, platform):
-        next_position = initial_position
-        j, i = next_position
-        while True:
-            if j == 0:
-                break
-            if platform[j - 1][i] == ".":
-                next_position = (j - 1, i)
-                j, i = next_position
-                continue
-            else:
-                break
-        return next_position
+        self.platform = parser.parse()
+
+    def roll_line(self, line, to_start=True):
+        """
+        Rolls round rocks of a row or column until they hit a cube rock,
+        another round rock or the edge.
+        """
+        rolled = []
+        for segment in line.split(b"#"):
+            rocks = segment.count(b"O")
+            space = b"." * (len(segment) - rocks)
+            rolled.append(b"O" * rocks + space if to_start else space + b"O" * rocks)
+        return b"#".join(rolled)
+
+    def tilt(self, platform, direction):
+        """
+        Tilts the platform in place towards the given direction.
+        """
+        assert direction in "NESW"
+        width, cells = platform.width, platform.cells
+        if direction in "NS":
+            lines = [slice(i, None, width) for i in range(width)]
+        else:
+            lines = [slice(j * width, (j + 1) * width) for j in range(platform.height)]
+        to_start = direction in "NW"
+        for line in lines:
+            cells[line] = self.roll_line(cells[line], to_start)
+        return platform
 
     def tilt_platform(self, platform):
-        tilted_platform = copy.deepcopy(platform)
-        for j, row in enumerate(platform):
-            for i, char in enumerate(row):
-                if char == "O":
-                    next_position = self.get_next_position((j, i), tilted_platform)
-                    tilted_platform[next_position[0]][i], tilted_platform[j][i] = (
-                        tilted_platform[j][i],
-                        tilted_platform[next_position[0]][i],
-                    )
-        return tilted_platform
+        return self.tilt(platform.copy(), "N")
 
     def calculate_load(self, platform):
         load = 0
         for j, row in enumerate(platform):
-            for char in row:
-                if char == "O":
-                    magnitude = len(platform) - j
-                    load += magnitude
+            magnitude = len(platform) - j
+            load += row.tobytes().count(b"O") * magnitude
         return load
 
     def rotate_platform(self, platform, direction):
@@ -78,57 +64,42 @@ class App:
         if direction == "N":
             rotated_platform = platform
         if direction == "W":
-            # rotate clockwise
-            rotated_platform = [list(reversed(col)) for col in zip(*platform)]
+            rotated_platform = platform.copy().rotate_clockwise()
         if direction == "E":
-            # rotate counter-clockwise
-            rotated_platform = list(reversed([list(col) for col in zip(*platform)]))
+            rotated_platform = platform.copy().rotate_counter_clockwise()
         if direction == "S":
-            # rotate 180 degs
-            rotated_platform = list(reversed([list(reversed(col)) for col in platform]))
+            rotated_platform = platform.copy().rotate_180()
 
         return rotated_platform
 
-    def rotate_platform_backward(self, platform, direction):
-        assert direction in "NESW"
-        if direction == "N":
-            rotated_platform = platform
-        if direction == "S":
-            rotated_platform = self.rotate_platform(platform, "S")
-        if direction == "E":
-            rotated_platform = self.rotate_platform(platform, "W")
-        if direction == "W":
-            rotated_platform = self.rotate_platform(platform, "E")
-        return rotated_platform
-
-    def make_cycle(self, platform):
-        directions = ["N", "W", "S", "E"]
-        moving_platform = copy.deepcopy(platform)
-        for direction in directions:
-            rotated_platform = self.rotate_platform(moving_platform, direction)
-            tilted_platform = self.tilt_platform(rotated_platform)
-            moving_platform = self.rotate_platform_backward(tilted_platform, direction)
-        return moving_platform
+    def spin(self, platform):
+        for direction in "NWSE":
+            self.tilt(platform, direction)
+
+    def get_cycle(self):
+        """
+        Spins the platform until its state repeats. The cycle finder and the
+        platform are checkpointed between spins.
+        """
+        if self.cycle is None:
+            checkpoint = Checkpoint(self.file_path, "cycles", CHECKPOINT_VERSION)
+            state = checkpoint.load()
+            if state is None:
+                finder, platform = CycleFinder(), self.platform.copy()
+            else:
+                finder, platform = state
+            while not finder.add(
+                get_digest(platform.cells), self.calculate_load(platform)
+            ):
+                self.spin(platform)
+                checkpoint.update(lambda: (finder, platform))
+            checkpoint.clear()
+            self.cycle = finder.get_cycle()
+        return self.cycle
 
     def find_pattern(self):
-        cycles = [self.platform]
-        previous_cycle = self.platform
-        cycle = 0
-        while True:
-            next_cycle = self.make_cycle(previous_cycle)
-            if next_cycle in cycles:
-                break
-            previous_cycle = next_cycle
-            cycles.append(next_cycle)
-            cycle += 1
-        return cycles.index(next_cycle), cycle + 1
-
-    def get_platform_after_cycles(self, qty):
-        previous_cycle = self.platform
-        for i in range(qty):
-            next_cycle = self.make_cycle(previous_cycle)
-            previous_cycle = next_cycle
-        return next_cycle
+        cycle = self.get_cycle()
+        return cycle.start, cycle.start + cycle.length
 
     def calculate_load_in_direction(self, direction):
         rotated_platform = self.rotate_platform(self.platform, direction)
@@ -136,16 +107,13 @@ class App:
         return self.calculate_load(tilted_platform)
 
     def get_load_after_cycles(self, qty):
-        index_1, index_2 = self.find_pattern()
-        final_index = (qty - index_1) % (index_2 - index_1) + index_1
-        final_platform = self.get_platform_after_cycles(final_index)
-        return self.calculate_load(final_platform)
+        return self.get_cycle().get(qty)
 
 
 if __name__ == "__main__":
     # input_file_path = "day14/test_input.txt"
     input_file_path = "day14/input.txt"
-    app = App(input_file_path, MatrixParser)
+    app = App(input_file_path, GridParser)
     app.setup_data()
     # part 1
     print(app.calculate_load_in_direction("N"))
@@ -1,5 +1,7 @@
 from collections import OrderedDict
 
+from loader import read_lines
+
 
 class App:
     def __init__(self, file_path):
@@ -8,14 +10,10 @@ class App:
         self.boxes = {}
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
+        lines = self.get_lines()
         self.data = lines[0].split(",")
         self.set_boxes()
 
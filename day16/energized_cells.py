@@ -1,20 +1,6 @@
-class MatrixParser:
-    def __init__(self, lines):
-        self.lines = lines
-        self.matrix = self.setup_matrix()
-
-    def setup_matrix(self):
-        matrix = []
-        for line in self.lines:
-            matrix_line = []
-            for char in line:
-                matrix_line.append(char)
-            matrix.append(matrix_line)
-        return matrix
-
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
+from graph import reachable
+from grid import DIRECTIONS, GridParser
+from loader import read_lines
 
 
 class App:
@@ -22,24 +8,15 @@ class App:
         self.file_path = file_path
         self.data = []
         self.parser_class = parser_class
-        self.energized_cells = set()
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
+        lines = self.get_lines()
         parser = self.parser_class(lines)
-        self.map = parser.setup_matrix()
-
-    def is_valid_cell(self, cell):
-        if 0 <= cell[0] < len(self.map) and 0 <= cell[1] < len(self.map[0]):
-            return True
-        return False
+        self.map = parser.parse()
+        self.set_transitions()
 
     def get_movement(self, char, direction):
         assert char in ".-|/\\"
@@ -60,50 +37,49 @@ class App:
         if char == "\\":
             return ((direction[1], direction[0]),)
 
-    def get_next_cells(self, cell, direction):
-        cell_direction_couples = []
-        char = self.map[cell[0]][cell[1]]
-        movements = self.get_movement(char, direction)
-        for movement in movements:
-            next_cell = (cell[0] + movement[0], cell[1] + movement[1])
-            next_direction = movement
-            cell_direction_couples.append((next_cell, next_direction))
-        return cell_direction_couples
+    def set_transitions(self):
+        """
+        A beam is the state cell index * 4 + index of its direction in
+        DIRECTIONS. For every char and incoming direction, stores the
+        outgoing direction indexes.
+        """
+        self.transitions = {}
+        for char in ".-|/\\":
+            self.transitions[ord(char)] = [
+                [DIRECTIONS.index(movement) for movement in self.get_movement(char, d)]
+                for d in DIRECTIONS
+            ]
+        self.offsets = self.map.get_offsets()
+        self.masks = self.map.get_masks()
+
+    def get_next_states(self, state):
+        cell, direction = divmod(state, 4)
+        for movement in self.transitions[self.map.cells[cell]][direction]:
+            if self.masks[movement][cell]:
+                yield (cell + self.offsets[movement]) * 4 + movement
 
     def run_light(self, cell, direction, energized_cells):
-        cell = cell
-        direction = direction
-        while True:
-            if (cell, direction) in energized_cells:
-                break
-            energized_cells.add((cell, direction))
-            next_cells = self.get_next_cells(cell, direction)
-            if len(next_cells) == 2:
-                next_cell, next_direction = next_cells[1]
-                if self.is_valid_cell(next_cell):
-                    self.run_light(next_cell, next_direction, energized_cells)
-            cell, direction = next_cells[0]
-            if not self.is_valid_cell(cell):
-                break
+        start = self.map.index(*cell) * 4 + DIRECTIONS.index(direction)
+        energized_cells.update(reachable([start], self.get_next_states))
 
     def get_energized_cell_qty(self, init_cell, init_direction):
         energized_cells = set()
         self.run_light(init_cell, init_direction, energized_cells)
-        return len(set([cell[0] for cell in energized_cells]))
+        return len(set([state // 4 for state in energized_cells]))
 
     def get_initial_movements(self):
         initial_movements = []
         # from left to right
-        initial_movements.extend([((i, 0), (0, 1)) for i in range(len(self.map))])
+        initial_movements.extend([((i, 0), (0, 1)) for i in range(self.map.height)])
         # from right to left
         initial_movements.extend(
-            [((i, len(self.map[0]) - 1), (0, -1)) for i in range(len(self.map))]
+            [((i, self.map.width - 1), (0, -1)) for i in range(self.map.height)]
         )
         # from top to bottom
-        initial_movements.extend([((0, i), (1, 0)) for i in range(len(self.map[0]))])
+        initial_movements.extend([((0, i), (1, 0)) for i in range(self.map.width)])
         # from bottom to top
         initial_movements.extend(
-            [((len(self.map) - 1, i), (-1, 0)) for i in range(len(self.map[0]))]
+            [((self.map.height - 1, i), (-1, 0)) for i in range(self.map.width)]
         )
         return initial_movements
 
@@ -120,7 +96,7 @@ class App:
 if __name__ == "__main__":
     # input_file_path = "day16/test_input.txt"
     input_file_path = "day16/input.txt"
-    app = App(input_file_path, MatrixParser)
+    app = App(input_file_path, GridParser)
     app.setup_data()
     # Part 1
     print(app.get_energized_cell_qty(init_cell=(0, 0), init_direction=(0, 1)))
@@ -1,3 +1,6 @@
+from loader import read_lines
+
+
 def print_matrix(matrix):
     for row in matrix:
         print(*row, sep="")
@@ -14,9 +17,15 @@ class DigPlanHexParser:
         }
 
     def parse(self):
+        return self.parse_tokens(line.split() for line in self.lines)
+
+    def parse_tokens(self, tokens):
+        """
+        Same as parse, from lines already split into their three fields.
+        """
         data = []
-        for line in self.lines:
-            hex_code = line.split()[2][1:-1]
+        for _, _, color in tokens:
+            hex_code = color[1:-1]
             direction = self.direction_map[hex_code[-1]]
             distance = int(hex_code[1:-1], 16)
             data.append((direction, distance))
@@ -34,9 +43,14 @@ class DigPlanParser:
         }
 
     def parse(self):
+        return self.parse_tokens(line.split() for line in self.lines)
+
+    def parse_tokens(self, tokens):
+        """
+        Same as parse, from lines already split into their three fields.
+        """
         data = []
-        for line in self.lines:
-            direction_char, distance, color = line.split()
+        for direction_char, distance, color in tokens:
             data.append((self.direction_map[direction_char], int(distance)))
         return data
 
@@ -48,22 +62,20 @@ class App:
         self.parser_class = parser_class
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
-        parser = self.parser_class(lines)
-        self.data = parser.parse()
+        # split once, both plans are read from the same fields
+        self.tokens = [line.split() for line in self.get_lines()]
+        self.data = self.parser_class([]).parse_tokens(self.tokens)
         self.polygon = self.setup_polygon()
 
-    def setup_polygon(self):
+    def setup_polygon(self, data=None):
+        if data is None:
+            data = self.data
         polygon = []
         current_pos = (0, 0)
-        for item in self.data:
+        for item in data:
             polygon.append(current_pos)
             direction, distance = item
             current_pos = (
@@ -73,18 +85,24 @@ class App:
         polygon.append(current_pos)
         return polygon
 
-    def get_polygon_area(self):
+    def get_polygon_area(self, hex_codes=False):
         """
         https://en.wikipedia.org/wiki/Shoelace_formula
         Area = 0.5 × |x1y2 - y1x2 + x2y3 - y2x3 + ... + xny1 - ynx1|
+        With hex_codes, the plan is read from the colors of the parsed lines
+        whatever parser_class is.
         """
+        data, polygon = self.data, self.polygon
+        if hex_codes and self.parser_class is not DigPlanHexParser:
+            data = DigPlanHexParser([]).parse_tokens(self.tokens)
+            polygon = self.setup_polygon(data)
         sum = 0
         perimeter = 0
-        for i in range(len(self.polygon) - 1):
-            vertice_1 = self.polygon[i]
-            vertice_2 = self.polygon[i + 1]
+        for i in range(len(polygon) - 1):
+            vertice_1 = polygon[i]
+            vertice_2 = polygon[i + 1]
             sum += vertice_1[1] * vertice_2[0] - vertice_1[0] * vertice_2[1]
-            perimeter += self.data[i][1]
+            perimeter += data[i][1]
         area = abs(sum) / 2
         return int(area + perimeter / 2 + 1)
 
@@ -92,11 +110,9 @@ class App:
 if __name__ == "__main__":
     # input_file_path = "day18/test_input.txt"
     input_file_path = "day18/input.txt"
+    app = App(input_file_path, DigPlanParser)
+    app.setup_data()
     # Part 1
-    app1 = App(input_file_path, DigPlanParser)
-    app1.setup_data()
-    print(app1.get_polygon_area())
+    print(app.get_polygon_area())
     # Part 2
-    app1 = App(input_file_path, DigPlanHexParser)
-    app1.setup_data()
-    print(app1.get_polygon_area())
+    print(app.get_polygon_area(hex_codes=True))
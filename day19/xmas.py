@@ -1,3 +1,14 @@
+from array import array
+
+import sidecar
+from loader import read_lines
+from scanner import scan_records
+
+# version of the compiled workflows in the sidecar, bump it when it changes
+SIDECAR_VERSION = 1
+PROPERTIES = "xmas"
+
+
 class XmasParser:
     def __init__(self, lines):
         self.lines = lines
@@ -24,6 +35,7 @@ class XmasParser:
                         property, num = logic_text.split("<")
                         logic = {
                             "property": property,
+                            "operator": "<",
                             "function": self.functions["<"],
                             "num": int(num),
                         }
@@ -31,6 +43,7 @@ class XmasParser:
                         property, num = logic_text.split(">")
                         logic = {
                             "property": property,
+                            "operator": ">",
                             "function": self.functions[">"],
                             "num": int(num),
                         }
@@ -40,16 +53,10 @@ class XmasParser:
         return workflows
 
     def setup_parts(self, lines):
+        # every part line is {x=..,m=..,a=..,s=..}, scanned as one block
         parts = []
-        for line in lines:
-            x, m, a, s = line[1:-1].split(",")
-            part = {
-                "x": int(x.split("=")[1]),
-                "m": int(m.split("=")[1]),
-                "a": int(a.split("=")[1]),
-                "s": int(s.split("=")[1]),
-            }
-            parts.append(part)
+        for x, m, a, s in scan_records("\n".join(lines), 4):
+            parts.append({"x": x, "m": m, "a": a, "s": s})
         return parts
 
     def parse(self):
@@ -67,18 +74,90 @@ class App:
         self.rejected = []
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
-        parser = self.parser_class(lines)
-        self.workflows, self.parts = parser.parse()
+        if not (sidecar.is_enabled() and self.load_sidecar()):
+            lines = self.get_lines()
+            parser = self.parser_class(lines)
+            self.workflows, self.parts = parser.parse()
+            if sidecar.is_enabled():
+                self.save_sidecar()
         self.sort_parts()
 
+    def save_sidecar(self):
+        """
+        Saves the workflows as flat rule arrays, rules of workflow i are
+        offsets[i]:offsets[i + 1], destinations index names (A and R last).
+        """
+        names = list(self.workflows) + ["A", "R"]
+        name_ids = {name: i for i, name in enumerate(names)}
+        offsets = array("i", [0])
+        properties = bytearray()
+        operators = bytearray()
+        nums = array("q")
+        destinations = array("i")
+        for rules in self.workflows.values():
+            for rule in rules:
+                logic = rule.get("logic")
+                if logic is None:
+                    properties += b"-"
+                    operators += b"-"
+                    nums.append(0)
+                else:
+                    properties += logic["property"].encode()
+                    operators += logic["operator"].encode()
+                    nums.append(logic["num"])
+                destinations.append(name_ids[rule["destination"]])
+            offsets.append(len(destinations))
+        sections = {
+            "names": sidecar.encode_names(names),
+            "offsets": offsets,
+            "properties": properties,
+            "operators": operators,
+            "nums": nums,
+            "destinations": destinations,
+            "parts": array(
+                "q", (part[property] for part in self.parts for property in PROPERTIES)
+            ),
+        }
+        sidecar.save(self.file_path, "workflows", SIDECAR_VERSION, sections)
+
+    def load_sidecar(self):
+        """
+        Loads the workflows and parts compiled by an earlier setup.
+        """
+        compiled = sidecar.load(self.file_path, "workflows", SIDECAR_VERSION)
+        if compiled is None:
+            return False
+        functions = self.parser_class([]).functions
+        with compiled:
+            names = sidecar.decode_names(compiled["names"])
+            offsets = compiled["offsets"]
+            properties = bytes(compiled["properties"]).decode()
+            operators = bytes(compiled["operators"]).decode()
+            nums = compiled["nums"]
+            destinations = compiled["destinations"]
+            self.workflows = {}
+            for i, name in enumerate(names[:-2]):
+                rules = []
+                for j in range(offsets[i], offsets[i + 1]):
+                    rule = {"destination": names[destinations[j]]}
+                    if operators[j] != "-":
+                        rule["logic"] = {
+                            "property": properties[j],
+                            "operator": operators[j],
+                            "function": functions[operators[j]],
+                            "num": nums[j],
+                        }
+                    rules.append(rule)
+                self.workflows[name] = rules
+            parts = compiled["parts"]
+            self.parts = [
+                dict(zip(PROPERTIES, parts[i : i + 4])) for i in range(0, len(parts), 4)
+            ]
+        return True
+
     def filter(self, part, filter):
         for rule in filter:
             if "logic" in rule:
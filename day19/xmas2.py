@@ -1,3 +1,10 @@
+from intervals import split_box, volume
+from loader import read_lines
+
+# a part is a box of rating intervals in this order
+AXES = {"x": 0, "m": 1, "a": 2, "s": 3}
+
+
 class XmasRangeParser:
     def __init__(self, lines):
         self.lines = lines
@@ -48,48 +55,24 @@ class App:
         self.accepted = []
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
+        lines = self.get_lines()
         parser = self.parser_class(lines)
         self.workflows = parser.parse()
 
     def get_part_combination(self, part):
         if not part:
             return 0
-        product = 1
-        for interval in part.values():
-            product *= interval[1] - interval[0] + 1
-        return product
+        return volume(part)
 
     def get_new_parts_lt(self, part, property, num):
-        if part[property][0] >= num:
-            return None, part
-        elif part[property][1] < num:
-            return part, None
-        else:
-            part_passes = part.copy()
-            part_passes[property] = (part[property][0], num - 1)
-            part_fails = part.copy()
-            part_fails[property] = (num, part[property][1])
-            return part_passes, part_fails
+        return split_box(part, AXES[property], num)
 
     def get_new_parts_gt(self, part, property, num):
-        if part[property][0] > num:
-            return part, None
-        elif part[property][1] <= num:
-            return None, part
-        else:
-            part_passes = part.copy()
-            part_passes[property] = (num + 1, part[property][1])
-            part_fails = part.copy()
-            part_fails[property] = (part[property][0], num)
-            return part_passes, part_fails
+        part_fails, part_passes = split_box(part, AXES[property], num + 1)
+        return part_passes, part_fails
 
     def get_all_combinations_qty(self, part, workflow_id):
         if not part:
@@ -127,7 +110,7 @@ class App:
         return sum
 
     def get_all_combinations_qty_init(self):
-        part = {"x": (1, 4000), "m": (1, 4000), "a": (1, 4000), "s": (1, 4000)}
+        part = ((1, 4000),) * len(AXES)
         workflow_id = "in"
         return self.get_all_combinations_qty(part, workflow_id)
 
@@ -1,7 +1,18 @@
+import itertools
 import math
+from array import array
+
+import sidecar
+from cycles import find_cycle
+from loader import read_lines
+
+# version of the wired modules in the sidecar, bump it when it changes
+SIDECAR_VERSION = 1
 
 
 class Module:
+    __slots__ = ("id", "destinations", "prefix")
+
     def __init__(self, id, *args, **kwargs):
         self.id = id
         self.destinations = []
@@ -19,13 +30,21 @@ class Module:
     def process_pulse(self, pulse):
         raise NotImplementedError
 
+    def reset(self):
+        pass
+
 
 class FlipFlop(Module):
+    __slots__ = ("state",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.state = False
         self.prefix = "%"
 
+    def reset(self):
+        self.state = False
+
     def process_pulse(self, pulse):
         responses = []
         if pulse[1] == "high":
@@ -39,6 +58,8 @@ class FlipFlop(Module):
 
 
 class Conjunction(Module):
+    __slots__ = ("input_modules", "memo")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.input_modules = []
@@ -49,6 +70,10 @@ class Conjunction(Module):
         self.input_modules.append(module)
         self.memo[module.id] = "low"
 
+    def reset(self):
+        for id in self.memo:
+            self.memo[id] = "low"
+
     def memo_is_high(self):
         return "low" not in self.memo.values()
 
@@ -56,13 +81,14 @@ class Conjunction(Module):
         responses = []
         self.memo[pulse[0].id] = pulse[1]
         output = "low" if self.memo_is_high() else "high"
-        # breakpoint()
         for destination in self.destinations:
             responses.append((self, output, destination))
         return responses
 
 
 class Broadcaster(Module):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # self.id = "broadcaster"
@@ -76,6 +102,8 @@ class Broadcaster(Module):
 
 
 class Button(Module):
+    __slots__ = ("broadcaster",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.broadcaster = kwargs["broadcaster"]
@@ -88,6 +116,8 @@ class Button(Module):
 
 
 class Output(Module):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -95,6 +125,11 @@ class Output(Module):
         return []
 
 
+# module classes by their one character kind in the sidecar
+MODULE_CLASSES = {"%": FlipFlop, "&": Conjunction, "b": Broadcaster, "o": Output}
+MODULE_KINDS = {module_class: kind for kind, module_class in MODULE_CLASSES.items()}
+
+
 class PulseParser:
     def __init__(self, lines):
         self.lines = lines
@@ -115,9 +150,7 @@ class App:
         self.watch = {}
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def get_module(self, id):
         for module in self.modules:
@@ -137,7 +170,6 @@ class App:
         for id in all_outputs:
             if id not in module_ids:
                 self.modules.append(Output(id=id))
-        # breakpoint()
 
     def create_module_instances(self):
         for key in self.data.keys():
@@ -181,14 +213,74 @@ class App:
         self.create_button()
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
-        parser = self.parser_class(lines)
-        self.data = parser.parse()
-        self.create_modules()
+        if not (sidecar.is_enabled() and self.load_sidecar()):
+            lines = self.get_lines()
+            parser = self.parser_class(lines)
+            self.data = parser.parse()
+            self.create_modules()
+            if sidecar.is_enabled():
+                self.save_sidecar()
         self.button = self.get_module(id="button")
 
+    def save_sidecar(self):
+        """
+        Saves the modules in order with their destinations as module indexes.
+        """
+        modules = [module for module in self.modules if not isinstance(module, Button)]
+        indexes = {module.id: i for i, module in enumerate(modules)}
+        offsets = array("i", [0])
+        destinations = array("i")
+        for module in modules:
+            destinations.extend(
+                indexes[destination.id] for destination in module.destinations
+            )
+            offsets.append(len(destinations))
+        sections = {
+            "names": sidecar.encode_names(module.id for module in modules),
+            "kinds": "".join(MODULE_KINDS[type(module)] for module in modules).encode(),
+            "offsets": offsets,
+            "destinations": destinations,
+        }
+        sidecar.save(self.file_path, "modules", SIDECAR_VERSION, sections)
+
+    def load_sidecar(self):
+        """
+        Wires the modules saved by an earlier setup by index, without the
+        module lookups by id of create_modules.
+        """
+        compiled = sidecar.load(self.file_path, "modules", SIDECAR_VERSION)
+        if compiled is None:
+            return False
+        with compiled:
+            names = sidecar.decode_names(compiled["names"])
+            kinds = bytes(compiled["kinds"]).decode()
+            offsets = compiled["offsets"]
+            destinations = compiled["destinations"]
+            self.modules = [
+                MODULE_CLASSES[kind](id=name) for name, kind in zip(names, kinds)
+            ]
+            for i, module in enumerate(self.modules):
+                for j in destinations[offsets[i] : offsets[i + 1]]:
+                    module.add_destination(self.modules[j])
+        # inputs in module order, like add_conjunction_input_modules
+        for module in self.modules:
+            for destination in module.destinations:
+                if (
+                    isinstance(destination, Conjunction)
+                    and module.id not in destination.memo
+                ):
+                    destination.add_input_module(module)
+        self.create_button()
+        return True
+
+    def reset(self):
+        """
+        Puts every module back in its initial state, so the parsed modules
+        can be pushed again from the start.
+        """
+        for module in self.modules:
+            module.reset()
+
     def push_button(self):
         low_qty = 0
         high_qty = 0
@@ -218,40 +310,34 @@ class App:
             current_pulses = next_pulses
         return watched_module
 
-    def is_all_flipflops_low(self):
-        flip_flops = self.get_modules_by_class(FlipFlop)
-        return all([module.state == False for module in flip_flops])
-
-    def get_loop(self):
-        loop = []
-        i = 0
+    def get_state_fingerprint(self):
+        """
+        Bitmask of every flip-flop state and every conjunction memory.
+        """
+        state = 0
+        for module in self.modules:
+            if isinstance(module, FlipFlop):
+                state = state << 1 | module.state
+            elif isinstance(module, Conjunction):
+                for pulse in module.memo.values():
+                    state = state << 1 | (pulse == "high")
+        return state
+
+    def iter_pushes(self):
+        """
+        Yields (state fingerprint, (low qty, high qty)) of every button push.
+        """
         while True:
-            low_high_qty = self.push_button()
-            loop.append(low_high_qty)
-            i += 1
-            if i == 1000:
-                break
-            if self.is_all_flipflops_low():
-                break
-        return loop
-
-    def get_low_high_qtys(self, loop):
-        low_total = high_total = 0
-        for item in loop:
-            low_total += item[0]
-            high_total += item[1]
-        return (low_total, high_total)
+            yield self.get_state_fingerprint(), self.push_button()
+
+    def get_loop(self, pushes=1000):
+        """
+        Returns the Cycle of the pulse counts, found within pushes pushes.
+        """
+        return find_cycle(itertools.islice(self.iter_pushes(), pushes))
 
     def get_total_pulse_product(self, pushes):
-        loop = self.get_loop()
-        full_cycles = pushes // len(loop)
-        incomplete_cycle = pushes % len(loop)
-        low_full, high_full = self.get_low_high_qtys(loop)
-        low_incomplete, high_incomplete = self.get_low_high_qtys(
-            loop[:incomplete_cycle]
-        )
-        low_total = low_full * full_cycles + low_incomplete
-        high_total = high_full * full_cycles + high_incomplete
+        low_total, high_total = self.get_loop(pushes).get_total(pushes)
         return low_total * high_total
 
     def get_pulse_frequencies(self, modules):
@@ -278,11 +364,10 @@ if __name__ == "__main__":
     # input_file_path = "day20/test_input2.txt"
     # input_file_path = "day20/test_input.txt"
     input_file_path = "day20/input.txt"
+    app = App(input_file_path, PulseParser)
+    app.setup_data()
     # part 1
-    app1 = App(input_file_path, PulseParser)
-    app1.setup_data()
-    print(app1.get_total_pulse_product(pushes=1000))
+    print(app.get_total_pulse_product(pushes=1000))
     # part 2
-    app2 = App(input_file_path, PulseParser)
-    app2.setup_data()
-    print(app2.get_min_button_pushes())
+    app.reset()
+    print(app.get_min_button_pushes())
@@ -1,21 +1,7 @@
-class MatrixParser:
-    def __init__(self, lines):
-        self.lines = lines
-        self.matrix = self.setup_matrix()
-
-    def setup_matrix(self):
-        matrix = []
-        for line in self.lines:
-            matrix_line = []
-            for char in line:
-                matrix_line.append(char)
-            matrix.append(matrix_line)
-        return matrix
-
-    @staticmethod
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
+from graph import bfs_distances
+from grid import DIRECTIONS, GridParser
+from loader import read_lines
+from utils import debug
 
 
 class App:
@@ -24,50 +10,47 @@ class App:
         self.parser_class = parser_class
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def get_start(self):
-        for j, row in enumerate(self.map):
-            for i, char in enumerate(row):
-                if char == "S":
-                    return (j, i)
-        raise ValueError("start point not found")
+        index = self.map.find("S")
+        if index == -1:
+            raise ValueError("start point not found")
+        return self.map.position(index)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
+        lines = self.get_lines()
         parser = self.parser_class(lines)
-        self.map = parser.setup_matrix()
+        self.map = parser.parse()
         self.start = self.get_start()
-        # print(self.start)
-        self.map[self.start[0]][self.start[1]] = "."
-        # MatrixParser.print_matrix(self.map)
+        debug(self.start)
+        self.map[self.start] = "."
+        debug(self.map)
 
     def get_valid_neighbors(self, pos):
+        """
+        Neighbors as the list of lists version found them: a negative row or
+        column wrapped around to the other side of the map instead of being
+        out of bounds, so positions up to one map size to the top and to the
+        left are reachable.
+        """
         valid_neighbors = set()
-        directions = ((0, 1), (0, -1), (1, 0), (-1, 0))
-        for dir in directions:
-            try:
-                if self.map[pos[0] + dir[0]][pos[1] + dir[1]] == ".":
-                    valid_neighbors.add((pos[0] + dir[0], pos[1] + dir[1]))
-            except IndexError:
+        for dir in DIRECTIONS:
+            row, col = pos[0] + dir[0], pos[1] + dir[1]
+            if not (-self.map.height <= row < self.map.height):
+                continue
+            if not (-self.map.width <= col < self.map.width):
                 continue
+            if self.map[row % self.map.height, col % self.map.width] == ".":
+                valid_neighbors.add((row, col))
         return valid_neighbors
 
     def get_destination_qty(self, steps):
         self.start = (0, 5)
-        current_destinations = {self.start}
-        for i in range(steps):
-            next_destinations = set()
-            for destination in current_destinations:
-                valid_neighbors = self.get_valid_neighbors(destination)
-                next_destinations = next_destinations.union(valid_neighbors)
-            current_destinations = next_destinations
-            print(len(current_destinations))
-        return len(current_destinations)
+        # walking back and forth wastes two steps, so a garden is a destination
+        # when its distance is within steps and has the same parity
+        distances = bfs_distances([self.start], self.get_valid_neighbors, steps)
+        return sum(1 for distance in distances.values() if distance % 2 == steps % 2)
 
 
 if __name__ == "__main__":
@@ -75,6 +58,6 @@ if __name__ == "__main__":
     input_file_path = "day21/input.txt"
     # TOTAL_STEPS = 6
     TOTAL_STEPS = 64
-    app = App(input_file_path, MatrixParser)
+    app = App(input_file_path, GridParser)
     app.setup_data()
     print(app.get_destination_qty(TOTAL_STEPS))
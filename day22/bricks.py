@@ -1,7 +1,21 @@
-from functools import cache
+import sys
+
+import sidecar
+from checkpoint import Checkpoint
+from columns import Row, Table
+from loader import InputFile
+from scanner import scan_record
+from utils import DEBUG, TRACE, debug, is_enabled, trace
+
+# version of the settled brick table in the sidecar, bump it when it changes
+SIDECAR_VERSION = 1
+# version of the calculate_falling_bricks checkpoint state
+CHECKPOINT_VERSION = 2
 
 
 class Brick:
+    __slots__ = ("start", "end")
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
@@ -48,17 +62,113 @@ class Brick:
             self.move_down(qty=diff)
 
 
+class BrickView(Row, Brick):
+    """
+    Brick reading and writing its coordinates in a BrickSet.
+    """
+
+    __slots__ = ("table", "index")
+
+    @property
+    def start(self):
+        return self.table.get_point(self.index, 0)
+
+    @start.setter
+    def start(self, point):
+        self.table.set_point(self.index, 0, point)
+
+    @property
+    def end(self):
+        return self.table.get_point(self.index, 3)
+
+    @end.setter
+    def end(self, point):
+        self.table.set_point(self.index, 3, point)
+
+
+class BrickSet(Table):
+    """
+    Start and end coordinates of every brick in int32 columns.
+    """
+
+    columns = (
+        ("x1", "i"),
+        ("y1", "i"),
+        ("z1", "i"),
+        ("x2", "i"),
+        ("y2", "i"),
+        ("z2", "i"),
+    )
+    row_class = BrickView
+
+    def get_point(self, index, offset):
+        names = self.columns[offset : offset + 3]
+        return tuple(self.data[name][index] for name, _ in names)
+
+    def set_point(self, index, offset, point):
+        for (name, _), value in zip(self.columns[offset : offset + 3], point):
+            self.data[name][index] = value
+
+    def get_min_z(self, index):
+        return min(self.data["z1"][index], self.data["z2"][index])
+
+    def get_footprint(self, index):
+        x1, y1, _, x2, y2, _ = self.get_row(index)
+        return [
+            (x, y)
+            for x in range(min(x1, x2), max(x1, x2) + 1)
+            for y in range(min(y1, y2), max(y1, y2) + 1)
+        ]
+
+    def sort_by_min_z(self):
+        self.sort(key=self.get_min_z)
+
+    def settle(self):
+        """
+        Drops the bricks in their current order, each one until it rests on
+        the ground or on a brick dropped before it.
+        """
+        z1 = self.data["z1"]
+        z2 = self.data["z2"]
+        heights = {}
+        for i in range(len(self)):
+            footprint = self.get_footprint(i)
+            top = max(heights.get(cell, 0) for cell in footprint)
+            diff = min(z1[i], z2[i]) - top - 1
+            z1[i] -= diff
+            z2[i] -= diff
+            for cell in footprint:
+                heights[cell] = max(z1[i], z2[i])
+
+    def get_supporters(self):
+        """
+        Returns the set of indexes of the bricks right under every brick of
+        a settled set.
+        """
+        z1 = self.data["z1"]
+        z2 = self.data["z2"]
+        tops = {}
+        supporters = [set() for _ in range(len(self))]
+        for i in sorted(range(len(self)), key=self.get_min_z):
+            footprint = self.get_footprint(i)
+            min_z = min(z1[i], z2[i])
+            for cell in footprint:
+                top = tops.get(cell)
+                if top and top[0] == min_z - 1:
+                    supporters[i].add(top[1])
+            for cell in footprint:
+                tops[cell] = (max(z1[i], z2[i]), i)
+        return supporters
+
+
 class BrickParser:
     def __init__(self, lines):
         self.lines = lines
-        self.bricks = []
+        self.bricks = BrickSet()
 
     def parse(self):
         for line in self.lines:
-            start_str, end_str = line.split("~")
-            start = tuple(int(x) for x in start_str.split(","))
-            end = tuple(int(x) for x in end_str.split(","))
-            self.bricks.append(Brick(start, end))
+            self.bricks.append(scan_record(line, 6))
         return self.bricks
 
 
@@ -67,16 +177,11 @@ class App:
         self.file_path = file_path
         self.parser_class = parser_class
 
-    def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
-
-    def print_bricks(self, bricks=None):
+    def print_bricks(self, bricks=None, file=None):
         if not bricks:
             bricks = self.bricks
         for brick in bricks:
-            print(brick)
+            print(brick, file=file)
 
     def bricks_can_go_down(self, brick, lower_bricks):
         if brick.min_z == 1:
@@ -90,26 +195,32 @@ class App:
         return True
 
     def run_physics(self):
-        top_level = 1
-        for i, brick in enumerate(self.bricks):
-            while True:
-                if brick.min_z > top_level + 1:
-                    brick.drop_to_level(top_level + 1)
-                    continue
-                if not self.bricks_can_go_down(brick, self.bricks[:i]):
-                    top_level = max(brick.max_z, top_level)
-                    break
-                brick.move_down()
+        self.bricks.settle()
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
-        parser = self.parser_class(lines)
-        self.bricks = parser.parse()
-        self.bricks.sort()
+        if sidecar.is_enabled() and self.load_sidecar():
+            return
+        with InputFile(self.file_path) as input_file:
+            parser = self.parser_class(input_file.iter_views())
+            self.bricks = parser.parse()
+        self.bricks.sort_by_min_z()
         self.run_physics()
-        self.bricks.sort()
+        self.bricks.sort_by_min_z()
+        if sidecar.is_enabled():
+            sidecar.save(self.file_path, "bricks", SIDECAR_VERSION, self.bricks.data)
+
+    def load_sidecar(self):
+        """
+        Loads the settled and sorted bricks saved by an earlier setup.
+        """
+        compiled = sidecar.load(self.file_path, "bricks", SIDECAR_VERSION)
+        if compiled is None:
+            return False
+        with compiled:
+            self.bricks = BrickSet()
+            for name, _ in BrickSet.columns:
+                self.bricks.data[name] = compiled.get_array(name)
+        return True
 
     def is_on_the_ground(self, brick):
         return brick.min_z == 1
@@ -148,11 +259,13 @@ class App:
         return True
 
     def get_disintegrated_bricks(self):
-        disintegrated_bricks = set()
-        for brick in self.bricks:
-            if self.is_disintegrated(brick):
-                disintegrated_bricks.add(brick)
-        return disintegrated_bricks
+        supporters = self.bricks.get_supporters()
+        # bricks that are the only supporter of another brick have to stay
+        needed = set()
+        for brick_supporters in supporters:
+            if len(brick_supporters) == 1:
+                needed.update(brick_supporters)
+        return {brick for brick in self.bricks if brick.index not in needed}
 
     def calculate_disintegrated_bricks(self):
         disintegrated_bricks = self.get_disintegrated_bricks()
@@ -165,48 +278,69 @@ class App:
         )
         return sorted(integrated_bricks)
 
-    # @cache
-    # def get_effected_brick_qty(self, bricks):
-    #     total_effected = 0
-    #     supportings = set()
-    #     for brick in bricks:
-    #         supportings.update(self.get_supporting(brick))
-    #     falling_supportings = []
-    #     for supporting in supportings:
-    #         supporters = self.get_supporters(supporting)
-    #         if len(supporters):
-    #             if all([supporter in bricks for supporter in supporters]):
-    #                 falling_supportings.append(supporting)
-    #     if len(falling_supportings):
-    #         total_effected += len(falling_supportings) + self.get_effected_brick_qty(
-    #             tuple(falling_supportings)
-    #         )
-    #     return total_effected
-
-    def get_effected_brick_qty(self, brick):
+    def get_plain_bricks(self):
+        """
+        Returns the bricks as plain Brick objects, in table order. The falling
+        simulation reads their coordinates in its innermost loops, where the
+        row views would look up the columns and build a tuple on every read.
+        """
+        return [Brick(brick.start, brick.end) for brick in self.bricks]
+
+    def get_effected_brick_qty(self, brick, bricks):
+        """
+        Drops the plain bricks above brick once it is removed from them and
+        returns how many moved. The moved bricks stay moved.
+        """
         total_effected = 0
-        bricks = self.bricks.copy()
-        i = bricks.index(brick)
+        bricks = list(bricks)
         bricks.remove(brick)
         for j, brick in enumerate(bricks):
             if self.bricks_can_go_down(brick, bricks[:j]):
                 brick.move_down()
                 total_effected += 1
-        # if not total_effected:
-        #     breakpoint()
         return total_effected
 
+    def get_falling_state(self, i, total, integrated, bricks):
+        """
+        Progress of calculate_falling_bricks before integrated brick i. The
+        simulations leave the bricks they dropped moved, so the brick
+        coordinates are part of it.
+        """
+        return {
+            "index": i,
+            "total": total,
+            "integrated": integrated,
+            "bricks": [(brick.start, brick.end) for brick in bricks],
+        }
+
     def calculate_falling_bricks(self):
-        total = 0
-        integrated_bricks = self.get_integrated_bricks()
-        self.print_bricks(integrated_bricks)
-        for i, brick in enumerate(integrated_bricks):
-            print("integrated brick: ", i)
-            effected = self.get_effected_brick_qty(brick)
+        checkpoint = Checkpoint(self.file_path, "falling", CHECKPOINT_VERSION)
+        state = checkpoint.load()
+        if state is None:
+            start, total = 0, 0
+            bricks = self.get_plain_bricks()
+            # indexes of the integrated bricks in bricks, lowest first
+            integrated = [brick.index for brick in self.get_integrated_bricks()]
+        else:
+            start, total = state["index"], state["total"]
+            bricks = [Brick(*points) for points in state["bricks"]]
+            integrated = state["integrated"]
+            debug("resuming at integrated brick", start, "total:", total)
+        if is_enabled(DEBUG):
+            self.print_bricks([bricks[i] for i in integrated], file=sys.stderr)
+        tracing = is_enabled(TRACE)
+        for i in range(start, len(integrated)):
+            checkpoint.update(
+                lambda: self.get_falling_state(i, total, integrated, bricks)
+            )
+            brick = bricks[integrated[i]]
+            effected = self.get_effected_brick_qty(brick, bricks)
             if not effected:
-                breakpoint()
+                debug("integrated brick", i, brick, "drops no other brick")
             total += effected
-            print(total)
+            if tracing:
+                trace("integrated brick:", i, "total:", total)
+        checkpoint.clear()
         return total
 
 
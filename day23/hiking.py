@@ -1,26 +1,12 @@
-import sys
+from graph import dag_longest_path
+from grid import DIRECTIONS, GridParser
+from loader import read_lines
+from utils import debug
 
-sys.setrecursionlimit(10000)
-
-
-class MatrixParser:
-    def __init__(self, lines):
-        self.lines = lines
-        self.matrix = self.setup_matrix()
-
-    def setup_matrix(self):
-        matrix = []
-        for line in self.lines:
-            matrix_line = []
-            for char in line:
-                matrix_line.append(char)
-            matrix.append(matrix_line)
-        return matrix
-
-    @staticmethod
-    def print_matrix(matrix):
-        for row in matrix:
-            print(*row, sep="")
+FOREST = ord("#")
+PATH_CHARS = b".>v"
+# slopes can only be left in their direction and not entered against it
+SLOPES = {ord(">"): (0, 1), ord("v"): (1, 0)}
 
 
 class App:
@@ -29,63 +15,88 @@ class App:
         self.parser_class = parser_class
 
     def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
+        return read_lines(self.file_path)
 
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
+        lines = self.get_lines()
         parser = self.parser_class(lines)
-        self.map = parser.setup_matrix()
-        self.finish = (len(self.map) - 1, len(self.map[0]) - 2)
-        self.map[0][1] = "S"
-        MatrixParser.print_matrix(self.map)
+        self.map = parser.parse()
+        self.finish = (self.map.height - 1, self.map.width - 2)
+        self.map[0, 1] = "S"
+        debug(self.map)
+        self.offsets = self.map.get_offsets()
+        self.masks = self.map.get_masks()
 
-    def get_available_neighbors(self, path):
-        pos = path[-1]
-        available_neighbors = []
-        if self.map[pos[0]][pos[1]] == ">":
-            return [(pos[0], pos[1] + 1)]
-        if self.map[pos[0]][pos[1]] == "v":
-            return [(pos[0] + 1, pos[1])]
-        directions = ((0, 1), (0, -1), (1, 0), (-1, 0))
-        for dir in directions:
-            neighbor = (pos[0] + dir[0], pos[1] + dir[1])
-            char = self.map[neighbor[0]][neighbor[1]]
-            if char in ".>v" and neighbor not in path:
-                if dir == (0, -1) and char == ">":
-                    continue
-                if dir == (-1, 0) and char == "v":
-                    continue
-                available_neighbors.append(neighbor)
+    def get_moves(self, index):
+        """
+        Yields the cells a hike can go to from a cell, following the slopes.
+        """
+        cells = self.map.cells
+        char = cells[index]
+        for direction, offset, mask in zip(DIRECTIONS, self.offsets, self.masks):
+            if not mask[index]:
+                continue
+            if char in SLOPES and SLOPES[char] != direction:
+                continue
+            neighbor_char = cells[index + offset]
+            if neighbor_char not in PATH_CHARS:
+                continue
+            if SLOPES.get(neighbor_char) == (-direction[0], -direction[1]):
+                continue
+            yield index + offset
 
-        return available_neighbors
+    def is_junction(self, index):
+        open_neighbors = 0
+        for neighbor in self.map.neighbors(index):
+            if self.map.cells[neighbor] != FOREST:
+                open_neighbors += 1
+        return open_neighbors > 2
 
-    def get_longest_path(self, path):
-        print(len(path))
-        pos = path[-1]
-        if pos == self.finish:
-            return path
-        neighbors = self.get_available_neighbors(path)
-        longest_n_path = []
-        for neighbor in neighbors:
-            n_path = self.get_longest_path(path + [neighbor])
-            if len(n_path) > len(longest_n_path):
-                longest_n_path = n_path
-        return longest_n_path
+    def get_trail_graph(self, start, finish):
+        """
+        Compresses the corridors between junctions into weighted edges.
+        Returns (nodes, {node: [(next node, steps), ...]}).
+        """
+        nodes = {start, finish}
+        for index, char in enumerate(self.map.cells):
+            if char != FOREST and self.is_junction(index):
+                nodes.add(index)
+        edges = {node: [] for node in nodes}
+        for node in nodes:
+            for current in self.get_moves(node):
+                previous, steps = node, 1
+                while current not in nodes:
+                    moves = [
+                        move for move in self.get_moves(current) if move != previous
+                    ]
+                    if not moves:
+                        break
+                    previous, current = current, moves[0]
+                    steps += 1
+                else:
+                    edges[node].append((current, steps))
+        return nodes, edges
 
     def get_longest_path_distance(self):
-        path = self.get_longest_path(path=[(1, 1)])
-        print(path)
-        return len(path)
+        """
+        Slopes make the trail graph acyclic, so the longest hike is a longest
+        path on a DAG. Its length counts the cells after the start. Raises
+        ValueError when the trail graph has a cycle, e.g. with the slopes
+        walked both ways, as the DAG longest path does not hold then.
+        """
+        start = self.map.index(0, 1)
+        finish = self.map.index(*self.finish)
+        nodes, edges = self.get_trail_graph(start, finish)
+        try:
+            return dag_longest_path(nodes, edges, start, finish)
+        except ValueError:
+            raise ValueError("the trail graph has a cycle, slopes do not make it a DAG")
 
 
 if __name__ == "__main__":
     # input_file_path = "day23/test_input.txt"
     input_file_path = "day23/input.txt"
-    app = App(input_file_path, MatrixParser)
+    app = App(input_file_path, GridParser)
     app.setup_data()
     # part1
     print(app.get_longest_path_distance())
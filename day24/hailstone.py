@@ -1,7 +1,11 @@
-import re
+from columns import Row, Table, column_property
+from loader import InputFile
+from scanner import scan_record
 
 
 class Hailstone:
+    __slots__ = ("x", "y", "z", "vx", "vy", "vz", "m")
+
     def __init__(self, x, y, z, vx, vy, vz):
         self.x = x
         self.y = y
@@ -30,15 +34,78 @@ class Hailstone:
         return x_future and y_future
 
 
+class HailstoneView(Row, Hailstone):
+    """
+    Hailstone reading and writing its values in a HailstoneArray.
+    """
+
+    __slots__ = ("table", "index")
+
+    x = column_property("x")
+    y = column_property("y")
+    z = column_property("z")
+    vx = column_property("vx")
+    vy = column_property("vy")
+    vz = column_property("vz")
+    m = column_property("m")
+
+
+class HailstoneArray(Table):
+    """
+    Positions and velocities in int64 columns, xy slopes in a double column.
+    """
+
+    columns = (
+        ("x", "q"),
+        ("y", "q"),
+        ("z", "q"),
+        ("vx", "q"),
+        ("vy", "q"),
+        ("vz", "q"),
+        ("m", "d"),
+    )
+    row_class = HailstoneView
+
+    def add(self, x, y, z, vx, vy, vz):
+        self.append((x, y, z, vx, vy, vz, vy / vx))
+
+    def count_intersections(self, boundaries):
+        """
+        Number of pairs whose xy paths cross inside boundaries in the future
+        of both hailstones. Same arithmetic as Hailstone.get_intersection and
+        Hailstone.is_future, run on the columns.
+        """
+        (x_min, y_min), (x_max, y_max) = boundaries
+        xs, ys = self.data["x"], self.data["y"]
+        vxs, vys = self.data["vx"], self.data["vy"]
+        ms = self.data["m"]
+        total = 0
+        for i in range(len(self) - 1):
+            x1, y1, vx1, vy1, m1 = xs[i], ys[i], vxs[i], vys[i], ms[i]
+            for j in range(i + 1, len(self)):
+                m2 = ms[j]
+                if m1 == m2:
+                    continue
+                x2, y2 = xs[j], ys[j]
+                x = ((m1 * x1 - m2 * x2) + (y2 - y1)) / (m1 - m2)
+                y = m1 * (x - x1) + y1
+                if (y - y1) / vy1 < 0 or (x - x1) / vx1 < 0:
+                    continue
+                if (y - y2) / vys[j] < 0 or (x - x2) / vxs[j] < 0:
+                    continue
+                if x_min <= x <= x_max and y_min <= y <= y_max:
+                    total += 1
+        return total
+
+
 class HailstoneParser:
     def __init__(self, lines):
         self.lines = lines
 
     def parse(self):
-        hailstones = []
+        hailstones = HailstoneArray()
         for line in self.lines:
-            x, y, z, vx, vy, vz = [int(val) for val in re.split(" @ |, |,  ", line)]
-            hailstones.append(Hailstone(x, y, z, vx, vy, vz))
+            hailstones.add(*scan_record(line, 6))
         return hailstones
 
 
@@ -48,17 +115,10 @@ class App:
         self.parser_class = parser_class
         self.boundaries = boundaries
 
-    def get_lines(self):
-        with open(self.file_path) as f:
-            for line in f:
-                yield line.strip()
-
     def setup_data(self):
-        lines = []
-        for line in self.get_lines():
-            lines.append(line)
-        parser = self.parser_class(lines)
-        self.hailstones = parser.parse()
+        with InputFile(self.file_path) as input_file:
+            parser = self.parser_class(input_file.iter_views())
+            self.hailstones = parser.parse()
         # for hailstone in self.hailstones:
         #     print(hailstone)
 
@@ -68,20 +128,7 @@ class App:
         return x_min <= pos[0] <= x_max and y_min <= pos[1] <= y_max
 
     def calculate_test_area_intersections(self):
-        total = 0
-        for i, hailstone1 in enumerate(self.hailstones[:-1]):
-            for hailstone2 in self.hailstones[i + 1 :]:
-                intersection = hailstone1.get_intersection(hailstone2)
-                if not intersection:
-                    continue
-                if not hailstone1.is_future(intersection) or not hailstone2.is_future(
-                    intersection
-                ):
-                    continue
-                if not self.within_boundaires(intersection):
-                    continue
-                total += 1
-        return total
+        return self.hailstones.count_intersections(self.boundaries)
 
 
 if __name__ == "__main__":
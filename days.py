@@ -0,0 +1,377 @@
+"""
+Registry of every day solution that can be run without editing its script.
+
+Each day directory is imported as a namespace package from the repository root
+(e.g. "day14.reflector"), so the tools built on this registry must be started
+from the root: python runner.py, python -m day14.reflector, ... The day
+scripts import the shared root modules, so they are run as modules too and
+not by path (python day14/reflector.py only sees its own directory).
+"""
+
+import importlib
+import os
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+CUBE_LIMITS = {"red": 12, "green": 13, "blue": 14}
+HAILSTONE_BOUNDARIES = (
+    (200000000000000, 200000000000000),
+    (400000000000000, 400000000000000),
+)
+
+
+class Part:
+    """
+    One answer of a day.
+
+    build(module, file_path) returns a fresh, not yet set up App instance and
+    the answer is app.<method>(*args, **kwargs), called after the given
+    attributes are set on the app. Parts of the same day with the same module
+    and build function share one set up App unless fresh is True, which is
+    needed when solving mutates the App (e.g. day20 flip-flop states). slow
+    parts run for hours on the real input, the benchmark suite only runs them
+    when their day is named.
+    """
+
+    def __init__(
+        self,
+        module,
+        build,
+        method,
+        args=(),
+        kwargs=None,
+        attributes=None,
+        setup="setup_data",
+        fresh=False,
+        slow=False,
+    ):
+        self.module = module
+        self.build = build
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.attributes = attributes or {}
+        self.setup = setup
+        self.fresh = fresh
+        self.slow = slow
+
+    @property
+    def app_key(self):
+        """
+        Parts with the same app_key can share one set up App.
+        """
+        return (self.module, getattr(self.build, "key", self.build))
+
+    @property
+    def name(self):
+        return f"{self.module}.App.{self.method}"
+
+    def solve(self, app):
+        for key, value in self.attributes.items():
+            setattr(app, key, value)
+        return getattr(app, self.method)(*self.args, **self.kwargs)
+
+    def get_module(self, day):
+        return importlib.import_module(f"{day}.{self.module}")
+
+
+class Day:
+    def __init__(self, name, parts, input_file="input.txt"):
+        self.name = name
+        self.parts = parts
+        self.input_file = input_file
+
+    def get_input_path(self, input_file=None):
+        return os.path.join(ROOT, self.name, input_file or self.input_file)
+
+
+def with_parser(parser_name, *args):
+    """
+    Returns a build function for the common App(file_path, parser_class) shape.
+    """
+
+    def build(module, file_path):
+        return module.App(file_path, getattr(module, parser_name), *args)
+
+    # every call returns a new function, the key tells equal builds apart
+    build.key = ("with_parser", parser_name, repr(args))
+    return build
+
+
+def plain(module, file_path):
+    return module.App(file_path)
+
+
+# day06 has no input file, its race data lives in the script itself.
+DAYS = [
+    Day(
+        "day01",
+        [
+            Part("trebuchet_part_1", plain, "calculate_calibration_values_sum"),
+            Part("trebuchet_part_2", plain, "calculate_calibration_values_sum"),
+        ],
+        input_file="data.txt",
+    ),
+    Day(
+        "day02",
+        [
+            Part(
+                "cubes",
+                with_parser("CubeDataParser", CUBE_LIMITS),
+                "calculate_id_sum",
+                setup="setup",
+            ),
+            Part(
+                "cubes",
+                with_parser("CubeDataParser", CUBE_LIMITS),
+                "calculate_power_sum",
+                setup="setup",
+            ),
+        ],
+    ),
+    Day(
+        "day03",
+        [
+            Part(
+                "gear_ratios", with_parser("GridParser"), "calculate_valid_number_sum"
+            ),
+            Part("gear_ratios", with_parser("GridParser"), "calculate_gear_ratio_sum"),
+        ],
+    ),
+    Day(
+        "day04",
+        [
+            Part("cards", with_parser("CardParser"), "calculate_total_points"),
+            Part("cards", with_parser("CardParser"), "calculate_card_qty"),
+        ],
+    ),
+    Day(
+        "day05",
+        [
+            Part("seeds_part1", with_parser("AlmanacParser"), "find_lowest_location"),
+            Part("seeds_part2", with_parser("AlmanacParser"), "find_lowest_location"),
+        ],
+    ),
+    Day(
+        "day07",
+        [
+            Part("camel_cards", with_parser("Hand"), "calculate_total_winnings"),
+            Part(
+                "camel_cards",
+                with_parser("Hand"),
+                "calculate_total_winnings",
+                kwargs={"jokers": True},
+            ),
+        ],
+    ),
+    Day(
+        "day08",
+        [
+            Part(
+                "network",
+                with_parser("NetworkParser"),
+                "calculate_steps",
+                kwargs={"start": "AAA", "end": "ZZZ"},
+            ),
+            Part(
+                "network", with_parser("NetworkParser"), "calculate_simultaneous_steps"
+            ),
+        ],
+    ),
+    Day(
+        "day09",
+        [
+            Part(
+                "prediction",
+                plain,
+                "get_sum_of_predictions",
+                attributes={"direction": "forward"},
+            ),
+            Part(
+                "prediction",
+                plain,
+                "get_sum_of_predictions",
+                attributes={"direction": "backward"},
+            ),
+        ],
+    ),
+    Day(
+        "day10",
+        [
+            Part("pipe_maze", with_parser("GridParser"), "calculate_furthest_distance"),
+            Part("pipe_maze", with_parser("GridParser"), "get_enclosed_tiles_qty"),
+        ],
+    ),
+    Day(
+        "day11",
+        [
+            Part("galaxies", with_parser("GridParser"), "get_total_distance"),
+            Part(
+                "galaxies_part2",
+                with_parser("GridParser", 1000000),
+                "get_total_distance",
+            ),
+        ],
+    ),
+    Day(
+        "day12",
+        [
+            Part(
+                "springs", with_parser("SpringParser"), "get_total_arrangement_quantity"
+            ),
+            Part(
+                "springs",
+                with_parser("SpringParser"),
+                "get_total_folded_arrangement_quantity",
+            ),
+        ],
+    ),
+    Day(
+        "day13",
+        [
+            Part("mirrors", with_parser("PatternParser"), "get_summary"),
+            Part(
+                "mirrors",
+                with_parser("PatternParser"),
+                "get_summary",
+                kwargs={"is_smugged": True},
+            ),
+        ],
+    ),
+    Day(
+        "day14",
+        [
+            Part(
+                "reflector",
+                with_parser("GridParser"),
+                "calculate_load_in_direction",
+                args=("N",),
+            ),
+            Part(
+                "reflector",
+                with_parser("GridParser"),
+                "get_load_after_cycles",
+                args=(1000000000,),
+            ),
+        ],
+    ),
+    Day(
+        "day15",
+        [
+            Part("hashmap", plain, "get_hash_sum"),
+            Part("hashmap", plain, "get_total_focusing_power"),
+        ],
+    ),
+    Day(
+        "day16",
+        [
+            Part(
+                "energized_cells",
+                with_parser("GridParser"),
+                "get_energized_cell_qty",
+                kwargs={"init_cell": (0, 0), "init_direction": (0, 1)},
+            ),
+            Part(
+                "energized_cells",
+                with_parser("GridParser"),
+                "get_max_energized_cell_qty",
+            ),
+        ],
+    ),
+    Day(
+        "day18",
+        [
+            Part("polygon", with_parser("DigPlanParser"), "get_polygon_area"),
+            Part(
+                "polygon",
+                with_parser("DigPlanParser"),
+                "get_polygon_area",
+                kwargs={"hex_codes": True},
+            ),
+        ],
+    ),
+    Day(
+        "day19",
+        [
+            Part("xmas", with_parser("XmasParser"), "get_total_rating"),
+            Part(
+                "xmas2", with_parser("XmasRangeParser"), "get_all_combinations_qty_init"
+            ),
+        ],
+    ),
+    Day(
+        "day20",
+        [
+            Part(
+                "pulse",
+                with_parser("PulseParser"),
+                "get_total_pulse_product",
+                kwargs={"pushes": 1000},
+                fresh=True,
+            ),
+            Part(
+                "pulse", with_parser("PulseParser"), "get_min_button_pushes", fresh=True
+            ),
+        ],
+    ),
+    Day(
+        "day21",
+        [
+            Part(
+                "step_counter",
+                with_parser("GridParser"),
+                "get_destination_qty",
+                args=(64,),
+            ),
+        ],
+    ),
+    Day(
+        "day22",
+        [
+            Part(
+                "bricks", with_parser("BrickParser"), "calculate_disintegrated_bricks"
+            ),
+            Part(
+                "bricks",
+                with_parser("BrickParser"),
+                "calculate_falling_bricks",
+                slow=True,
+            ),
+        ],
+    ),
+    Day(
+        "day23",
+        [
+            Part("hiking", with_parser("GridParser"), "get_longest_path_distance"),
+        ],
+    ),
+    Day(
+        "day24",
+        [
+            Part(
+                "hailstone",
+                with_parser("HailstoneParser", HAILSTONE_BOUNDARIES),
+                "calculate_test_area_intersections",
+            ),
+        ],
+    ),
+]
+
+DAY_MAP = {day.name: day for day in DAYS}
+
+
+def get_days(names=None):
+    """
+    Returns registered days in order, optionally only the given ones.
+    Accepts both "day07" and "7".
+    """
+    if not names:
+        return list(DAYS)
+    days = []
+    for name in names:
+        if name.isdigit():
+            name = f"day{int(name):02d}"
+        if name not in DAY_MAP:
+            raise ValueError(f"No registered day with the name {name}")
+        days.append(DAY_MAP[name])
+    return days
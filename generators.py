@@ -0,0 +1,474 @@
+"""
+Synthetic input generators for the registered days.
+
+Every generator takes a size and a random.Random instance and returns the
+lines of a valid input for that day. What size means depends on the day and
+is written in each generator's docstring.
+
+Usage (from the repository root):
+    python generators.py day07 1000000          # writes day07/generated_1000000.txt
+    python generators.py day14 2000 --seed 7 --output /tmp/platform.txt
+"""
+
+import argparse
+import os
+import random
+import string
+
+from days import ROOT
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+CARDS = "AKQJT98765432"
+PIPE_CHARS = "|-LJ7F"
+
+
+def get_node_names(size):
+    """
+    Returns size distinct three letter node names, AAA and ZZZ included.
+    """
+    names = [
+        a + b + c
+        for a in string.ascii_uppercase
+        for b in string.ascii_uppercase
+        for c in string.ascii_uppercase
+    ]
+    if size > len(names):
+        raise ValueError(f"At most {len(names)} nodes can be generated")
+    middle = names[1:-1]
+    return ["AAA"] + middle[: size - 2] + ["ZZZ"]
+
+
+def generate_day01(size, rng):
+    """
+    size: number of calibration lines.
+    """
+    lines = []
+    for _ in range(size):
+        items = []
+        for _ in range(rng.randint(2, 8)):
+            choice = rng.random()
+            if choice < 0.3:
+                items.append(str(rng.randint(1, 9)))
+            elif choice < 0.6:
+                items.append(rng.choice(DIGIT_WORDS))
+            else:
+                items.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+        # part 1 needs at least one numeric character on every line
+        items.insert(rng.randint(0, len(items)), str(rng.randint(1, 9)))
+        lines.append("".join(items))
+    return lines
+
+
+def generate_day02(size, rng):
+    """
+    size: number of games.
+    """
+    lines = []
+    for game_id in range(1, size + 1):
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            sets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(sets))
+    return lines
+
+
+def generate_day03(size, rng):
+    """
+    size: side length of the square engine schematic.
+    """
+    lines = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            choice = rng.random()
+            if choice < 0.15:
+                row.extend(str(rng.randint(1, 999)))
+            elif choice < 0.2:
+                row.append(rng.choice("*#+$@/=%&-"))
+            else:
+                row.append(".")
+        lines.append("".join(row[:size]))
+    return lines
+
+
+def generate_day04(size, rng, winning_qty=10, player_qty=25):
+    """
+    size: number of cards.
+    """
+    lines = []
+    for card_id in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), winning_qty + player_qty)
+        winning_numbers = numbers[:winning_qty]
+        player_numbers = numbers[winning_qty:]
+        # most cards win nothing so that card copy chains stay short
+        matches = rng.choice([0, 0, 0, 1, 2, 3])
+        player_numbers[:matches] = winning_numbers[:matches]
+        rng.shuffle(player_numbers)
+        lines.append(
+            f"Card {card_id}: {' '.join(map(str, winning_numbers))}"
+            f" | {' '.join(map(str, player_numbers))}"
+        )
+    return lines
+
+
+def generate_day05(size, rng):
+    """
+    size: number of range lines in each of the seven maps.
+    """
+    maps = [
+        "seed-to-soil",
+        "soil-to-fertilizer",
+        "fertilizer-to-water",
+        "water-to-light",
+        "light-to-temperature",
+        "temperature-to-humidity",
+        "humidity-to-location",
+    ]
+    limit = 2**32
+    seeds = []
+    for _ in range(10):
+        seeds.extend([rng.randrange(limit // 2), rng.randrange(1, limit // 20)])
+    lines = ["seeds: " + " ".join(map(str, seeds)), ""]
+    for name in maps:
+        lines.append(f"{name} map:")
+        # non overlapping source ranges, like the real almanac
+        bounds = sorted(rng.sample(range(limit), 2 * size))
+        for i in range(size):
+            source, end = bounds[2 * i], bounds[2 * i + 1]
+            lines.append(
+                f"{rng.randrange(limit - (end - source))} {source} {end - source}"
+            )
+        lines.append("")
+    return lines[:-1]
+
+
+def generate_day07(size, rng):
+    """
+    size: number of hands.
+    """
+    return [
+        f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(size)
+    ]
+
+
+def generate_day08(size, rng):
+    """
+    size: number of nodes, at most 26**3.
+    All nodes form one cycle so every walk reaches a node ending with Z.
+    """
+    names = get_node_names(size)
+    order = names[1:-1]
+    rng.shuffle(order)
+    order = ["AAA"] + order + ["ZZZ"]
+    instructions = "".join(rng.choices("LR", k=rng.randint(200, 300)))
+    lines = [instructions, ""]
+    for i, name in enumerate(order):
+        next_name = order[(i + 1) % len(order)]
+        lines.append(f"{name} = ({next_name}, {next_name})")
+    return lines
+
+
+def generate_day09(size, rng, length=21):
+    """
+    size: number of sequences.
+    """
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-10, 10) for _ in range(rng.randint(1, 8))]
+        sequence = [
+            sum(c * x**power for power, c in enumerate(coefficients))
+            for x in range(length)
+        ]
+        lines.append(" ".join(map(str, sequence)))
+    return lines
+
+
+def generate_day10(size, rng):
+    """
+    size: side length of the square maze, at least 5.
+    The loop is a rectangle one tile inside the border with S on its right side,
+    tiles inside the loop are random junk pipe.
+    """
+    grid = [["."] * size for _ in range(size)]
+    last = size - 2
+    for j in range(2, last):
+        for i in range(2, last):
+            grid[j][i] = rng.choice(PIPE_CHARS + "..")
+    for i in range(1, last + 1):
+        grid[1][i] = grid[last][i] = "-"
+        grid[i][1] = grid[i][last] = "|"
+    grid[1][1], grid[1][last], grid[last][1], grid[last][last] = "F", "7", "L", "J"
+    grid[size // 2][last] = "S"
+    # S neighbors have to be pipes, only the loop ones may connect to it
+    grid[size // 2][last - 1] = grid[size // 2][last + 1] = "|"
+    return ["".join(row) for row in grid]
+
+
+def generate_day11(size, rng, density=0.02):
+    """
+    size: side length of the square universe.
+    """
+    return [
+        "".join("#" if rng.random() < density else "." for _ in range(size))
+        for _ in range(size)
+    ]
+
+
+def generate_day12(size, rng):
+    """
+    size: number of spring records.
+    Each record is a random arrangement with some of its springs hidden.
+    """
+    lines = []
+    for _ in range(size):
+        sizes = [rng.randint(1, 4) for _ in range(rng.randint(1, 5))]
+        springs = []
+        for group in sizes:
+            springs.extend("." * rng.randint(1, 2) + "#" * group)
+        springs.extend("." * rng.randint(0, 2))
+        springs = [
+            "?" if rng.random() < 0.5 else char for char in "".join(springs).lstrip(".")
+        ]
+        lines.append(f"{''.join(springs)} {','.join(map(str, sizes))}")
+    return lines
+
+
+def generate_day14(size, rng):
+    """
+    size: side length of the square platform.
+    """
+    return ["".join(rng.choices("O#...", k=size)) for _ in range(size)]
+
+
+def generate_day15(size, rng):
+    """
+    size: number of initialization steps.
+    """
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(size // 4, 1))
+    ]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        if rng.random() < 0.3:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+    return [",".join(steps)]
+
+
+def generate_day16(size, rng):
+    """
+    size: side length of the square contraption.
+    """
+    return [
+        "".join(rng.choice("/\\|-") if rng.random() < 0.1 else "." for _ in range(size))
+        for _ in range(size)
+    ]
+
+
+def generate_day18(size, rng):
+    """
+    size: number of dig instructions, rounded up to a multiple of two.
+    The trench is a staircase going right and down, closed by one left and
+    one up instruction. Hex codes describe the same staircase ten times larger.
+    """
+    steps = max((size - 2) // 2, 1)
+    moves = []
+    for _ in range(steps):
+        moves.append(("R", rng.randint(1, 20)))
+        moves.append(("D", rng.randint(1, 20)))
+    moves.append(("L", sum(distance for char, distance in moves if char == "R")))
+    moves.append(("U", sum(distance for char, distance in moves if char == "D")))
+    hex_directions = {"R": "0", "D": "1", "L": "2", "U": "3"}
+    return [
+        f"{char} {distance} (#{distance * 10:05x}{hex_directions[char]})"
+        for char, distance in moves
+    ]
+
+
+def generate_day19(size, rng, part_qty=200):
+    """
+    size: number of workflows.
+    Rules only send parts to workflows further down the list so every part
+    ends up accepted or rejected.
+    """
+    names = ["in"] + [
+        "".join(rng.choices(string.ascii_lowercase, k=4)) for _ in range(size - 1)
+    ]
+    names = list(dict.fromkeys(names))
+    lines = []
+    for i, name in enumerate(names):
+        later = names[i + 1 :]
+        rules = []
+        for _ in range(rng.randint(1, 4)):
+            destination = rng.choice(later + ["A", "R"] if later else ["A", "R"])
+            operator = rng.choice("<>")
+            rules.append(
+                f"{rng.choice('xmas')}{operator}{rng.randint(1, 4000)}:{destination}"
+            )
+        rules.append(rng.choice(later[:3] + ["A", "R"]))
+        lines.append(f"{name}{{{','.join(rules)}}}")
+    lines.append("")
+    for _ in range(part_qty):
+        values = [rng.randint(1, 4000) for _ in range(4)]
+        lines.append("{x=%d,m=%d,a=%d,s=%d}" % tuple(values))
+    return lines
+
+
+def generate_day20(size, rng):
+    """
+    size: number of flip-flops, split into four counters like the real input.
+    Each counter reports to its own conjunction which, through an inverter,
+    feeds zh and then rx.
+    """
+    chain_length = max(size // 4, 2)
+    lines = []
+    starts = []
+    for chain in range(4):
+        names = [f"f{chain}x{i}" for i in range(chain_length)]
+        conjunction = f"c{chain}"
+        starts.append(names[0])
+        for i, name in enumerate(names):
+            destinations = [names[i + 1]] if i + 1 < len(names) else []
+            if i == 0 or rng.random() < 0.5:
+                destinations.append(conjunction)
+            lines.append(f"%{name} -> {', '.join(destinations or [conjunction])}")
+        lines.append(f"&{conjunction} -> {names[0]}, i{chain}")
+        lines.append(f"&i{chain} -> zh")
+    lines.append("&zh -> rx")
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    return lines
+
+
+def generate_day21(size, rng):
+    """
+    size: side length of the square garden.
+    """
+    lines = [
+        "".join("#" if rng.random() < 0.1 else "." for _ in range(size))
+        for _ in range(size)
+    ]
+    middle = size // 2
+    lines[middle] = lines[middle][:middle] + "S" + lines[middle][middle + 1 :]
+    return lines
+
+
+def generate_day22(size, rng, footprint=10):
+    """
+    size: number of bricks.
+    Bricks start at separate heights so none of them overlap before falling.
+    """
+    lines = []
+    z = rng.randint(1, 3)
+    for _ in range(size):
+        axis = rng.choice((0, 1, 2))
+        length = rng.randint(0, 3)
+        start = [rng.randrange(footprint), rng.randrange(footprint), z]
+        end = list(start)
+        if axis < 2:
+            start[axis] = min(start[axis], footprint - 1 - length)
+            end[axis] = start[axis] + length
+            end[1 - axis] = start[1 - axis]
+        else:
+            end[2] = z + length
+        lines.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+        z = end[2] + rng.randint(1, 3)
+    return lines
+
+
+def generate_day23(size, rng):
+    """
+    size: number of corridors of a serpentine trail, rounded up to an odd number.
+    The trail is a single path, so the path search is linear in its length.
+    """
+    corridors = size if size % 2 else size + 1
+    width = max(size, 5)
+    height = 2 * corridors + 1
+    grid = [["#"] * width for _ in range(height)]
+    grid[0][1] = "."
+    for corridor in range(corridors):
+        row = 2 * corridor + 1
+        for i in range(1, width - 1):
+            grid[row][i] = "."
+        connector = width - 2 if corridor % 2 == 0 else 1
+        grid[row + 1][connector] = "."
+    return ["".join(row) for row in grid]
+
+
+def generate_day24(size, rng):
+    """
+    size: number of hailstones.
+    """
+    lines = []
+    for _ in range(size):
+        position = [rng.randint(150000000000000, 450000000000000) for _ in range(3)]
+        velocity = [rng.choice((-1, 1)) * rng.randint(1, 400) for _ in range(3)]
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+    return lines
+
+
+# day06 has no input file and day13 patterns need matching mirrors with
+# exactly one smudge, which random patterns hardly ever have.
+GENERATORS = {
+    "day01": generate_day01,
+    "day02": generate_day02,
+    "day03": generate_day03,
+    "day04": generate_day04,
+    "day05": generate_day05,
+    "day07": generate_day07,
+    "day08": generate_day08,
+    "day09": generate_day09,
+    "day10": generate_day10,
+    "day11": generate_day11,
+    "day12": generate_day12,
+    "day14": generate_day14,
+    "day15": generate_day15,
+    "day16": generate_day16,
+    "day18": generate_day18,
+    "day19": generate_day19,
+    "day20": generate_day20,
+    "day21": generate_day21,
+    "day22": generate_day22,
+    "day23": generate_day23,
+    "day24": generate_day24,
+}
+
+
+def get_generated_path(day_name, size):
+    return os.path.join(ROOT, day_name, f"generated_{size}.txt")
+
+
+def write_input(day_name, size, output=None, seed=0):
+    """
+    Generates an input for the day and writes it, returns the written path.
+    """
+    rng = random.Random(seed)
+    lines = GENERATORS[day_name](size, rng)
+    path = output or get_generated_path(day_name, size)
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+        f.write("\n")
+    return path
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("day", help="day to generate an input for, e.g. day07")
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="defaults to dayNN/generated_<size>.txt")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    day_name = arguments.day
+    if day_name.isdigit():
+        day_name = f"day{int(day_name):02d}"
+    print(write_input(day_name, arguments.size, arguments.output, arguments.seed))
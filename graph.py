@@ -0,0 +1,213 @@
+"""
+Graph algorithms shared by the grid and network days.
+
+Nodes are compact integer ids, usually flat grid indexes (see Grid.index)
+or positions in a list of names. A graph is given as a neighbors function
+returning the successors of a node, or as an adjacency list, whose
+__getitem__ is such a function. Everything is iterative, so long corridors
+and big mazes do not hit the recursion limit.
+"""
+
+from collections import deque
+
+
+def get_neighbors_function(graph):
+    return graph if callable(graph) else graph.__getitem__
+
+
+def bfs(sources, graph):
+    """
+    Yields every node reachable from sources once, in breadth-first order.
+    """
+    neighbors = get_neighbors_function(graph)
+    seen = set(sources)
+    queue = deque(seen)
+    while queue:
+        node = queue.popleft()
+        yield node
+        for neighbor in neighbors(node):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+
+
+def dfs(source, graph):
+    """
+    Yields every node reachable from source once, in depth-first preorder.
+    """
+    neighbors = get_neighbors_function(graph)
+    seen = set()
+    stack = [source]
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        yield node
+        # reversed, so the first neighbor is visited first like a recursive walk
+        stack.extend(reversed(list(neighbors(node))))
+
+
+def reachable(sources, graph):
+    """
+    Returns the set of nodes reachable from sources, sources included.
+    """
+    return set(bfs(sources, graph))
+
+
+def bfs_distances(sources, graph, max_distance=None):
+    """
+    Multi-source BFS. Returns {node: distance to the closest source} for every
+    node reachable within max_distance steps.
+    """
+    neighbors = get_neighbors_function(graph)
+    distances = dict.fromkeys(sources, 0)
+    frontier = list(distances)
+    distance = 0
+    while frontier and (max_distance is None or distance < max_distance):
+        distance += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors(node):
+                if neighbor not in distances:
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+
+def connected_components(nodes, graph):
+    """
+    Labels the connected components of an undirected graph restricted to
+    nodes. Returns {node: label} with labels counting up from 0.
+    """
+    neighbors = get_neighbors_function(graph)
+    nodes = set(nodes)
+    labels = {}
+    label = 0
+    for node in nodes:
+        if node in labels:
+            continue
+        labels[node] = label
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for neighbor in neighbors(current):
+                if neighbor in nodes and neighbor not in labels:
+                    labels[neighbor] = label
+                    stack.append(neighbor)
+        label += 1
+    return labels
+
+
+def strongly_connected_components(nodes, graph):
+    """
+    Iterative Tarjan. Returns the components as lists of nodes, each one
+    after every component it has an edge to (reverse topological order).
+    """
+    neighbors = get_neighbors_function(graph)
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(neighbors(root)))]
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = low[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(neighbors(successor))))
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def condensation(nodes, graph):
+    """
+    Collapses every strongly connected component into one node.
+    Returns (components, component of every node, DAG adjacency list between
+    component ids). Component ids are in reverse topological order.
+    """
+    neighbors = get_neighbors_function(graph)
+    components = strongly_connected_components(nodes, graph)
+    component_of = {}
+    for i, component in enumerate(components):
+        for node in component:
+            component_of[node] = i
+    dag = [set() for _ in components]
+    for i, component in enumerate(components):
+        for node in component:
+            for neighbor in neighbors(node):
+                j = component_of[neighbor]
+                if j != i:
+                    dag[i].add(j)
+    return components, component_of, [sorted(edges) for edges in dag]
+
+
+def topological_order(nodes, graph):
+    """
+    Kahn's algorithm. Raises ValueError if the graph has a cycle.
+    """
+    neighbors = get_neighbors_function(graph)
+    nodes = list(nodes)
+    in_degrees = dict.fromkeys(nodes, 0)
+    for node in nodes:
+        for neighbor in neighbors(node):
+            in_degrees[neighbor] += 1
+    queue = deque(node for node in nodes if not in_degrees[node])
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for neighbor in neighbors(node):
+            in_degrees[neighbor] -= 1
+            if not in_degrees[neighbor]:
+                queue.append(neighbor)
+    if len(order) != len(in_degrees):
+        raise ValueError("graph has a cycle")
+    return order
+
+
+def dag_longest_path(nodes, edges, source, target):
+    """
+    Returns the length of the longest source to target path of a DAG whose
+    edges[node] are (neighbor, weight) pairs, None if target is unreachable.
+    Raises ValueError if the graph has a cycle, relaxing edges in an order
+    that does not exist would return a wrong length instead.
+    """
+    order = topological_order(
+        nodes, lambda node: [neighbor for neighbor, _ in edges[node]]
+    )
+    lengths = {source: 0}
+    for node in order:
+        if node not in lengths:
+            continue
+        for neighbor, weight in edges[node]:
+            length = lengths[node] + weight
+            if length > lengths.get(neighbor, -1):
+                lengths[neighbor] = length
+    return lengths.get(target)
@@ -0,0 +1,207 @@
+"""
+Compact character grid shared by the map based days.
+
+Cells are stored row by row in one flat bytearray, so a cell is one byte
+instead of a one character string in a list of lists. Cells are addressed
+either by (row, col) or by their flat index row * width + col, which is what
+the hot loops of the solvers should use.
+"""
+
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class Grid:
+    def __init__(self, width, height, cells=None, fill="."):
+        self.width = width
+        self.height = height
+        if cells is None:
+            cells = bytearray(fill.encode()) * (width * height)
+        if len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cells do not fit a {width}x{height} grid")
+        self.cells = bytearray(cells)
+        self._masks = None
+
+    @classmethod
+    def from_lines(cls, lines):
+        lines = [
+            line.encode() if isinstance(line, str) else bytes(line) for line in lines
+        ]
+        width = len(lines[0]) if lines else 0
+        for row, line in enumerate(lines):
+            # a ragged row would shift every cell after it into the wrong column
+            if len(line) != width:
+                raise ValueError(f"row {row} has {len(line)} cells, expected {width}")
+        return cls(width, len(lines), b"".join(lines))
+
+    def __repr__(self):
+        return f"Grid({self.width}x{self.height})"
+
+    def __str__(self):
+        return "\n".join(self.lines())
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self.row(row)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Grid)
+            and self.width == other.width
+            and self.cells == other.cells
+        )
+
+    def __getitem__(self, position):
+        return chr(self.cells[position[0] * self.width + position[1]])
+
+    def __setitem__(self, position, char):
+        self.cells[position[0] * self.width + position[1]] = ord(char)
+
+    def copy(self):
+        return Grid(self.width, self.height, self.cells)
+
+    def lines(self):
+        return [bytes(row).decode() for row in self]
+
+    def index(self, row, col):
+        return row * self.width + col
+
+    def position(self, index):
+        return divmod(index, self.width)
+
+    def is_valid(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def find(self, char, start=0):
+        """
+        Returns the flat index of the first cell holding char, -1 if none.
+        """
+        return self.cells.find(char.encode(), start)
+
+    def find_all(self, char):
+        code = char.encode()
+        index = self.cells.find(code)
+        while index != -1:
+            yield index
+            index = self.cells.find(code, index + 1)
+
+    def row(self, row):
+        """
+        Returns a zero-copy memoryview of a row.
+        """
+        start = row * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def col(self, col):
+        """
+        Returns a zero-copy strided memoryview of a column.
+        """
+        return memoryview(self.cells)[col :: self.width]
+
+    def padded(self, fill="."):
+        """
+        Returns a new grid with a one cell wide border of fill around this one.
+        """
+        width = self.width + 2
+        code = fill.encode()
+        border = code * width
+        rows = [code + bytes(row) + code for row in self]
+        return Grid(width, self.height + 2, border + b"".join(rows) + border)
+
+    def get_offsets(self):
+        """
+        Flat index offsets of DIRECTIONS.
+        """
+        return tuple(row * self.width + col for row, col in DIRECTIONS)
+
+    def get_masks(self):
+        """
+        Returns one bytearray per direction in DIRECTIONS holding 1 for every
+        cell whose neighbor in that direction is inside the grid. Computed
+        once and reused until the grid shape changes.
+        """
+        if self._masks is None:
+            width, height = self.width, self.height
+            inner_row = b"\x01" * (width - 1)
+            right = bytearray((inner_row + b"\x00") * height)
+            left = bytearray((b"\x00" + inner_row) * height)
+            down = bytearray(b"\x01" * (width * (height - 1)) + b"\x00" * width)
+            up = bytearray(b"\x00" * width + b"\x01" * (width * (height - 1)))
+            self._masks = (right, left, down, up)
+        return self._masks
+
+    def neighbors(self, index):
+        """
+        Yields flat indexes of the in-bounds neighbors of a cell.
+        """
+        for mask, offset in zip(self.get_masks(), self.get_offsets()):
+            if mask[index]:
+                yield index + offset
+
+    def _reset_shape(self, width, height):
+        self.width = width
+        self.height = height
+        self._masks = None
+
+    def transpose(self):
+        """
+        Transposes the grid in place. Square grids only use a row sized
+        temporary buffer, other shapes need one grid sized buffer.
+        """
+        width, height, cells = self.width, self.height, self.cells
+        if width == height:
+            for j in range(height - 1):
+                row_start = j * width + j + 1
+                row_end = (j + 1) * width
+                col_start = (j + 1) * width + j
+                row_part = cells[row_start:row_end]
+                cells[row_start:row_end] = cells[col_start::width]
+                cells[col_start::width] = row_part
+        else:
+            cells[:] = b"".join(cells[col::width] for col in range(width))
+            self._reset_shape(height, width)
+        return self
+
+    def flip_rows(self):
+        """
+        Reverses every row in place (mirror on the vertical axis).
+        """
+        width, cells = self.width, self.cells
+        for start in range(0, len(cells), width):
+            row = cells[start : start + width]
+            row.reverse()
+            cells[start : start + width] = row
+        return self
+
+    def flip_cols(self):
+        """
+        Reverses the order of rows in place (mirror on the horizontal axis).
+        """
+        width, cells = self.width, self.cells
+        for j in range(self.height // 2):
+            top = j * width
+            bottom = (self.height - 1 - j) * width
+            row = cells[top : top + width]
+            cells[top : top + width] = cells[bottom : bottom + width]
+            cells[bottom : bottom + width] = row
+        return self
+
+    def rotate_clockwise(self):
+        return self.transpose().flip_rows()
+
+    def rotate_counter_clockwise(self):
+        return self.transpose().flip_cols()
+
+    def rotate_180(self):
+        self.cells.reverse()
+        return self
+
+
+class GridParser:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def parse(self):
+        return Grid.from_lines(self.lines)
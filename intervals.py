@@ -0,0 +1,170 @@
+"""
+Interval and box algebra on plain tuples.
+
+An interval is an inclusive (start, end) tuple of ints, empty intervals are
+None. A box is a tuple of intervals, one per dimension, e.g. the four rating
+ranges of a day19 part. IntervalSet keeps a sorted list of disjoint,
+non-adjacent intervals, so repeatedly splitting and mapping ranges does not
+fragment them.
+"""
+
+from bisect import bisect_right
+
+
+def length(interval):
+    return interval[1] - interval[0] + 1
+
+
+def intersect(a, b):
+    start = max(a[0], b[0])
+    end = min(a[1], b[1])
+    return (start, end) if start <= end else None
+
+
+def subtract(a, b):
+    """
+    Returns the parts of a outside of b, at most two intervals.
+    """
+    if b[1] < a[0] or b[0] > a[1]:
+        return [a]
+    parts = []
+    if a[0] < b[0]:
+        parts.append((a[0], b[0] - 1))
+    if b[1] < a[1]:
+        parts.append((b[1] + 1, a[1]))
+    return parts
+
+
+def split(interval, value):
+    """
+    Splits an interval into its values below value and its values from value
+    on. Either side is None when empty.
+    """
+    start, end = interval
+    if value <= start:
+        return None, interval
+    if value > end:
+        return interval, None
+    return (start, value - 1), (value, end)
+
+
+def shift(interval, offset):
+    return (interval[0] + offset, interval[1] + offset)
+
+
+def coalesce(intervals):
+    """
+    Returns intervals sorted, with overlapping and adjacent ones merged and
+    empty ones dropped.
+    """
+    merged = []
+    intervals = [
+        interval for interval in intervals if interval and interval[0] <= interval[1]
+    ]
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class IntervalSet:
+    def __init__(self, intervals=()):
+        self.intervals = coalesce(intervals)
+
+    def __repr__(self):
+        return f"IntervalSet({self.intervals})"
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def __bool__(self):
+        return bool(self.intervals)
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __contains__(self, value):
+        i = bisect_right(self.intervals, (value, float("inf"))) - 1
+        return i >= 0 and self.intervals[i][1] >= value
+
+    def min(self):
+        return self.intervals[0][0]
+
+    def size(self):
+        return sum(length(interval) for interval in self.intervals)
+
+    def intersect(self, interval):
+        """
+        Returns the intervals of the set inside interval.
+        """
+        start = max(bisect_right(self.intervals, (interval[0],)) - 1, 0)
+        parts = []
+        for current in self.intervals[start:]:
+            if current[0] > interval[1]:
+                break
+            part = intersect(current, interval)
+            if part:
+                parts.append(part)
+        return parts
+
+    def subtract(self, interval):
+        remaining = []
+        for current in self.intervals:
+            remaining.extend(subtract(current, interval))
+        self.intervals = remaining
+
+    def union(self, intervals):
+        self.intervals = coalesce(self.intervals + list(intervals))
+
+
+def volume(box):
+    product = 1
+    for interval in box:
+        product *= length(interval)
+    return product
+
+
+def intersect_boxes(a, b):
+    intervals = []
+    for interval_a, interval_b in zip(a, b):
+        interval = intersect(interval_a, interval_b)
+        if interval is None:
+            return None
+        intervals.append(interval)
+    return tuple(intervals)
+
+
+def split_box(box, axis, value):
+    """
+    Splits a box on one axis into the box below value and the box from value
+    on. Either side is None when empty.
+    """
+    below, above = split(box[axis], value)
+    return (
+        below and box[:axis] + (below,) + box[axis + 1 :],
+        above and box[:axis] + (above,) + box[axis + 1 :],
+    )
+
+
+def subtract_boxes(a, b):
+    """
+    Returns disjoint boxes covering the part of a outside of b.
+    """
+    if intersect_boxes(a, b) is None:
+        return [a]
+    parts = []
+    current = a
+    for axis, interval in enumerate(b):
+        below, current = split_box(current, axis, interval[0])
+        if below:
+            parts.append(below)
+        current, above = split_box(current, axis, interval[1] + 1)
+        if above:
+            parts.append(above)
+    return parts
@@ -0,0 +1,286 @@
+"""
+Memory-mapped input loading shared by every App.
+
+The file is mapped instead of read, so lines can be handed out as zero-copy
+memoryview slices or plain byte offsets into the mapping. read_lines is the
+fast path for small and medium inputs: it decodes and splits the whole
+buffer once instead of stripping and appending one line at a time.
+
+gzip, bz2 and xz inputs are recognized by their magic bytes and read without
+writing the decompressed file anywhere. InputFile keeps the decompressor open
+instead of a mapping and streams it in large blocks for every way of reading
+the lines, so the whole decompressed input is never held as bytes.
+"""
+
+import bz2
+import contextlib
+import gzip
+import lzma
+import mmap
+import os
+from array import array
+
+BLOCK_SIZE = 1 << 20
+# (magic bytes, module opening the format)
+COMPRESSIONS = (
+    (b"\x1f\x8b", gzip),
+    (b"BZh", bz2),
+    (b"\xfd7zXZ\x00", lzma),
+)
+
+
+def get_compression(file):
+    """
+    Returns the module opening a compressed file (gzip, bz2 or lzma), None
+    for a plain one. file is a path or a binary file, which is rewound.
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, "rb") as f:
+            magic = f.read(6)
+    else:
+        magic = file.read(6)
+        file.seek(0)
+    for prefix, module in COMPRESSIONS:
+        if magic.startswith(prefix):
+            return module
+    return None
+
+
+class InputFile:
+    """
+    Context manager around a memory-mapped input file, or around a
+    decompressing stream for compressed inputs. For plain files, source is
+    the mapping and buffer a memoryview of it. Both are None for compressed
+    files; get_size, find and read work on either kind.
+    Views handed out by it are only valid inside the with block.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.file = None
+        self.map = None
+        self.stream = None
+        self.source = b""
+        self.buffer = None
+        self.size = None
+
+    def __enter__(self):
+        self.file = open(self.file_path, "rb")
+        compression = get_compression(self.file)
+        if compression is not None:
+            self.stream = compression.open(self.file, "rb")
+            self.source = None
+            return self
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.source = self.map
+            self.buffer = memoryview(self.map)
+        except ValueError:
+            # empty files can not be mapped
+            self.buffer = memoryview(b"")
+        return self
+
+    def __exit__(self, *args):
+        if self.stream is not None:
+            self.stream.close()
+        else:
+            self.buffer.release()
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                # views kept past the with block, the mapping closes with them
+                pass
+        self.file.close()
+
+    def iter_stream_lines(self):
+        """
+        Yields the lines of the decompressed stream from its start.
+        """
+        self.stream.seek(0)
+        return iter_raw_lines(self.stream)
+
+    def get_size(self):
+        """
+        Returns the (decompressed) size of the input in bytes.
+        """
+        if self.stream is None:
+            return len(self.source)
+        if self.size is None:
+            self.stream.seek(0)
+            self.size = 0
+            while block := self.stream.read(BLOCK_SIZE):
+                self.size += len(block)
+        return self.size
+
+    def find(self, sub, start=0):
+        """
+        Returns the lowest index of sub at or after start, -1 if not found.
+        """
+        if self.stream is None:
+            return self.source.find(sub, start)
+        self.stream.seek(start)
+        # the end of the previous block, in case sub spans two blocks
+        tail = b""
+        offset = start
+        while block := self.stream.read(BLOCK_SIZE):
+            data = tail + block
+            index = data.find(sub)
+            if index != -1:
+                return offset - len(tail) + index
+            tail = data[len(data) - len(sub) + 1 :] if len(sub) > 1 else b""
+            offset += len(block)
+        return -1
+
+    def read(self, start, end):
+        """
+        Returns the bytes from start to end.
+        """
+        if self.stream is None:
+            return bytes(self.buffer[start:end])
+        self.stream.seek(start)
+        return self.stream.read(end - start)
+
+    def get_line_offsets(self):
+        """
+        Returns an array with the start offset of every line followed by the
+        end of the buffer, so line i spans offsets[i]:offsets[i + 1] - 1.
+        """
+        offsets = array("q", [0])
+        if self.stream is not None:
+            for line in self.iter_stream_lines():
+                offsets.append(offsets[-1] + len(line) + 1)
+            return offsets
+        source = self.source
+        end = len(source)
+        index = source.find(b"\n")
+        while index != -1:
+            offsets.append(index + 1)
+            index = source.find(b"\n", index + 1)
+        if offsets[-1] != end:
+            # last line without a trailing newline
+            offsets.append(end + 1)
+        return offsets
+
+    def iter_views(self):
+        """
+        Yields a zero-copy memoryview of every line without its line ending.
+        Views of compressed inputs are of the decompressed line only.
+        """
+        if self.stream is not None:
+            for line in self.iter_stream_lines():
+                yield memoryview(line[:-1] if line.endswith(b"\r") else line)
+            return
+        source = self.source
+        buffer = self.buffer
+        start = 0
+        end = len(source)
+        while start < end:
+            index = source.find(b"\n", start)
+            if index == -1:
+                index = end
+            stop = index
+            if stop > start and buffer[stop - 1] == 13:  # "\r"
+                stop -= 1
+            yield buffer[start:stop]
+            start = index + 1
+
+    def iter_lines(self):
+        """
+        Yields every line as stripped bytes, one line in memory at a time.
+        """
+        if self.stream is not None:
+            for line in self.iter_stream_lines():
+                yield line.strip()
+            return
+        for view in self.iter_views():
+            yield view.tobytes().strip()
+
+    def read_lines(self):
+        """
+        Returns every line as a stripped string, splitting the buffer once.
+        Compressed inputs are decoded line by line as they are streamed.
+        """
+        if self.stream is not None:
+            return [line.decode().strip() for line in self.iter_stream_lines()]
+        # only "\n" ends a line, as when iterating the file, splitlines would
+        # also split on form feeds, "\x1c" and other separators
+        lines = str(self.buffer, "utf-8").split("\n")
+        if not lines[-1]:
+            # the text ends with a newline, or is empty
+            lines.pop()
+        # strip returns the same object when there is nothing to strip, and
+        # removes the "\r" of "\r\n" line endings
+        return [line.strip() for line in lines]
+
+
+# {absolute path: lines} while inside share_lines, None outside of it
+_shared_lines = None
+
+
+@contextlib.contextmanager
+def share_lines():
+    """
+    Inside the block every file is read and split only once by read_lines,
+    later calls for the same file get a copy of the same lines. Used to
+    parse the input of both parts of a day once.
+    """
+    global _shared_lines
+    previous = _shared_lines
+    _shared_lines = {}
+    try:
+        yield
+    finally:
+        _shared_lines = previous
+
+
+def read_lines(file_path):
+    if _shared_lines is not None:
+        key = os.path.abspath(file_path)
+        if key not in _shared_lines:
+            with InputFile(file_path) as input_file:
+                _shared_lines[key] = input_file.read_lines()
+        # callers may change their list, the strings are immutable
+        return list(_shared_lines[key])
+    with InputFile(file_path) as input_file:
+        return input_file.read_lines()
+
+
+def iter_lines(file_path, decode=True):
+    """
+    Yields stripped lines one at a time, so inputs larger than memory can be
+    processed in one pass. Lines are bytes when decode is False.
+    """
+    with InputFile(file_path) as input_file:
+        for line in input_file.iter_lines():
+            yield line.decode() if decode else line
+
+
+def iter_raw_lines(file, block_size=BLOCK_SIZE):
+    """
+    Yields the lines of a binary file without their newline, read block_size
+    bytes at a time. A line spanning blocks is collected in a bytearray, so
+    very long lines (the single line of day15) still take linear time.
+    """
+    pending = bytearray()
+    while block := file.read(block_size):
+        index = block.find(b"\n")
+        if index == -1:
+            pending += block
+            continue
+        pending += block[:index]
+        yield bytes(pending)
+        lines = block[index + 1 :].split(b"\n")
+        pending = bytearray(lines.pop())
+        yield from lines
+    if pending:
+        yield bytes(pending)
+
+
+def iter_block_lines(file, block_size=BLOCK_SIZE):
+    """
+    Yields the stripped lines of a binary file read block_size bytes at a
+    time, like InputFile.iter_lines without the whole file in memory.
+    """
+    for line in iter_raw_lines(file, block_size):
+        yield line.strip()
@@ -0,0 +1,222 @@
+"""
+Record-parallel map-reduce for the days whose answer is a sum over records.
+
+The input file is cut into chunks at byte offsets right after a separator
+(a newline, or a comma for the single line of day15), so no record is split
+between two chunks. Every worker process maps whole chunks on its own: it
+reads its byte range from the memory-mapped file, parses the records and
+solves them. The partial results are reduced in chunk order, so the answer
+does not depend on the number of workers or on which one finishes first.
+A map function takes the file path and the records of one chunk and returns
+its partial result, a reduce function takes the partial results in chunk
+order and returns the answer.
+
+Usage (from the repository root):
+    python mapreduce.py 12 2                      # day12 part 2 on every core
+    python mapreduce.py day07 1 path/to/hands.txt --workers 8 --chunks 64
+"""
+
+import argparse
+import heapq
+import importlib
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from days import CUBE_LIMITS, get_days
+from loader import InputFile
+from scanner import scan_ints
+
+
+def get_chunks(file_path, qty, separator=b"\n"):
+    """
+    Returns about qty (start, end) byte ranges covering the file, every one
+    but the last ending right after a separator.
+    """
+    with InputFile(file_path) as input_file:
+        size = input_file.get_size()
+        bounds = [0]
+        for i in range(1, qty):
+            target = max(size * i // qty, bounds[-1])
+            index = input_file.find(separator, target) if size else -1
+            if index == -1:
+                break
+            if index + 1 > bounds[-1]:
+                bounds.append(index + 1)
+    if bounds[-1] != size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def read_records(file_path, start, end, separator=b"\n"):
+    """
+    Returns the stripped, non-empty records of a byte range of the file.
+    """
+    with InputFile(file_path) as input_file:
+        chunk = input_file.read(start, end)
+    records = (record.strip() for record in chunk.split(separator))
+    return [record for record in records if record]
+
+
+def get_cube_app(file_path):
+    module = importlib.import_module("day02.cubes")
+    return module, module.App(file_path, module.CubeDataParser, CUBE_LIMITS)
+
+
+def map_valid_ids(file_path, records):
+    module, app = get_cube_app(file_path)
+    parser = module.CubeDataParser(record.decode() for record in records)
+    return sum(id for id, sets in parser.iter_records() if app.is_valid_sets(sets))
+
+
+def map_powers(file_path, records):
+    module, app = get_cube_app(file_path)
+    parser = module.CubeDataParser(record.decode() for record in records)
+    return sum(app.get_power(sets) for _, sets in parser.iter_records())
+
+
+def get_hand_values(hand_class_name, records):
+    """
+    Returns the (value, bid) of every hand, sorted by value. Equal hands
+    keep their file order.
+    """
+    module = importlib.import_module("day07.camel_cards")
+    hand_class = getattr(module, hand_class_name)
+    values = []
+    for record in records:
+        hand, bid = record.split()
+        values.append((hand_class(hand.decode()).get_total_value(), int(bid)))
+    values.sort(key=itemgetter(0))
+    return values
+
+
+def map_hand_values(file_path, records):
+    return get_hand_values("Hand", records)
+
+
+def map_joker_hand_values(file_path, records):
+    return get_hand_values("JokerHand", records)
+
+
+def map_predictions(file_path, records, direction):
+    module = importlib.import_module("day09.prediction")
+    app = module.App(file_path)
+    app.direction = direction
+    return sum(app.get_prediction(scan_ints(record)) for record in records)
+
+
+def map_forward_predictions(file_path, records):
+    return map_predictions(file_path, records, "forward")
+
+
+def map_backward_predictions(file_path, records):
+    return map_predictions(file_path, records, "backward")
+
+
+def map_arrangements(file_path, records, folds=1):
+    module = importlib.import_module("day12.springs")
+    app = module.App(file_path, module.SpringParser)
+    total = 0
+    for springs, sizes in module.SpringParser(records).iter_records():
+        record = ("?".join([springs] * folds), sizes * folds)
+        total += app.get_arrangement_quantity(record)
+    return total
+
+
+def map_folded_arrangements(file_path, records):
+    return map_arrangements(file_path, records, folds=5)
+
+
+def map_hashes(file_path, records):
+    module = importlib.import_module("day15.hashmap")
+    app = module.App(file_path)
+    return sum(app.get_hash_value(record.decode()) for record in records)
+
+
+def reduce_ranks(partials):
+    """
+    Merges the sorted (value, bid) lists, the answer is the sum of
+    rank * bid. heapq.merge is stable, so equal hands keep their file order.
+    """
+    merged = heapq.merge(*partials, key=itemgetter(0))
+    return sum(rank * bid for rank, (_, bid) in enumerate(merged, 1))
+
+
+class Job:
+    def __init__(self, map_records, reduce=sum, separator=b"\n"):
+        self.map_records = map_records
+        self.reduce = reduce
+        self.separator = separator
+
+
+# (day, part number): Job
+JOBS = {
+    ("day02", 1): Job(map_valid_ids),
+    ("day02", 2): Job(map_powers),
+    ("day07", 1): Job(map_hand_values, reduce_ranks),
+    ("day07", 2): Job(map_joker_hand_values, reduce_ranks),
+    ("day09", 1): Job(map_forward_predictions),
+    ("day09", 2): Job(map_backward_predictions),
+    ("day12", 1): Job(map_arrangements),
+    ("day12", 2): Job(map_folded_arrangements),
+    ("day15", 1): Job(map_hashes, separator=b","),
+}
+
+
+def map_chunk(day_name, number, file_path, start, end):
+    job = JOBS[day_name, number]
+    records = read_records(file_path, start, end, job.separator)
+    return job.map_records(file_path, records)
+
+
+class MapReduce:
+    def __init__(self, day_name, number, file_path, workers=None, chunks=None):
+        if (day_name, number) not in JOBS:
+            raise ValueError(f"{day_name} part {number} has no map-reduce job")
+        self.day_name = day_name
+        self.number = number
+        self.file_path = file_path
+        self.workers = workers or os.cpu_count()
+        # a few chunks per worker, so one slow chunk does not hold up the rest
+        self.chunks = chunks or self.workers * 4
+
+    def run(self):
+        job = JOBS[self.day_name, self.number]
+        chunks = get_chunks(self.file_path, self.chunks, job.separator)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            partials = executor.map(
+                map_chunk,
+                itertools.repeat(self.day_name),
+                itertools.repeat(self.number),
+                itertools.repeat(self.file_path),
+                [start for start, _ in chunks],
+                [end for _, end in chunks],
+            )
+            # executor.map yields in chunk order
+            return job.reduce(list(partials))
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("day", help="day to solve, e.g. 12 or day12")
+    parser.add_argument("part", type=int, choices=(1, 2))
+    parser.add_argument(
+        "input", nargs="?", help="input file, the day's input.txt by default"
+    )
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--chunks", type=int, help="number of chunks, 4 per worker")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    day = get_days([arguments.day])[0]
+    file_path = arguments.input or day.get_input_path()
+    start = time.perf_counter()
+    answer = MapReduce(
+        day.name, arguments.part, file_path, arguments.workers, arguments.chunks
+    ).run()
+    print(answer)
+    print(f"{time.perf_counter() - start:.3f} s")
@@ -0,0 +1,144 @@
+"""
+Bounded memoization of the recursive solver methods.
+
+functools.cache on a method keeps every call, and the instance with it, for
+as long as the class lives. memoize instead keeps one Memo per instance, in
+the instance's __dict__, so the table goes away with its App and a copied
+App takes a copy of it along. A Memo evicts its least recently used entries
+once it holds more than max_size entries or, with max_bytes, once the keys
+and values it holds add up to more than max_bytes (as measured by
+sys.getsizeof, so the sizes of containers do not include their items).
+
+A key function turns the arguments into the memo key, e.g. the lengths of
+a (springs, sizes) suffix of the record being counted instead of the str
+slice and the tuple of ints themselves. Every Memo counts its hits, misses
+and evictions.
+
+    class App:
+        @memoize(max_size=None, key=get_suffix_lengths)
+        def get_sub_arrangement_quantity(self, record):
+            ...
+
+    get_memos(app)["get_sub_arrangement_quantity"].get_stats()
+"""
+
+import functools
+import sys
+from collections import OrderedDict
+
+ATTRIBUTE_PREFIX = "_memo_"
+MAX_SIZE = 2**16
+
+
+def get_entry_size(key, value):
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class Memo:
+    def __init__(self, max_size=MAX_SIZE, max_bytes=None):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        # key -> (value, size in bytes), least recently used first
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        size = get_entry_size(key, value) if self.max_bytes is not None else 0
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[1]
+        self.entries[key] = (value, size)
+        self.nbytes += size
+        if self.max_size is not None or self.max_bytes is not None:
+            self.evict()
+
+    def is_full(self):
+        if self.max_size is not None and len(self.entries) > self.max_size:
+            return True
+        return self.max_bytes is not None and self.nbytes > self.max_bytes
+
+    def evict(self):
+        while self.entries and self.is_full():
+            _, (_, size) = self.entries.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "nbytes": self.nbytes,
+        }
+
+
+def memoize(max_size=MAX_SIZE, max_bytes=None, key=None):
+    """
+    Decorator memoizing a method per instance. key is called with the
+    arguments after self and returns the memo key, by default the tuple of
+    the positional arguments. max_size or max_bytes set to None is no
+    bound on it.
+    """
+
+    def decorator(method):
+        attribute = ATTRIBUTE_PREFIX + method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            memo = self.__dict__.get(attribute)
+            if memo is None:
+                memo = self.__dict__[attribute] = Memo(max_size, max_bytes)
+            memo_key = key(*args) if key else args
+            # Memo.get inlined, this runs on every call of the recursion
+            entry = memo.entries.get(memo_key)
+            if entry is not None:
+                memo.hits += 1
+                memo.entries.move_to_end(memo_key)
+                return entry[0]
+            memo.misses += 1
+            value = method(self, *args)
+            memo.put(memo_key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def get_memos(instance):
+    """
+    Returns {method name: Memo} of the memoized methods of an instance that
+    have been called.
+    """
+    return {
+        name[len(ATTRIBUTE_PREFIX) :]: memo
+        for name, memo in vars(instance).items()
+        if name.startswith(ATTRIBUTE_PREFIX)
+    }
+
+
+def clear_memos(instance):
+    for memo in get_memos(instance).values():
+        memo.clear()
@@ -0,0 +1,170 @@
+"""
+Memory mode for the day solutions.
+
+MemoryTracker runs one step (a parse or a part) at a time and records its
+peak traced memory, its peak resident set size and the allocation sites
+holding the most memory when it ends. With a budget, a watchdog thread
+polls the traced memory and interrupts the step as soon as it goes over,
+raising MemoryBudgetExceeded with the largest allocation sites at that
+moment instead of letting the process grow until the OOM killer ends it.
+
+Usage (from the repository root):
+    python runner.py 12 14 --memory
+    python runner.py 12 --memory-budget 200     # MiB of traced memory
+"""
+
+import _thread
+import resource
+import threading
+import tracemalloc
+
+MIB = 1024 * 1024
+CLEAR_REFS_PATH = "/proc/self/clear_refs"
+STATUS_PATH = "/proc/self/status"
+
+
+def reset_peak_rss():
+    """
+    Resets the peak RSS of the process where the kernel supports it (Linux).
+    Returns False if the peak can only be read for the process lifetime.
+    """
+    try:
+        with open(CLEAR_REFS_PATH, "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def get_peak_rss():
+    """
+    Returns the peak resident set size in bytes.
+    """
+    try:
+        with open(STATUS_PATH) as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # kilobytes on Linux, bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def get_top_sites(snapshot, limit):
+    """
+    Returns (file:line, size, count) of the allocation sites holding the most
+    memory in a snapshot.
+    """
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    sites = []
+    for statistic in snapshot.statistics("lineno")[:limit]:
+        frame = statistic.traceback[0]
+        sites.append(
+            (f"{frame.filename}:{frame.lineno}", statistic.size, statistic.count)
+        )
+    return sites
+
+
+def format_sites(sites):
+    return "\n".join(
+        f"  {size / MIB:10.2f} MiB  {count:>9} blocks  {site}"
+        for site, size, count in sites
+    )
+
+
+class MemoryBudgetExceeded(Exception):
+    def __init__(self, label, used, budget, sites):
+        self.label = label
+        self.used = used
+        self.budget = budget
+        self.sites = sites
+        super().__init__(
+            f"{label} went over the memory budget:"
+            f" {used / MIB:.1f} MiB > {budget / MIB:.1f} MiB"
+        )
+
+    def get_report(self):
+        return f"{self}\n{format_sites(self.sites)}"
+
+
+class Usage:
+    def __init__(self, label, traced_peak, rss_peak, sites):
+        self.label = label
+        self.traced_peak = traced_peak
+        self.rss_peak = rss_peak
+        self.sites = sites
+
+
+class MemoryTracker:
+    def __init__(self, budget=None, limit=5, interval=0.01):
+        self.budget = budget
+        self.limit = limit
+        self.interval = interval
+        self.usages = []
+        self.exceeded = None
+
+    def watch(self, label, done):
+        while not done.wait(self.interval):
+            used = tracemalloc.get_traced_memory()[0]
+            if used > self.budget:
+                sites = get_top_sites(tracemalloc.take_snapshot(), self.limit)
+                self.exceeded = MemoryBudgetExceeded(label, used, self.budget, sites)
+                _thread.interrupt_main()
+                return
+
+    def measure(self, label, function, *args, **kwargs):
+        """
+        Calls function, records its memory usage under label and returns
+        its result. Must be called from the main thread when a budget is set.
+        """
+        reset_peak_rss()
+        self.exceeded = None
+        done = threading.Event()
+        watchdog = None
+        tracemalloc.start()
+        try:
+            if self.budget:
+                watchdog = threading.Thread(
+                    target=self.watch, args=(label, done), daemon=True
+                )
+                watchdog.start()
+            # the interrupt may land after function has returned, while the
+            # watchdog is being stopped, so that is handled here too
+            try:
+                try:
+                    result = function(*args, **kwargs)
+                finally:
+                    done.set()
+                    if watchdog is not None:
+                        watchdog.join()
+            except KeyboardInterrupt:
+                if self.exceeded is None:
+                    raise
+                raise self.exceeded from None
+            if self.exceeded is not None:
+                raise self.exceeded
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            sites = get_top_sites(tracemalloc.take_snapshot(), self.limit)
+        finally:
+            tracemalloc.stop()
+        self.usages.append(Usage(label, traced_peak, get_peak_rss(), sites))
+        return result
+
+    def get_report(self):
+        lines = []
+        for usage in self.usages:
+            lines.append(
+                f"{usage.label}  traced peak {usage.traced_peak / MIB:.2f} MiB"
+                f"  peak RSS {usage.rss_peak / MIB:.1f} MiB"
+            )
+            lines.append(format_sites(usage.sites))
+        return "\n".join(lines)
@@ -0,0 +1,119 @@
+"""
+Opt-in per-method instrumentation of the day solutions.
+
+instrument_module wraps every method of the classes defined in a day module
+(App, Hand, Brick, Conjunction, ...) and every plain function of it, so each
+call records its count, cumulative and self time on a Profiler. The call
+stacks are written in the collapsed format read by flamegraph.pl, speedscope
+and similar tools, one "outer;inner;leaf microseconds" line per stack.
+
+Nothing is wrapped unless instrumentation is asked for, so the solvers run
+unchanged otherwise.
+
+Usage (from the repository root):
+    python runner.py 22 --profile profiles
+    AOC_PROFILE=profiles python runner.py 22
+    flamegraph.pl profiles/day22.folded > day22.svg
+"""
+
+import functools
+import inspect
+import os
+import time
+
+ENVIRONMENT_VARIABLE = "AOC_PROFILE"
+
+
+def get_profile_directory():
+    return os.environ.get(ENVIRONMENT_VARIABLE) or None
+
+
+class Profiler:
+    def __init__(self):
+        # name -> [calls, cumulative seconds, self seconds]
+        self.stats = {}
+        # (outer, ..., leaf) -> self seconds
+        self.stacks = {}
+        # one [name, start, seconds spent in children] per active call
+        self.frames = []
+
+    def enter(self, name):
+        self.frames.append([name, time.perf_counter(), 0.0])
+
+    def exit(self):
+        name, start, children = self.frames.pop()
+        elapsed = time.perf_counter() - start
+        if self.frames:
+            self.frames[-1][2] += elapsed
+        stats = self.stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        # recursive calls are already inside the outermost call's cumulative time
+        if all(frame[0] != name for frame in self.frames):
+            stats[1] += elapsed
+        stats[2] += elapsed - children
+        stack = tuple(frame[0] for frame in self.frames) + (name,)
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + elapsed - children
+
+    def wrap(self, function, name):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.exit()
+
+        wrapper.__profiled__ = True
+        return wrapper
+
+    def get_stats(self):
+        """
+        Returns (name, calls, cumulative, self) rows, highest self time first.
+        """
+        rows = [(name, *stats) for name, stats in self.stats.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def write_collapsed(self, file_path):
+        with open(file_path, "w") as f:
+            for stack, seconds in sorted(self.stacks.items()):
+                f.write(f"{';'.join(stack)} {round(seconds * 1000000)}\n")
+
+
+def is_instrumentable(value):
+    # functools.cache and lru_cache keep the decorated function in __wrapped__
+    function = getattr(value, "__wrapped__", value)
+    return inspect.isfunction(function) and not hasattr(value, "__profiled__")
+
+
+def instrument_class(cls, profiler):
+    for name, value in list(vars(cls).items()):
+        if name.startswith("__") and name != "__init__":
+            continue
+        prefix = f"{cls.__module__}.{cls.__qualname__}"
+        if isinstance(value, (staticmethod, classmethod)):
+            if is_instrumentable(value.__func__):
+                wrapped = profiler.wrap(value.__func__, f"{prefix}.{name}")
+                setattr(cls, name, type(value)(wrapped))
+        elif is_instrumentable(value):
+            setattr(cls, name, profiler.wrap(value, f"{prefix}.{name}"))
+
+
+def instrument_module(module, profiler):
+    """
+    Wraps the functions and class methods defined in module, in place.
+    Imported names (e.g. Grid) are left alone.
+    """
+    for name, value in list(vars(module).items()):
+        if getattr(value, "__module__", None) != module.__name__:
+            continue
+        if inspect.isclass(value):
+            instrument_class(value, profiler)
+        elif is_instrumentable(value):
+            setattr(module, name, profiler.wrap(value, f"{module.__name__}.{name}"))
+
+
+def print_stats(title, rows, limit=10):
+    print(f"\n{title}")
+    print(f"{'calls':>10}  {'cumulative':>10}  {'self':>10}  method")
+    for name, calls, cumulative, own in rows[:limit]:
+        print(f"{calls:>10}  {cumulative:>10.4f}  {own:>10.4f}  {name}")
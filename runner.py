@@ -0,0 +1,375 @@
+"""
+Runs all registered days in parallel and prints a timing table.
+
+Usage (from the repository root):
+    python runner.py                 # every day
+    python runner.py 7 day14 22      # only the given days
+    python runner.py --input test_input.txt --workers 4
+    python runner.py --cache         # reuse answers of unchanged code and inputs
+    python runner.py 22 --profile profiles
+    python runner.py 12 14 --memory --memory-budget 500
+    python runner.py 7 18 20 --both  # parse once, solve both parts at once
+    python runner.py 3 -v            # with the debug output of the solvers
+    python runner.py 8 19 --sidecars # load compiled inputs saved by a first run
+    python runner.py 22 --checkpoints  # resume long solvers where they stopped
+"""
+
+import argparse
+import contextlib
+import copy
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import checkpoint
+import sidecar
+from cache import CACHE_DIRECTORY, MAX_SIZE, ResultCache
+from days import get_days, DAY_MAP
+from loader import share_lines
+from memory import MIB, MemoryBudgetExceeded, MemoryTracker
+from profiling import Profiler, get_profile_directory, instrument_module, print_stats
+from utils import VERBOSITY_VARIABLE, set_verbosity
+
+
+def setup_app(part, day_name, file_path):
+    module = part.get_module(day_name)
+    app = part.build(module, file_path)
+    getattr(app, part.setup)()
+    return app
+
+
+# {app_key: set up App} of the day run with --both, inherited by the forked
+# processes solving its parts
+shared_apps = {}
+
+
+def solve_shared_part(day_name, number):
+    part = DAY_MAP[day_name].parts[number - 1]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        answer = part.solve(shared_apps[part.app_key])
+    return answer, time.perf_counter() - start
+
+
+def run_both(day_name, input_file=None, cache=None):
+    """
+    Combined mode of run_day: the input is read once for every App of the
+    day, each distinct App is set up once and the parts are then solved at
+    the same time, each in a forked copy of this process, so parts that
+    change their App (day20) need no parse of their own. Where fork is not
+    available the parts run one after the other, on a copy of the App for
+    parts that change it.
+    """
+    day = DAY_MAP[day_name]
+    file_path = day.get_input_path(input_file)
+    result = {
+        "day": day_name,
+        "parse": 0.0,
+        "parts": [None] * len(day.parts),
+        "cached": [],
+        "profile": None,
+        "memory": None,
+        "error": None,
+    }
+    pending = []
+    try:
+        for number, part in enumerate(day.parts, 1):
+            if cache is not None:
+                cached = cache.get(cache.get_key(day_name, number, part, file_path))
+                if cached is not None:
+                    result["parts"][number - 1] = cached
+                    result["cached"].append(number)
+                    continue
+            pending.append(number)
+        shared_apps.clear()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            with share_lines():
+                for number in pending:
+                    part = day.parts[number - 1]
+                    if part.app_key not in shared_apps:
+                        start = time.perf_counter()
+                        shared_apps[part.app_key] = setup_app(part, day_name, file_path)
+                        result["parse"] += time.perf_counter() - start
+            if len(pending) > 1 and "fork" in multiprocessing.get_all_start_methods():
+                with ProcessPoolExecutor(
+                    max_workers=len(pending),
+                    mp_context=multiprocessing.get_context("fork"),
+                ) as executor:
+                    futures = {
+                        number: executor.submit(solve_shared_part, day_name, number)
+                        for number in pending
+                    }
+                    for number, future in futures.items():
+                        result["parts"][number - 1] = future.result()
+            else:
+                for number in pending:
+                    part = day.parts[number - 1]
+                    app = shared_apps[part.app_key]
+                    if part.fresh:
+                        app = copy.deepcopy(app)
+                    start = time.perf_counter()
+                    answer = part.solve(app)
+                    seconds = time.perf_counter() - start
+                    result["parts"][number - 1] = (answer, seconds)
+        if cache is not None:
+            for number in pending:
+                answer, seconds = result["parts"][number - 1]
+                part = day.parts[number - 1]
+                key = cache.get_key(day_name, number, part, file_path)
+                cache.put(key, answer, seconds)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        shared_apps.clear()
+    # after an error, only the parts solved before the failing one are shown
+    result["parts"] = list(
+        itertools.takewhile(lambda item: item is not None, result["parts"])
+    )
+    return result
+
+
+def run_day(day_name, input_file=None, cache=None, profile_directory=None, memory=None):
+    """
+    Parses and solves both parts of a day, returns answers and timings.
+    Apps are shared between parts of the same day unless a part needs a fresh one.
+    With a ResultCache, parts found in it are neither parsed nor solved again.
+    With a profile directory, the day's methods are instrumented and their
+    collapsed stacks written to <profile_directory>/<day>.folded.
+    With a MemoryTracker, the memory of the parse and every part is recorded
+    and a day going over its budget stops with a report.
+    """
+    day = DAY_MAP[day_name]
+    file_path = day.get_input_path(input_file)
+    result = {
+        "day": day_name,
+        "parse": 0.0,
+        "parts": [],
+        "cached": [],
+        "profile": None,
+        "memory": None,
+        "error": None,
+    }
+    apps = {}
+    profiler = None
+    if profile_directory:
+        profiler = Profiler()
+        for part in day.parts:
+            instrument_module(part.get_module(day_name), profiler)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for number, part in enumerate(day.parts, 1):
+                if cache is not None:
+                    cache_key = cache.get_key(day_name, number, part, file_path)
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        result["parts"].append(cached)
+                        result["cached"].append(number)
+                        continue
+                key = part.app_key
+                app = None if part.fresh else apps.get(key)
+                if app is None:
+                    start = time.perf_counter()
+                    if memory is None:
+                        app = setup_app(part, day_name, file_path)
+                    else:
+                        app = memory.measure(
+                            f"{day_name} parse", setup_app, part, day_name, file_path
+                        )
+                    result["parse"] += time.perf_counter() - start
+                    apps[key] = app
+                start = time.perf_counter()
+                if memory is None:
+                    answer = part.solve(app)
+                else:
+                    answer = memory.measure(
+                        f"{day_name} part {number}", part.solve, app
+                    )
+                seconds = time.perf_counter() - start
+                result["parts"].append((answer, seconds))
+                if cache is not None:
+                    cache.put(cache_key, answer, seconds)
+    except MemoryBudgetExceeded as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["memory"] = e.get_report()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    if memory is not None and result["memory"] is None:
+        result["memory"] = memory.get_report()
+    if profiler is not None:
+        profiler.write_collapsed(os.path.join(profile_directory, f"{day_name}.folded"))
+        result["profile"] = profiler.get_stats()
+    return result
+
+
+class Runner:
+    def __init__(
+        self,
+        days,
+        input_file=None,
+        workers=None,
+        cache=None,
+        profile_directory=None,
+        memory=None,
+        both=False,
+    ):
+        self.days = days
+        self.input_file = input_file
+        self.workers = workers
+        self.cache = cache
+        self.profile_directory = profile_directory
+        self.memory = memory
+        self.both = both
+
+    def run(self):
+        results = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [self.submit(executor, day) for day in self.days]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result["day"]] = result
+        return [results[day.name] for day in self.days]
+
+    def submit(self, executor, day):
+        if self.both:
+            return executor.submit(run_both, day.name, self.input_file, self.cache)
+        return executor.submit(
+            run_day,
+            day.name,
+            self.input_file,
+            self.cache,
+            self.profile_directory,
+            self.memory,
+        )
+
+    @staticmethod
+    def format_seconds(seconds, cached=False):
+        if seconds is None:
+            return "-"
+        return f"{seconds:.3f}*" if cached else f"{seconds:.3f}"
+
+    def print_table(self, results, wall_time):
+        header = ("Day", "Parse (s)", "Part 1 (s)", "Part 2 (s)", "Part 1", "Part 2")
+        rows = [header]
+        for result in results:
+            parts = result["parts"] + [(None, None)] * (2 - len(result["parts"]))
+            row = [
+                result["day"],
+                self.format_seconds(result["parse"]),
+                self.format_seconds(parts[0][1], 1 in result["cached"]),
+                self.format_seconds(parts[1][1], 2 in result["cached"]),
+                "-" if parts[0][0] is None else str(parts[0][0]),
+                "-" if parts[1][0] is None else str(parts[1][0]),
+            ]
+            if result["error"]:
+                row[-1] = result["error"]
+            rows.append(row)
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        for i, row in enumerate(rows):
+            print("  ".join(item.ljust(width) for item, width in zip(row, widths)))
+            if i == 0:
+                print("  ".join("-" * width for width in widths))
+        if any(result["cached"] for result in results):
+            print("\n* answer and time taken from the result cache")
+        print(f"\nWall time: {wall_time:.3f} s")
+
+    def print_profiles(self, results):
+        for result in results:
+            if result["profile"]:
+                print_stats(f"{result['day']} (seconds)", result["profile"])
+
+    def print_memory(self, results):
+        for result in results:
+            if result["memory"]:
+                print(f"\n{result['memory']}")
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("days", nargs="*", help="days to run, e.g. 7 or day07")
+    parser.add_argument("--input", help="input file name inside each day directory")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse and store answers on disk"
+    )
+    parser.add_argument("--cache-dir", default=CACHE_DIRECTORY)
+    parser.add_argument(
+        "--profile",
+        default=get_profile_directory(),
+        help="instrument methods and write collapsed stacks to this directory",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=MAX_SIZE, help="cache size limit in bytes"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="report memory usage of every step"
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        help="MiB of traced memory a step may use, implies --memory",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="debug output of the solvers on stderr, -vv to trace their loops",
+    )
+    parser.add_argument(
+        "--both",
+        action="store_true",
+        help="parse each input once and solve both parts at the same time",
+    )
+    parser.add_argument(
+        "--sidecars",
+        action="store_true",
+        help="save compiled inputs next to them and load them on later runs",
+    )
+    parser.add_argument(
+        "--checkpoints",
+        action="store_true",
+        help="save the progress of long solvers and resume it on later runs",
+    )
+    arguments = parser.parse_args()
+    if arguments.both and (
+        arguments.profile or arguments.memory or arguments.memory_budget
+    ):
+        parser.error("--both can not be combined with --profile or --memory")
+    return arguments
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    if arguments.verbose:
+        # forked workers inherit the level, spawned ones read the variable
+        set_verbosity(arguments.verbose)
+        os.environ[VERBOSITY_VARIABLE] = str(arguments.verbose)
+    if arguments.sidecars:
+        os.environ[sidecar.ENVIRONMENT_VARIABLE] = "1"
+    if arguments.checkpoints:
+        os.environ[checkpoint.ENVIRONMENT_VARIABLE] = "1"
+    cache = None
+    if arguments.cache:
+        cache = ResultCache(arguments.cache_dir, arguments.cache_size)
+    memory = None
+    if arguments.memory or arguments.memory_budget:
+        budget = arguments.memory_budget and int(arguments.memory_budget * MIB)
+        memory = MemoryTracker(budget)
+    if arguments.profile:
+        os.makedirs(arguments.profile, exist_ok=True)
+    runner = Runner(
+        get_days(arguments.days),
+        arguments.input,
+        arguments.workers,
+        cache,
+        arguments.profile,
+        memory,
+        arguments.both,
+    )
+    start = time.perf_counter()
+    results = runner.run()
+    runner.print_table(results, time.perf_counter() - start)
+    runner.print_profiles(results)
+    runner.print_memory(results)
@@ -0,0 +1,47 @@
+"""
+Shared scanner for the integers of numeric inputs.
+
+Every signed integer of a buffer is pulled out in one pass of one compiled
+pattern, skipping whatever separates them (" @ ", "~", ",", "x=", ...), and
+stored in a flat array('q') instead of a list of Python ints. Records of a
+fixed shape, like the six values of a day24 hailstone, are read from the flat
+array with get_records or checked line by line with scan_record.
+"""
+
+import re
+from array import array
+
+INTEGER = re.compile(rb"-?\d+")
+
+
+def scan_ints(buffer):
+    """
+    Returns every signed integer of a bytes-like object (bytes, mmap,
+    memoryview) or string in an array('q').
+    """
+    if isinstance(buffer, str):
+        buffer = buffer.encode()
+    return array("q", map(int, INTEGER.findall(buffer)))
+
+
+def get_records(values, width):
+    """
+    Yields tuples of width consecutive values.
+    """
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not fill records of {width}")
+    return zip(*[iter(values)] * width)
+
+
+def scan_records(buffer, width):
+    return get_records(scan_ints(buffer), width)
+
+
+def scan_record(line, width):
+    """
+    Returns the integers of one line, which has to hold exactly width of them.
+    """
+    values = scan_ints(line)
+    if len(values) != width:
+        raise ValueError(f"expected {width} integers, found {len(values)}: {line!r}")
+    return values
@@ -0,0 +1,171 @@
+"""
+Versioned binary sidecar files holding the compiled form of an input.
+
+Days with an expensive setup can save what they compiled (integer indexed
+arrays, the settled brick table, ...) next to their input, as
+<input>.<name>.sidecar, and on later runs load it with mmap instead of
+parsing and setting up again. A sidecar is only used when the file format
+version, the day's own version of its compiled form and the sha256 digest
+of the input all match, so editing the input or the compiling code (and
+bumping its version) makes the day set up from scratch again.
+
+Sidecars are off by default. Set AOC_SIDECARS=1, or pass --sidecars to
+runner.py, to write them on the first run and read them afterwards.
+
+Layout, little endian: a header, one entry per section, then the section
+data, every section starting at a multiple of 8 bytes.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+ENVIRONMENT_VARIABLE = "AOC_SIDECARS"
+SUFFIX = ".sidecar"
+MAGIC = b"AOCSIDE\0"
+FORMAT_VERSION = 1
+# magic, format version, compiled form version, section qty, input digest
+HEADER = struct.Struct("<8sHHI32s")
+# name, array typecode, data offset, data length in bytes
+SECTION = struct.Struct("<16sc7xQQ")
+ALIGNMENT = 8
+
+
+def is_enabled():
+    return os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+def get_sidecar_path(file_path, name):
+    return f"{file_path}.{name}{SUFFIX}"
+
+
+def get_input_digest(file_path):
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def encode_names(names):
+    return "\n".join(names).encode()
+
+
+def decode_names(data):
+    return bytes(data).decode().split("\n") if len(data) else []
+
+
+def save(file_path, name, version, sections):
+    """
+    Writes sections, {section name: array or bytes-like}, as the compiled
+    form of file_path. bytes-like sections are read back as typecode "B".
+    """
+    entries = []
+    offset = HEADER.size + SECTION.size * len(sections)
+    for section_name, data in sections.items():
+        typecode = data.typecode if isinstance(data, array) else "B"
+        data = memoryview(data).cast("B")
+        offset += -offset % ALIGNMENT
+        entries.append((section_name, typecode, offset, data))
+        offset += len(data)
+    path = get_sidecar_path(file_path, name)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                version,
+                len(entries),
+                get_input_digest(file_path),
+            )
+        )
+        for section_name, typecode, offset, data in entries:
+            f.write(
+                SECTION.pack(
+                    section_name.encode(), typecode.encode(), offset, len(data)
+                )
+            )
+        for _, _, offset, data in entries:
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(data)
+    # readers never see a half written sidecar
+    os.replace(temporary_path, path)
+    return path
+
+
+class Sidecar:
+    """
+    A memory-mapped sidecar. Sections are zero-copy memoryviews cast to
+    their typecode, valid until the sidecar is closed. get_array copies a
+    section out for data that has to outlive it or be changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise
+        self.buffer = memoryview(self.map)
+        self.sections = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        for view in self.sections.values():
+            view.release()
+        self.sections = {}
+        self.buffer.release()
+        self.map.close()
+        self.file.close()
+
+    def read_header(self):
+        if len(self.buffer) < HEADER.size:
+            return None
+        return HEADER.unpack_from(self.buffer)
+
+    def read_sections(self, qty):
+        for i in range(qty):
+            name, typecode, offset, length = SECTION.unpack_from(
+                self.buffer, HEADER.size + i * SECTION.size
+            )
+            view = self.buffer[offset : offset + length].cast(typecode.decode())
+            self.sections[name.rstrip(b"\0").decode()] = view
+
+    def __getitem__(self, name):
+        return self.sections[name]
+
+    def get_array(self, name):
+        view = self.sections[name]
+        copy = array(view.format)
+        # a view cast to another typecode is not a plain bytes-like object
+        copy.frombytes(view.cast("B"))
+        return copy
+
+
+def load(file_path, name, version):
+    """
+    Returns the Sidecar of file_path, None when there is none or it does not
+    match the format version, version or the current input.
+    """
+    path = get_sidecar_path(file_path, name)
+    try:
+        sidecar = Sidecar(path)
+    except (FileNotFoundError, ValueError):
+        # missing, or empty and not mappable
+        return None
+    header = sidecar.read_header()
+    if header is None or header[:3] != (MAGIC, FORMAT_VERSION, version):
+        sidecar.close()
+        return None
+    if header[4] != get_input_digest(file_path):
+        sidecar.close()
+        return None
+    sidecar.read_sections(header[3])
+    return sidecar
@@ -0,0 +1,72 @@
+import random
+
+from automaton import Automaton, get_automaton
+from day01.trebuchet_part_2 import get_digit_map
+
+DIGIT_MAP = get_digit_map()
+
+
+def get_first_numeric(line):
+    """
+    The find based search of the original day01 part 2.
+    """
+    num = None
+    first_index = len(line)
+    for key, value in DIGIT_MAP.items():
+        index = line.find(key)
+        if -1 < index < first_index:
+            num = value
+            first_index = index
+    return num
+
+
+def get_last_numeric(line):
+    num = None
+    last_index = -1
+    for key, value in DIGIT_MAP.items():
+        index = line.rfind(key)
+        if last_index < index:
+            num = value
+            last_index = index
+    return num
+
+
+def get_random_line(rng):
+    items = []
+    for _ in range(rng.randint(0, 6)):
+        choice = rng.random()
+        if choice < 0.3:
+            items.append(rng.choice(list(DIGIT_MAP)))
+        elif choice < 0.5:
+            # overlapping words, like the "one" of "twone"
+            items.append(rng.choice(["twone", "eightwo", "oneight", "sevenine"]))
+        else:
+            items.append("".join(rng.choices("onetwhrfuivsxg", k=rng.randint(1, 4))))
+    return "".join(items)
+
+
+def test_first_last_matches_find():
+    rng = random.Random(25)
+    automaton = get_automaton(tuple(DIGIT_MAP.items()))
+    for _ in range(5000):
+        line = get_random_line(rng)
+        assert automaton.find_first_last(line) == (
+            get_first_numeric(line),
+            get_last_numeric(line),
+        )
+
+
+def test_matches_match_find():
+    rng = random.Random(26)
+    patterns = [("a", 1), ("ab", 2), ("bab", 3), ("b", 4), ("abab", 5)]
+    automaton = Automaton(patterns)
+    for _ in range(500):
+        text = "".join(rng.choices("abc", k=rng.randint(0, 12)))
+        expected = {
+            (start, pattern, value)
+            for pattern, value in patterns
+            for start in range(len(text))
+            if text.startswith(pattern, start)
+        }
+        matches = list(automaton.iter_matches(text))
+        assert len(matches) == len(expected) and set(matches) == expected
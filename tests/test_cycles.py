@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from cycles import Cycle, CycleFinder, find_cycle
+
+
+def iter_steps(start, length, limit=None):
+    """
+    A simulation whose state i, after start steps, repeats every length steps.
+    Values are (state, 1) so totals check both components of tuples.
+    """
+    step = 0
+    while limit is None or step < limit:
+        state = step if step < start else start + (step - start) % length
+        yield state, (state * 7 + 1, 1)
+        step += 1
+
+
+def get_naive_cycle(steps):
+    """
+    Returns (start, length) of the first repeated state, remembering the
+    step every state was first seen at.
+    """
+    seen = {}
+    for step, (state, _) in enumerate(steps):
+        if state in seen:
+            return seen[state], step - seen[state]
+        seen[state] = step
+    return None
+
+
+def test_brent_matches_seen_dict():
+    rng = random.Random(15)
+    for _ in range(300):
+        start, length = rng.randint(0, 40), rng.randint(1, 40)
+        cycle = find_cycle(iter_steps(start, length))
+        assert (cycle.start, cycle.length) == get_naive_cycle(iter_steps(start, length))
+        values = [value for _, value in iter_steps(start, length, 200)]
+        for step in range(200):
+            assert cycle.get(step) == values[step]
+        far = rng.randint(0, 10**12)
+        state = start + (far - start) % length if far >= start else far
+        assert cycle.get(far) == (state * 7 + 1, 1)
+        # the total of a far step count, from one cycle and the remainder
+        count = rng.randint(200, 1000)
+        values = [value for _, value in iter_steps(start, length, count)]
+        assert cycle.get_total(count) == tuple(map(sum, zip(*values)))
+
+
+def test_finder_is_fed_one_step_at_a_time():
+    finder = CycleFinder()
+    for fingerprint, value in iter_steps(3, 5):
+        if finder.add(fingerprint, value):
+            break
+    cycle = finder.get_cycle()
+    assert (cycle.start, cycle.length) == (3, 5)
+
+
+def test_no_cycle_before_the_end():
+    cycle = find_cycle(iter_steps(10, 5, limit=8))
+    assert (cycle.start, cycle.length) == (8, 0)
+    assert cycle.get_total(8) == (sum(i * 7 + 1 for i in range(8)), 8)
+    with pytest.raises(ValueError):
+        cycle.get(8)
+    with pytest.raises(ValueError):
+        Cycle(2, 0, [1, 2]).get_total(3)
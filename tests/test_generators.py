@@ -0,0 +1,27 @@
+import pytest
+
+from complexity import SKIPPED_PARTS
+from days import get_days
+from generators import GENERATORS, get_node_names, write_input
+
+
+@pytest.mark.parametrize("day", get_days(list(GENERATORS)), ids=lambda day: day.name)
+def test_generated_input_is_solved(day, tmp_path):
+    path = write_input(day.name, 12, str(tmp_path / "input.txt"), seed=1)
+    again = write_input(day.name, 12, str(tmp_path / "again.txt"), seed=1)
+    with open(path) as f, open(again) as g:
+        assert f.read() == g.read()
+    for number, part in enumerate(day.parts, 1):
+        if number in SKIPPED_PARTS.get(day.name, ()):
+            continue
+        app = part.build(part.get_module(day.name), path)
+        getattr(app, part.setup)()
+        assert isinstance(part.solve(app), int)
+
+
+def test_node_names():
+    names = get_node_names(30)
+    assert len(set(names)) == 30
+    assert names[0] == "AAA" and names[-1] == "ZZZ"
+    with pytest.raises(ValueError):
+        get_node_names(26**3 + 1)
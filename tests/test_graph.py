@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from graph import (
+    bfs_distances,
+    connected_components,
+    dag_longest_path,
+    dfs,
+    reachable,
+    strongly_connected_components,
+    topological_order,
+)
+
+
+def get_random_graph(rng, qty, density):
+    return [[node for node in range(qty) if rng.random() < density] for _ in range(qty)]
+
+
+def get_random_dag(rng, qty, density):
+    return [
+        [node for node in range(source + 1, qty) if rng.random() < density]
+        for source in range(qty)
+    ]
+
+
+def get_closure(graph, source):
+    """
+    Nodes reachable from source, by adding successors until nothing changes.
+    """
+    nodes = {source}
+    while True:
+        bigger = nodes | {neighbor for node in nodes for neighbor in graph[node]}
+        if bigger == nodes:
+            return nodes
+        nodes = bigger
+
+
+def iter_graphs(seed, dag=False):
+    rng = random.Random(seed)
+    get_graph = get_random_dag if dag else get_random_graph
+    for _ in range(100):
+        yield get_graph(rng, rng.randint(1, 12), rng.choice([0.1, 0.2, 0.4]))
+
+
+def test_reachable_and_distances():
+    for graph in iter_graphs(1):
+        assert reachable([0], graph) == get_closure(graph, 0)
+        distances = bfs_distances([0], graph)
+        # a node at distance d is a successor of one at d - 1 and of none closer
+        for node, distance in distances.items():
+            if distance:
+                previous = [p for p in distances if node in graph[p]]
+                assert min(distances[p] for p in previous) == distance - 1
+        assert set(bfs_distances([0], graph, 1)) == {0, *graph[0]}
+
+
+def test_dfs_matches_recursive_walk():
+    def walk(node, seen, order):
+        seen.add(node)
+        order.append(node)
+        for neighbor in graph[node]:
+            if neighbor not in seen:
+                walk(neighbor, seen, order)
+        return order
+
+    for graph in iter_graphs(2):
+        assert list(dfs(0, graph)) == walk(0, set(), [])
+
+
+def test_components():
+    for graph in iter_graphs(3):
+        nodes = range(len(graph))
+        closures = [get_closure(graph, node) for node in nodes]
+        components = strongly_connected_components(nodes, graph)
+        component_of = {node: i for i, c in enumerate(components) for node in c}
+        assert sorted(component_of) == list(nodes)
+        for a in nodes:
+            for b in nodes:
+                mutual = b in closures[a] and a in closures[b]
+                assert (component_of[a] == component_of[b]) == mutual
+                if b in graph[a]:
+                    assert component_of[b] <= component_of[a]
+        undirected = [set(neighbors) for neighbors in graph]
+        for node, neighbors in enumerate(graph):
+            for neighbor in neighbors:
+                undirected[neighbor].add(node)
+        labels = connected_components(nodes, undirected)
+        for a in nodes:
+            for b in nodes:
+                connected = b in get_closure(undirected, a)
+                assert (labels[a] == labels[b]) == connected
+
+
+def test_topological_order():
+    for graph in iter_graphs(4, dag=True):
+        position = {
+            node: i
+            for i, node in enumerate(topological_order(range(len(graph)), graph))
+        }
+        assert len(position) == len(graph)
+        for node, neighbors in enumerate(graph):
+            for neighbor in neighbors:
+                assert position[node] < position[neighbor]
+    with pytest.raises(ValueError):
+        topological_order(range(3), [[1], [2], [0]])
+
+
+def test_dag_longest_path_matches_every_path():
+    rng = random.Random(5)
+    for graph in iter_graphs(5, dag=True):
+        edges = {
+            node: [(neighbor, rng.randint(1, 9)) for neighbor in neighbors]
+            for node, neighbors in enumerate(graph)
+        }
+        target = len(graph) - 1
+        lengths = []
+        stack = [(0, 0)]
+        while stack:
+            node, length = stack.pop()
+            if node == target:
+                lengths.append(length)
+            for neighbor, weight in edges[node]:
+                stack.append((neighbor, length + weight))
+        expected = max(lengths) if lengths else None
+        assert dag_longest_path(edges, edges, 0, target) == expected
+
+
+def test_dag_longest_path_refuses_cycles():
+    edges = {0: [(1, 1)], 1: [(0, 1), (2, 1)], 2: []}
+    with pytest.raises(ValueError):
+        dag_longest_path(edges, edges, 0, 2)
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from grid import DIRECTIONS, Grid
+
+
+def get_random_lines(rng, width, height):
+    return ["".join(rng.choice(".#O") for _ in range(width)) for _ in range(height)]
+
+
+def to_lines(matrix):
+    return ["".join(row) for row in matrix]
+
+
+def transpose(lines):
+    return to_lines(zip(*lines))
+
+
+def rotate_clockwise(lines):
+    return to_lines(zip(*lines[::-1]))
+
+
+def rotate_counter_clockwise(lines):
+    return to_lines(zip(*lines))[::-1]
+
+
+@pytest.mark.parametrize(
+    "method, reference",
+    [
+        ("transpose", transpose),
+        ("flip_rows", lambda lines: [line[::-1] for line in lines]),
+        ("flip_cols", lambda lines: lines[::-1]),
+        ("rotate_clockwise", rotate_clockwise),
+        ("rotate_counter_clockwise", rotate_counter_clockwise),
+        ("rotate_180", lambda lines: [line[::-1] for line in lines[::-1]]),
+    ],
+)
+def test_transforms_match_list_of_lists(method, reference):
+    rng = random.Random(method)
+    for width, height in [(1, 1), (3, 3), (4, 7), (7, 4), (1, 5), (6, 1)]:
+        lines = get_random_lines(rng, width, height)
+        grid = getattr(Grid.from_lines(lines), method)()
+        expected = reference(lines)
+        assert grid.lines() == expected
+        assert (grid.width, grid.height) == (len(expected[0]), len(expected))
+
+
+def test_neighbors_stay_in_bounds():
+    grid = Grid(5, 3)
+    for index in range(len(grid.cells)):
+        row, col = grid.position(index)
+        expected = {
+            grid.index(row + d_row, col + d_col)
+            for d_row, d_col in DIRECTIONS
+            if grid.is_valid(row + d_row, col + d_col)
+        }
+        assert set(grid.neighbors(index)) == expected
+
+
+def test_views_and_search():
+    lines = ["ab.", ".b#", "#.a"]
+    grid = Grid.from_lines(lines)
+    assert [bytes(row).decode() for row in grid] == lines
+    assert bytes(grid.col(1)).decode() == "bb."
+    assert grid[1, 2] == "#"
+    assert list(grid.find_all("#")) == [grid.index(1, 2), grid.index(2, 0)]
+    assert grid.find("x") == -1
+    assert grid.padded("~").lines() == ["~~~~~", "~ab.~", "~.b#~", "~#.a~", "~~~~~"]
+
+
+def test_ragged_lines_are_rejected():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["ab", "a"])
@@ -0,0 +1,89 @@
+import itertools
+import random
+
+from intervals import (
+    IntervalSet,
+    coalesce,
+    intersect,
+    intersect_boxes,
+    shift,
+    split_box,
+    subtract,
+    subtract_boxes,
+    volume,
+)
+
+
+def to_set(intervals):
+    return {value for start, end in intervals for value in range(start, end + 1)}
+
+
+def get_random_interval(rng, low=0, high=40):
+    start = rng.randint(low, high)
+    return start, rng.randint(start, high)
+
+
+def get_random_box(rng, dimensions):
+    return tuple(get_random_interval(rng, 0, 6) for _ in range(dimensions))
+
+
+def to_points(boxes):
+    points = set()
+    for box in boxes:
+        points.update(itertools.product(*(range(s, e + 1) for s, e in box)))
+    return points
+
+
+def test_intervals_match_set_arithmetic():
+    rng = random.Random(14)
+    for _ in range(500):
+        a = get_random_interval(rng)
+        b = get_random_interval(rng)
+        part = intersect(a, b)
+        assert to_set([part] if part else []) == to_set([a]) & to_set([b])
+        assert to_set(subtract(a, b)) == to_set([a]) - to_set([b])
+        assert to_set([shift(a, 3)]) == {value + 3 for value in to_set([a])}
+
+
+def test_interval_set_matches_set_arithmetic():
+    rng = random.Random(15)
+    for _ in range(300):
+        intervals = [get_random_interval(rng) for _ in range(rng.randint(0, 5))]
+        interval_set = IntervalSet(intervals)
+        values = to_set(intervals)
+        assert to_set(interval_set) == values
+        assert interval_set.size() == len(values)
+        # disjoint and not adjacent, or coalesce would have merged them
+        for (_, end), (start, _) in zip(interval_set, list(interval_set)[1:]):
+            assert start > end + 1
+        for value in range(-1, 42):
+            assert (value in interval_set) == (value in values)
+        other = get_random_interval(rng)
+        assert to_set(interval_set.intersect(other)) == values & to_set([other])
+        interval_set.subtract(other)
+        assert to_set(interval_set) == values - to_set([other])
+        interval_set.union([other])
+        assert to_set(interval_set) == values | to_set([other])
+        assert coalesce(interval_set) == list(interval_set)
+
+
+def test_boxes_match_point_sets():
+    rng = random.Random(19)
+    for _ in range(300):
+        dimensions = rng.randint(1, 3)
+        a = get_random_box(rng, dimensions)
+        b = get_random_box(rng, dimensions)
+        assert volume(a) == len(to_points([a]))
+        part = intersect_boxes(a, b)
+        assert to_points([part] if part else []) == to_points([a]) & to_points([b])
+        parts = subtract_boxes(a, b)
+        assert to_points(parts) == to_points([a]) - to_points([b])
+        assert sum(volume(box) for box in parts) == len(to_points(parts))
+        axis = rng.randrange(dimensions)
+        value = rng.randint(-1, 8)
+        below, above = split_box(a, axis, value)
+        assert to_points([box for box in (below, above) if box]) == to_points([a])
+        assert all(point[axis] < value for point in to_points([below] if below else []))
+        assert all(
+            point[axis] >= value for point in to_points([above] if above else [])
+        )
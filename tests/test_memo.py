@@ -0,0 +1,70 @@
+import copy
+import random
+from collections import OrderedDict
+
+from memo import Memo, clear_memos, get_entry_size, get_memos, memoize
+
+
+class Fibonacci:
+    def __init__(self):
+        self.calls = 0
+
+    @memoize(max_size=4)
+    def get(self, n):
+        self.calls += 1
+        return n if n < 2 else self.get(n - 1) + self.get(n - 2)
+
+
+def test_memo_evicts_like_an_lru_list():
+    rng = random.Random(24)
+    memo = Memo(max_size=5)
+    reference = OrderedDict()
+    for _ in range(2000):
+        key = rng.randrange(12)
+        if rng.random() < 0.5:
+            assert memo.get(key) == reference.get(key)
+            if key in reference:
+                reference.move_to_end(key)
+        else:
+            memo.put(key, key * 10)
+            reference[key] = key * 10
+            reference.move_to_end(key)
+            while len(reference) > 5:
+                reference.popitem(last=False)
+        assert list(memo.entries) == list(reference)
+
+
+def test_byte_budget():
+    memo = Memo(max_size=None, max_bytes=3 * get_entry_size(0, "x" * 10))
+    for key in range(10):
+        memo.put(key, "x" * 10)
+    assert list(memo.entries) == [7, 8, 9]
+    assert memo.nbytes <= memo.max_bytes
+    assert memo.get_stats()["evictions"] == 7
+
+
+def test_memoize_is_per_instance_and_bounded():
+    a, b = Fibonacci(), Fibonacci()
+    assert [a.get(n) for n in range(30)] == [b.get(n) for n in range(30)]
+    assert a.get(90) == 2880067194370816120
+    memo = get_memos(a)["get"]
+    assert len(memo) == 4 and memo.evictions
+    # ascending calls only need the last two values, so nothing is recomputed
+    assert a.calls == 91
+    copied = copy.deepcopy(a)
+    assert len(get_memos(copied)["get"]) == 4
+    clear_memos(a)
+    assert len(memo) == 0 and len(get_memos(copied)["get"]) == 4
+
+
+def test_key_function():
+    class Counter:
+        @memoize(key=len)
+        def count(self, text):
+            return text.count("a")
+
+    counter = Counter()
+    assert counter.count("ab") == 1
+    # same key, so the memoized value of "ab" comes back
+    assert counter.count("aa") == 1
+    assert get_memos(counter)["count"].get_stats()["hits"] == 1
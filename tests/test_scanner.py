@@ -0,0 +1,36 @@
+import random
+import re
+
+import pytest
+
+from scanner import get_records, scan_ints, scan_record, scan_records
+
+
+def test_scan_ints_matches_split():
+    rng = random.Random(12)
+    for _ in range(200):
+        values = [rng.randint(-(2**62), 2**62) for _ in range(rng.randint(0, 20))]
+        separators = [
+            rng.choice([" ", ", ", " @ ", "~", ",", " x=", "\n"]) for _ in values
+        ]
+        text = "".join(sep + str(value) for sep, value in zip(separators, values))
+        assert list(scan_ints(text)) == values
+        assert list(scan_ints(text.encode())) == values
+        assert list(scan_ints(memoryview(text.encode()))) == values
+
+
+def test_scan_ints_on_a_day_line():
+    line = "19, 13, 30 @ -2,  1, -2"
+    assert list(scan_ints(line)) == [int(x) for x in re.findall(r"-?\d+", line)]
+
+
+def test_records():
+    assert list(scan_records(b"1,1,2~1,3,2\n0,0,4~2,0,4\n", 6)) == [
+        (1, 1, 2, 1, 3, 2),
+        (0, 0, 4, 2, 0, 4),
+    ]
+    assert list(scan_record("x=3, y=-4", 2)) == [3, -4]
+    with pytest.raises(ValueError):
+        get_records([1, 2, 3], 2)
+    with pytest.raises(ValueError):
+        scan_record("1 2 3", 2)
@@ -0,0 +1,44 @@
+import random
+
+from watch import CardCopySolver
+
+
+def get_wins(line):
+    return int(line.split(":")[1])
+
+
+def solve(lines):
+    solver = CardCopySolver(get_wins)
+    return solver.update(lines)
+
+
+def get_random_lines(rng, qty):
+    return [f"{rng.choice('xyz')}{i}:{rng.randint(0, 4)}" for i in range(qty)]
+
+
+def test_lowered_largest_win_count():
+    solver = CardCopySolver(get_wins)
+    lines = ["a:1", "b:3", "c:1", "d:1", "e:1", "f:0"]
+    assert solver.update(lines) == solve(lines)
+    lines = ["a:1", "B:1", "c:1", "d:1", "e:1", "f:0"]
+    assert solver.update(lines) == solve(lines) == 21
+
+
+def test_update_matches_full_recompute():
+    rng = random.Random(4)
+    for _ in range(500):
+        solver = CardCopySolver(get_wins)
+        lines = get_random_lines(rng, rng.randint(0, 8))
+        for _ in range(4):
+            lines = list(lines)
+            for _ in range(rng.randint(1, 3)):
+                action = rng.choice(("change", "insert", "delete"))
+                if action == "change" and lines:
+                    lines[rng.randrange(len(lines))] = get_random_lines(rng, 1)[0]
+                elif action == "insert":
+                    lines.insert(
+                        rng.randint(0, len(lines)), get_random_lines(rng, 1)[0]
+                    )
+                elif lines:
+                    del lines[rng.randrange(len(lines))]
+            assert solver.update(lines) == solve(lines), lines
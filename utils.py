@@ -1,6 +1,56 @@
-def print_matrix(matrix):
+"""
+Console helpers and the debug output of the solvers.
+
+Solvers never print their intermediate state directly, they call debug (for
+one-off dumps like a parsed map) or trace (for messages inside loops), which
+write to stderr only at a high enough verbosity. The verbosity comes from the
+AOC_VERBOSITY environment variable (0 quiet, 1 debug, 2 trace) or
+set_verbosity, so answers on stdout stay clean. Loops read is_enabled(TRACE)
+once into a local before they start, so a disabled trace costs one local
+check per iteration and no call or formatting at all.
+"""
+
+import os
+import sys
+
+QUIET = 0
+DEBUG = 1
+TRACE = 2
+VERBOSITY_VARIABLE = "AOC_VERBOSITY"
+
+verbosity = int(os.environ.get(VERBOSITY_VARIABLE) or QUIET)
+
+
+def set_verbosity(level):
+    global verbosity
+    verbosity = level
+
+
+def is_enabled(level=DEBUG):
+    return verbosity >= level
+
+
+def debug(*args):
+    if verbosity >= DEBUG:
+        print(*args, file=sys.stderr)
+
+
+def trace(*args):
+    if verbosity >= TRACE:
+        print(*args, file=sys.stderr)
+
+
+def print_matrix(matrix, file=None):
     """
     Prints a given 2d array on console without commas and brackets.
     """
     for row in matrix:
-        print(*row, sep="")
+        print(*row, sep="", file=file)
+
+
+def debug_matrix(matrix, level=DEBUG):
+    """
+    print_matrix to stderr when the verbosity is at least level.
+    """
+    if verbosity >= level:
+        print_matrix(matrix, file=sys.stderr)
@@ -0,0 +1,291 @@
+"""
+Incremental watch mode for the days whose answers are sums over lines.
+
+The input file is polled for changes. Every line's result is cached by its
+content, so after an edit only added or changed lines are parsed and solved
+again and the totals are updated from the cache. day07 keeps its hands
+sorted by value and only re-ranks. day04 part 2 is not independent per line
+(cards win copies of the following cards), so its copy counts are recomputed
+from the first changed card until they match the previous counts again.
+
+Usage (from the repository root):
+    python watch.py 12                      # watches day12/input.txt
+    python watch.py 4 path/to/cards.txt --interval 0.2
+"""
+
+import argparse
+import importlib
+import os
+import time
+from bisect import insort
+from collections import Counter
+
+from days import CUBE_LIMITS, get_days
+from loader import read_lines
+from scanner import scan_ints
+
+
+class SumSolver:
+    """
+    Answer is the sum of solve_line over the lines.
+    """
+
+    def __init__(self, solve_line):
+        self.solve_line = solve_line
+        self.cache = {}
+        self.counts = Counter()
+        self.total = 0
+        self.solved = 0
+
+    def get_value(self, line):
+        if line not in self.cache:
+            self.cache[line] = self.solve_line(line)
+            self.solved += 1
+        return self.cache[line]
+
+    def update(self, lines):
+        counts = Counter(lines)
+        for line, qty in (counts - self.counts).items():
+            self.total += qty * self.get_value(line)
+        for line, qty in (self.counts - counts).items():
+            self.total -= qty * self.cache[line]
+        self.counts = counts
+        # keep removed lines for undos, but not forever
+        if len(self.cache) > 2 * len(counts):
+            self.cache = {line: self.cache[line] for line in counts}
+        return self.total
+
+
+class RankSolver:
+    """
+    Answer is the sum of rank * bid of the (value, bid) lines sorted by value.
+    """
+
+    def __init__(self, solve_line):
+        self.solve_line = solve_line
+        self.cache = {}
+        self.counts = Counter()
+        self.ranked = []
+        self.solved = 0
+
+    def update(self, lines):
+        counts = Counter(lines)
+        removed = self.counts - counts
+        if removed:
+            removed_hands = Counter()
+            for line, qty in removed.items():
+                removed_hands[self.cache[line]] += qty
+            ranked = []
+            for hand in self.ranked:
+                if removed_hands[hand]:
+                    removed_hands[hand] -= 1
+                else:
+                    ranked.append(hand)
+            self.ranked = ranked
+        for line, qty in (counts - self.counts).items():
+            if line not in self.cache:
+                self.cache[line] = self.solve_line(line)
+                self.solved += 1
+            for _ in range(qty):
+                insort(self.ranked, self.cache[line])
+        self.counts = counts
+        return sum(rank * bid for rank, (_, bid) in enumerate(self.ranked, 1))
+
+
+class CardCopySolver:
+    """
+    day04 part 2: every card wins one copy of each of the next winning
+    quantity cards, the answer is the number of cards in the end.
+    """
+
+    def __init__(self, solve_line):
+        self.solve_line = solve_line
+        self.cache = {}
+        self.lines = []
+        self.wins = []
+        self.copies = []
+        self.solved = 0
+
+    def get_wins(self, line):
+        if line not in self.cache:
+            self.cache[line] = self.solve_line(line)
+            self.solved += 1
+        return self.cache[line]
+
+    def get_changed_range(self, lines):
+        """
+        Returns (start, end) of the new lines that differ from the old ones,
+        after the common prefix and suffix.
+        """
+        old = self.lines
+        start = 0
+        limit = min(len(old), len(lines))
+        while start < limit and old[start] == lines[start]:
+            start += 1
+        suffix = 0
+        while (
+            suffix < limit - start
+            and old[len(old) - 1 - suffix] == lines[len(lines) - 1 - suffix]
+        ):
+            suffix += 1
+        return start, len(lines) - suffix
+
+    def update(self, lines):
+        start, end = self.get_changed_range(lines)
+        shift = len(lines) - len(self.lines)
+        wins = self.wins[:start] + [self.get_wins(line) for line in lines[start:end]]
+        wins += self.wins[end - shift :]
+        # a changed card may have given copies further than any new one does
+        window = max(max(self.wins, default=0), max(wins, default=0))
+        copies = self.copies[:start]
+        matching = 0
+        for i in range(start, len(lines)):
+            if i >= end and matching >= max(window, 1):
+                # the last window counts are as before, so are all later ones
+                copies += self.copies[i - shift :]
+                break
+            qty = 1
+            for j in range(max(0, i - window), i):
+                if j + wins[j] >= i:
+                    qty += copies[j]
+            copies.append(qty)
+            if i >= end and self.copies[i - shift] == qty:
+                matching += 1
+            else:
+                matching = 0
+        self.lines = lines
+        self.wins = wins
+        self.copies = copies
+        return sum(copies)
+
+
+def get_solvers(day_name, file_path):
+    """
+    Returns one solver per part of the day.
+    """
+    if day_name == "day02":
+        module = importlib.import_module("day02.cubes")
+        app = module.App(file_path, module.CubeDataParser, CUBE_LIMITS)
+
+        def parse(line):
+            return next(module.CubeDataParser([line]).iter_records())
+
+        def get_valid_id(line):
+            id, sets = parse(line)
+            return id if app.is_valid_sets(sets) else 0
+
+        return [
+            SumSolver(get_valid_id),
+            SumSolver(lambda line: app.get_power(parse(line)[1])),
+        ]
+    if day_name == "day04":
+        module = importlib.import_module("day04.cards")
+        app = module.App(file_path, module.CardParser)
+
+        def parse(line):
+            return next(module.CardParser([line.encode()]).iter_records())[1]
+
+        return [
+            SumSolver(lambda line: app.get_card_point(parse(line))),
+            CardCopySolver(lambda line: app.get_winning_number_qty(parse(line))),
+        ]
+    if day_name == "day07":
+        module = importlib.import_module("day07.camel_cards")
+
+        def get_hand_solver(hand_class):
+            def solve_line(line):
+                hand, bid = line.split()
+                return hand_class(hand).get_total_value(), int(bid)
+
+            return solve_line
+
+        return [
+            RankSolver(get_hand_solver(module.Hand)),
+            RankSolver(get_hand_solver(module.JokerHand)),
+        ]
+    if day_name == "day09":
+        module = importlib.import_module("day09.prediction")
+        app = module.App(file_path)
+        return [
+            SumSolver(lambda line: app.get_forward_prediction(scan_ints(line))),
+            SumSolver(lambda line: app.get_backward_prediction(scan_ints(line))),
+        ]
+    if day_name == "day12":
+        module = importlib.import_module("day12.springs")
+        app = module.App(file_path, module.SpringParser)
+
+        def parse(line):
+            return next(module.SpringParser([line.encode()]).iter_records())
+
+        def get_folded_quantity(line):
+            springs, sizes = parse(line)
+            return app.get_arrangement_quantity(("?".join([springs] * 5), sizes * 5))
+
+        return [
+            SumSolver(lambda line: app.get_arrangement_quantity(parse(line))),
+            SumSolver(get_folded_quantity),
+        ]
+    raise ValueError(f"{day_name} has no watch mode")
+
+
+class Watcher:
+    def __init__(self, day_name, file_path, interval=0.5):
+        self.day_name = day_name
+        self.file_path = file_path
+        self.interval = interval
+        self.solvers = get_solvers(day_name, file_path)
+        self.modified = None
+
+    def update(self):
+        lines = [line for line in read_lines(self.file_path) if line]
+        solved = [solver.solved for solver in self.solvers]
+        start = time.perf_counter()
+        answers = [solver.update(lines) for solver in self.solvers]
+        seconds = time.perf_counter() - start
+        solved = [solver.solved - qty for solver, qty in zip(self.solvers, solved)]
+        return answers, solved, len(lines), seconds
+
+    def is_modified(self):
+        try:
+            modified = os.stat(self.file_path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if modified == self.modified:
+            return False
+        self.modified = modified
+        return True
+
+    def run(self):
+        while True:
+            if self.is_modified():
+                answers, solved, qty, seconds = self.update()
+                print(
+                    f"{self.day_name}  {'  '.join(str(answer) for answer in answers)}"
+                    f"  (solved {'/'.join(map(str, solved))} of {qty} lines"
+                    f" in {seconds:.3f} s)",
+                    flush=True,
+                )
+            time.sleep(self.interval)
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("day", help="day to watch, e.g. 12 or day12")
+    parser.add_argument(
+        "input", nargs="?", help="input file, the day's input.txt by default"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.5, help="seconds between polls"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    day = get_days([arguments.day])[0]
+    file_path = arguments.input or day.get_input_path()
+    watcher = Watcher(day.name, file_path, arguments.interval)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass